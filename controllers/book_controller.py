@@ -1,4 +1,4 @@
-from services.book_service import BookService
+from services.book_service import BookService, get_shared_book_service
 from services.inventory_service import InventoryService
 from services.report_service import ReportService
 from models.Books import Book
@@ -20,8 +20,9 @@ class BookController:
         - Keep global reports in sync after catalog changes (best-effort).
         - Expose search and algorithmic features implemented in services.
     """
-    def __init__(self):
-        self.service = BookService()
+    def __init__(self, service: BookService = None):
+        # Shared by default so memoized analytics survive closing a window
+        self.service = service or get_shared_book_service()
         self.report_service = ReportService()
 
     def create_book(self, data):
@@ -213,6 +214,29 @@ class BookController:
         """
         return self.service.get_all_authors()
 
+    def get_author_summary(self, author: str):
+        """Get the precomputed aggregates of one author.
+        
+        Parameters:
+        - author: string with the author name
+        
+        Returns:
+        - dict with 'author', 'count', 'total_value', 'total_weight',
+          'average_weight' and 'book_ids'
+        """
+        return self.service.get_author_summary(author)
+
+    def get_books_by_author(self, author: str):
+        """Get the books of an author in catalog order (no catalog scan).
+        
+        Parameters:
+        - author: string with the author name
+        
+        Returns:
+        - List[Book]
+        """
+        return self.service.get_books_by_author(author)
+
     def calculate_average_weight_by_author(self, author: str, debug: bool = False):
         """Calculate average weight of all books by a given author.
         
@@ -229,20 +253,101 @@ class BookController:
 
     # -------------------- Brute Force Algorithm --------------------
 
-    def find_risky_book_combinations(self, threshold: float = 8.0):
-        """Find all combinations of 4 books that exceed weight threshold.
+    def iter_risky_book_combinations(self, threshold: float = 8.0, cancel=None, progress=None, limit=None,
+                                     trace=None):
+        """Yield risky 4-book combinations one by one (descending-position order).
 
-        This exposes the brute force algorithm through the controller layer.
-        The algorithm exhaustively searches all possible combinations of 4 books
-        from the catalog to identify risky shelf configurations.
+        Consumes the streaming generator of the service and builds each result
+        dictionary only when it is requested, so the UI can display results
+        incrementally and stop at any time.
 
         Args:
             threshold: Maximum weight threshold in Kg (default 8.0 - shelf capacity).
+            cancel: Optional token with is_set() (e.g. threading.Event).
+            progress: Optional callable receiving the completed fraction (0.0-1.0).
+            limit: Maximum number of combinations to yield (None = all).
+            trace: Optional step-trace hook (e.g. a tracing.TraceRecorder).
+
+        Yields:
+            Dictionaries with 'books', 'total_weight' and 'excess'.
+        """
+        for indices in self.service.iter_risky_book_combinations(threshold, cancel, progress, limit, trace):
+            yield self.service.describe_risky_combination(indices, threshold)
+
+    def find_risky_book_combinations(self, threshold: float = 8.0, limit=None):
+        """Find the combinations of 4 books that exceed weight threshold.
+
+        This exposes the risky combination search through the controller layer,
+        in the reference brute-force order. Results are memoized by the
+        service until the catalog changes.
+
+        Args:
+            threshold: Maximum weight threshold in Kg (default 8.0 - shelf capacity).
+            limit: Maximum number of combinations to return (None = all).
 
         Returns:
             List of dictionaries containing risky combinations.
         """
-        return self.service.find_risky_book_combinations(threshold)
+        return self.service.list_risky_book_combinations(threshold, limit)
+
+    def find_top_risky_book_combinations(self, k: int = 10, threshold: float = 8.0):
+        """Find the k heaviest combinations of 4 books that exceed the threshold.
+
+        Args:
+            k: Number of combinations wanted (default 10).
+            threshold: Maximum weight threshold in Kg (default 8.0).
+
+        Returns:
+            Up to k dictionaries with 'books', 'total_weight' and 'excess',
+            heaviest first.
+        """
+        return self.service.find_top_risky_book_combinations(k, threshold)
+
+    def find_risky_book_combinations_anytime(self, threshold: float = 8.0, time_budget=None, frontier=None):
+        """Find risky 4-book combinations within a time budget, resumable.
+
+        Args:
+            threshold: Maximum weight threshold in Kg (default 8.0).
+            time_budget: Maximum time in seconds (None = run to completion).
+            frontier: Frontier of a previous interrupted result to continue.
+
+        Returns:
+            Dictionary with 'combinations', 'complete', 'coverage' and 'frontier'.
+        """
+        return self.service.find_risky_book_combinations_anytime(threshold, time_budget, frontier)
+
+    def open_risky_result_store(self, threshold: float = 8.0, cancel=None, progress=None, limit=None,
+                                trace=None):
+        """Spill the risky combinations to a memory-mapped store for paging.
+
+        Args:
+            threshold: Maximum weight threshold in Kg (default 8.0).
+            cancel: Optional token with is_set() (e.g. threading.Event).
+            progress: Optional callable receiving the completed fraction (0.0-1.0).
+            limit: Maximum number of combinations to store (None = all).
+            trace: Optional step-trace hook (e.g. a tracing.TraceRecorder).
+
+        Returns:
+            RiskyResultStore with count, complete and page(offset, limit);
+            close() it when done.
+        """
+        return self.service.open_risky_result_store(threshold, cancel, progress, limit, trace)
+
+    def get_risky_result_page(self, store, offset: int, limit: int):
+        """Get one page of a risky result store as combination dictionaries.
+
+        Args:
+            store: Store returned by open_risky_result_store().
+            offset: Position of the first combination in the store.
+            limit: Maximum number of combinations in the page.
+
+        Returns:
+            List of dictionaries with 'books', 'total_weight' and 'excess'.
+        """
+        return [
+            self.service.describe_risky_combination(record[:4], store.threshold)
+            for record in store.page(offset, limit)
+        ]
 
     def count_possible_combinations(self) -> int:
         """Get the total number of 4-book combinations that will be explored.
@@ -254,6 +359,54 @@ class BookController:
         """
         return self.service.count_possible_combinations()
 
+    def count_risky_book_combinations(self, threshold: float = 8.0) -> int:
+        """Count the risky 4-book combinations without enumerating them.
+
+        Args:
+            threshold: Maximum weight threshold in Kg (default 8.0).
+
+        Returns:
+            Number of combinations whose weight exceeds the threshold.
+        """
+        return self.service.count_risky_book_combinations(threshold)
+
+    def get_risky_combination_histogram(self, threshold: float = 8.0, bin_width: float = 0.5,
+                                        time_budget=None, cancel=None):
+        """Get the excess-weight histogram of the risky 4-book combinations.
+
+        Args:
+            threshold: Maximum weight threshold in Kg (default 8.0).
+            bin_width: Width of each excess bin in Kg (default 0.5).
+            time_budget: Optional seconds after which no more bins are counted.
+            cancel: Optional token with is_set() (e.g. threading.Event).
+
+        Returns:
+            Dictionary with 'total_combinations', 'risky_count', 'bins' and
+            'complete'.
+        """
+        return self.service.get_risky_combination_histogram(threshold, bin_width,
+                                                            time_budget=time_budget, cancel=cancel)
+
+    def estimate_risky_book_combinations(self, threshold: float = 8.0, precision=0.005,
+                                         confidence: float = 0.95, seed=None, relative_precision=None):
+        """Estimate the share of risky 4-book combinations by random sampling.
+
+        Args:
+            threshold: Maximum weight threshold in Kg (default 8.0).
+            precision: Target absolute half-width of the confidence interval
+                (None = no absolute target).
+            confidence: Confidence level of the interval (default 0.95).
+            seed: Random seed for a reproducible estimate (None = random).
+            relative_precision: Target half-width relative to the estimate
+                (e.g. 0.1 = ±10%).
+
+        Returns:
+            Dictionary with 'fraction', 'low', 'high', 'estimated_count',
+            'count_low', 'count_high', 'samples' and 'converged'.
+        """
+        return self.service.estimate_risky_book_combinations(threshold, precision, confidence, seed,
+                                                             relative_precision)
+
     # -------------------- Search Methods (Linear Search Algorithm) --------------------
 
     def search_books_by_title(self, query: str):
@@ -288,7 +441,8 @@ class BookController:
 
     # -------------------- Backtracking Algorithm --------------------
 
-    def find_optimal_shelf_selection(self, max_capacity: float = 8.0):
+    def find_optimal_shelf_selection(self, max_capacity: float = 8.0, method: str = 'backtracking',
+                                     time_budget=None, frontier=None, trace=None):
         """Find the optimal combination of books that maximizes value without exceeding weight capacity.
 
         This exposes the backtracking algorithm through the controller layer.
@@ -298,9 +452,73 @@ class BookController:
 
         Args:
             max_capacity: Maximum weight capacity in Kg (default 8.0 - shelf capacity).
+            method: 'backtracking' (default), 'meet_in_the_middle',
+                'branch_and_bound', 'dp' (dynamic programming) or 'auto'
+                (chosen from the catalog size).
+            time_budget: Optional maximum search time in seconds
+                (backtracking and branch_and_bound).
+            frontier: Frontier of an interrupted branch_and_bound result to resume.
+            trace: Optional step-trace hook (e.g. a tracing.TraceRecorder).
 
         Returns:
             Dictionary containing the optimal solution with max_value, total_weight,
-            selected books, and their indices.
+            selected books, and their indices (plus 'complete' and 'gap' when
+            a time budget is given).
+
+        Raises:
+            ValueError: If method is unknown or the frontier does not match.
+        """
+        return self.service.find_optimal_shelf_selection(max_capacity, method, time_budget=time_budget,
+                                                         frontier=frontier, trace=trace)
+
+    def find_constrained_shelf_selection(self, max_capacity: float = 8.0, max_per_author=None,
+                                         author_limits=None, must_include=None, must_exclude=None):
+        """Find the optimal shelf selection under curator constraints.
+
+        Args:
+            max_capacity: Maximum weight capacity in Kg (default 8.0).
+            max_per_author: Maximum number of books per author (None = no limit).
+            author_limits: Dict {author: limit} overriding max_per_author.
+            must_include: Book ids or ISBNs that must be selected.
+            must_exclude: Book ids or ISBNs that must not be selected.
+
+        Returns:
+            Dictionary with max_value, total_weight, selected books and indices.
+
+        Raises:
+            ValueError: If the constraints cannot be satisfied.
+        """
+        return self.service.find_constrained_shelf_selection(
+            max_capacity, max_per_author, author_limits, must_include, must_exclude
+        )
+
+    def find_optimal_shelf_copies(self, max_capacity: float = 8.0):
+        """Find how many copies of each ISBN maximize the shelf value.
+
+        Bounded knapsack over the inventory groups (ISBN, weight, price,
+        available copies) instead of one 0/1 item per Book record.
+
+        Args:
+            max_capacity: Maximum weight capacity in Kg (default 8.0).
+
+        Returns:
+            Dictionary with max_value, total_weight, total_copies and the
+            copies chosen per ISBN in 'groups'.
+        """
+        inv_service = InventoryService()
+        return inv_service.find_optimal_shelf_copies(max_capacity)
+
+    def get_shelf_capacity_sweep(self, max_capacity: float = 16.0):
+        """Optimal shelf selections for every capacity up to `max_capacity`.
+
+        Solves the shelf knapsack once (dynamic programming) and caches it,
+        so comparing capacities does not re-run the solver.
+
+        Args:
+            max_capacity: Largest capacity to be queried in Kg (default 16.0).
+
+        Returns:
+            ShelfCapacitySweep: value_at(capacity) and solution_at(capacity)
+            (same dictionary as find_optimal_shelf_selection).
         """
-        return self.service.find_optimal_shelf_selection(max_capacity)
+        return self.service.get_shelf_capacity_sweep(max_capacity)
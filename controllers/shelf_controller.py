@@ -843,6 +843,41 @@ class ShelfController:
 		# load into service memory
 		self.service._load_shelves()
 
+	def optimize_assignment(self, books: List[Book], heuristic: str = 'best_fit', apply: bool = True) -> dict:
+		"""Assign unplaced books across all shelves, maximizing the value placed.
+		
+		Plans the placement with the multi-shelf optimizer (first/best-fit
+		decreasing heuristic plus bounded local search) and, when `apply` is
+		True, applies it with a single save.
+		
+		Args:
+			books (List[Book]): Candidate books (e.g. the whole catalog); books
+				already on a shelf keep their placement.
+			heuristic (str): 'best_fit' (default) or 'first_fit'.
+			apply (bool): Apply the plan (True) or only return it (False).
+		
+		Returns:
+			dict: Plan from service.plan_assignment plus 'applied', the number
+				of books actually placed (0 when apply is False).
+		
+		Raises:
+			ValueError: If the heuristic is unknown.
+		
+		Example:
+			>>> controller = ShelfController()
+			>>> plan = controller.optimize_assignment(BookController().get_all_books())
+			>>> plan['applied'], len(plan['unplaced'])
+			(12, 3)
+		
+		See Also:
+			- service.plan_assignment: Planning
+			- service.apply_assignment: Batched application
+		"""
+		plan = self.service.plan_assignment(books, heuristic)
+		# service persists changes once for the whole batch
+		plan['applied'] = self.service.apply_assignment(plan) if apply else 0
+		return plan
+
 	def delete_shelf(self, id: str) -> bool:
 		"""Delete a shelf from the system by its identifier.
 		
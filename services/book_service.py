@@ -1,16 +1,44 @@
 import os
 import json
-from typing import List, Optional, Dict, Any
+import heapq
+import tempfile
+import threading
+from typing import List, Optional, Dict, Any, Iterator, Tuple
 
 from models.Books import Book
 from repositories.book_repository import BookRepository
 from utils.validators import BookValidator, ValidationError
 from utils.logger import LibraryLogger
 from utils.config import FilePaths
+from utils.structures.lru_cache import LRUCache
 
 # Configure logger
 logger = LibraryLogger.get_logger(__name__)
 
+# Maximum number of memoized analytics results kept per BookService
+RESULT_CACHE_SIZE = 32
+
+# Cache-miss marker (None can be a valid cached result)
+_MISSING = object()
+
+
+_shared_service = None
+
+
+def get_shared_book_service() -> 'BookService':
+    """Return the process-wide BookService used by the controllers.
+
+    Every report window creates its own BookController; sharing one service
+    lets them reuse its memoized analytics (re-opening a report hits the
+    cache). The catalog is re-read first if the books file changed on disk.
+    """
+    global _shared_service
+    if _shared_service is None:
+        _shared_service = BookService()
+    else:
+        _shared_service.refresh_if_changed()
+    return _shared_service
+
 
 class BookService:
     """Service for basic management of Book objects (no inventory, no algorithms).
@@ -30,6 +58,22 @@ class BookService:
         """
         self.repository = repository or BookRepository()
         self.books: List[Book] = []
+        # Memoized analytics results, keyed on (catalog version, method, parameters)
+        self._catalog_version = 0
+        self._results = LRUCache(RESULT_CACHE_SIZE)
+        self._shelf_sweep = None
+        # (catalog version, threshold, limit, path) of the last complete risky result store
+        self._risky_store = None
+        # Store files written by this service that are not deleted yet
+        self._store_files = set()
+        # Guards the two attributes above and version changes: stores are
+        # written on worker threads while the UI thread edits the catalog
+        self._store_lock = threading.RLock()
+        # Per-author aggregate table: author -> {'books', 'total_value', 'total_weight'}
+        self._authors: Dict[str, Dict[str, Any]] = {}
+        self._sorted_authors: Optional[List[str]] = None
+        # (mtime_ns, size) of the books file when this service last read or wrote it
+        self._file_signature = None
         self._load_books()
 
     def generate_next_id(self, prefix: str = 'B', min_width: int = 3) -> str:
@@ -73,6 +117,9 @@ class BookService:
         - Exception: for IO errors
         """
         self.books = self.repository.load_all()
+        self._file_signature = self._read_file_signature()
+        self._rebuild_author_table()
+        self._invalidate_results()
 
     def _save_books(self) -> None:
         """Persist books using repository.
@@ -80,7 +127,146 @@ class BookService:
         Raises:
         - Exception: for IO errors
         """
+        # Every catalog mutation ends here: cached analytics are now stale
+        self._invalidate_results()
         self.repository.save_all(self.books)
+        self._file_signature = self._read_file_signature()
+
+    def _read_file_signature(self):
+        """(mtime_ns, size) of the books file, or None if it cannot be read."""
+        try:
+            stat = os.stat(self.repository.file_path)
+        except (OSError, AttributeError):
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def refresh_if_changed(self) -> bool:
+        """Reload the catalog if the books file changed since this service last used it.
+
+        Another BookService (e.g. the one inside LoanService) may have saved
+        the file. Reloading starts a new catalog version, so memoized results
+        are dropped only when the catalog really changed.
+
+        Returns:
+        - True if the catalog was reloaded.
+        """
+        signature = self._read_file_signature()
+        if signature is None or signature == self._file_signature:
+            return False
+        self._load_books()
+        return True
+
+    # -------------------- Per-author aggregate table --------------------
+    def _rebuild_author_table(self) -> None:
+        """Build the author -> aggregate table from scratch (O(n))."""
+        self._authors = {}
+        for book in self.books:
+            entry = self._authors.setdefault(book.get_author(), {'books': []})
+            entry['books'].append(book)
+        for author in self._authors:
+            self._refresh_author(author)
+        self._sorted_authors = None
+
+    def _refresh_author(self, author: str) -> None:
+        """Recompute the totals of one author from its k books (O(k)); drop it if empty."""
+        entry = self._authors.get(author)
+        if entry is None:
+            return
+        if not entry['books']:
+            del self._authors[author]
+            self._sorted_authors = None
+            return
+        entry['total_value'] = sum(book.get_price() for book in entry['books'])
+        entry['total_weight'] = sum(book.get_weight() for book in entry['books'])
+
+    def _index_book(self, book: Book) -> None:
+        """Add a book appended at the end of the catalog to the author table."""
+        author = book.get_author()
+        if author not in self._authors:
+            self._authors[author] = {'books': []}
+            self._sorted_authors = None
+        self._authors[author]['books'].append(book)
+        self._refresh_author(author)
+
+    def _unindex_book(self, book: Book, author: Optional[str] = None) -> None:
+        """Remove a book from the author table (`author`: the one it was indexed under)."""
+        author = book.get_author() if author is None else author
+        entry = self._authors.get(author)
+        if entry is None:
+            return
+        entry['books'] = [b for b in entry['books'] if b is not book]
+        self._refresh_author(author)
+
+    def _move_book_author(self, book: Book, old_author: str) -> None:
+        """Re-file a book whose author changed, keeping catalog order in the new entry."""
+        self._unindex_book(book, old_author)
+        author = book.get_author()
+        if author not in self._authors:
+            self._sorted_authors = None
+        # Rare path: one catalog scan to place the book at its catalog position
+        self._authors[author] = {'books': [b for b in self.books if b.get_author() == author]}
+        self._refresh_author(author)
+
+    def get_author_summary(self, author: str) -> Dict[str, Any]:
+        """Aggregates of one author from the author table, in O(k) for k books.
+
+        Parameters:
+        - author: string with the author name (case-sensitive)
+
+        Returns:
+        - dict with 'author', 'count', 'total_value', 'total_weight',
+          'average_weight' and 'book_ids' (catalog order); zeros and an
+          empty list for an unknown author
+        """
+        entry = self._authors.get(author)
+        if entry is None:
+            return {'author': author, 'count': 0, 'total_value': 0, 'total_weight': 0.0,
+                    'average_weight': 0.0, 'book_ids': []}
+        count = len(entry['books'])
+        return {
+            'author': author,
+            'count': count,
+            'total_value': entry['total_value'],
+            'total_weight': entry['total_weight'],
+            'average_weight': entry['total_weight'] / count,
+            'book_ids': [book.get_id() for book in entry['books']]
+        }
+
+    def get_books_by_author(self, author: str) -> List[Book]:
+        """Books of `author` in catalog order, from the author table (O(k))."""
+        entry = self._authors.get(author)
+        return list(entry['books']) if entry is not None else []
+
+    # -------------------- Result memoization --------------------
+    def _invalidate_results(self) -> None:
+        """Start a new catalog version and drop every memoized result."""
+        with self._store_lock:
+            self._catalog_version += 1
+            self._results.clear()
+            self._shelf_sweep = None
+            self._discard_risky_store()
+
+    def _memoized(self, name: str, params: tuple, compute):
+        """Return the cached result of `name` for `params`, computing it on a miss.
+
+        Results are keyed on (catalog version, name, params) and evicted LRU.
+        Cached results are shared between callers and must not be modified.
+        """
+        key = (self._catalog_version, name, params)
+        result = self._results.get(key, _MISSING)
+        if result is _MISSING:
+            result = compute()
+            self._results.put(key, result)
+        return result
+
+    def get_result_cache_stats(self) -> Dict[str, int]:
+        """Catalog version and hit/miss counters of the analytics result cache."""
+        return {
+            'catalog_version': self._catalog_version,
+            'entries': self._results.size(),
+            'hits': self._results.hits,
+            'misses': self._results.misses
+        }
 
     # -------------------- CRUD --------------------
     def add_book(self, book: Book) -> None:
@@ -116,6 +302,7 @@ class BookService:
 
         # Add the book and persist
         self.books.append(book)
+        self._index_book(book)
         self._save_books()
         logger.info(f"Book added: id={book.get_id()}, ISBN={book.get_ISBNCode()}, title={book.get_title()}")
 
@@ -176,6 +363,7 @@ class BookService:
         # capture previous identifying fields to propagate changes to inventory
         old_id = book.get_id()
         old_isbn = book.get_ISBNCode()
+        old_author = book.get_author()
 
         for key, value in new_data.items():
             if key not in setters:
@@ -185,6 +373,12 @@ class BookService:
                 value = bool(value)
             setters[key](value)
 
+        # Keep the author table in sync (O(k) unless the author changed)
+        if book.get_author() != old_author:
+            self._move_book_author(book, old_author)
+        else:
+            self._refresh_author(old_author)
+
         # persist books.json
         self._save_books()
 
@@ -304,6 +498,7 @@ class BookService:
             raise ValueError("Cannot delete a book that is currently borrowed")
 
         self.books = [b for b in self.books if b.get_id() != id]
+        self._unindex_book(book)
         self._save_books()
         
         # Synchronize with inventory - delete the book
@@ -403,6 +598,7 @@ class BookService:
             # Rollback: remove the book from catalog since inventory sync failed
             try:
                 self.books = [b for b in self.books if b.get_id() != new_id]
+                self._unindex_book(new_book)
                 self._save_books()
                 logger.info(f"Rolled back book {new_id} from catalog due to inventory sync failure")
             except Exception as rollback_error:
@@ -438,32 +634,36 @@ class BookService:
         >>> print(total)
         30000
         
-        Complexity: O(n) time and O(n) call-stack depth where n is number of books.
+        Complexity: O(k) time for the k books of the author (taken from the author
+        table) and O(1) call-stack depth (recursion simulated iteratively);
+        O(1) when memoized for the current catalog version.
         """
         from utils.recursion.stack_recursion import total_value_by_author
         
-        # Convert Book objects to dict format expected by the recursion function
-        books_data = []
-        for book in self.books:
-            books_data.append({
-                'author': book.get_author(),
-                'price': book.get_price()
-            })
+        def compute():
+            # Only the author's books (from the author table): the others add 0
+            books_data = []
+            for book in self.get_books_by_author(author):
+                books_data.append({
+                    'author': book.get_author(),
+                    'price': book.get_price()
+                })
+            return total_value_by_author(books_data, author)
         
-        return total_value_by_author(books_data, author)
+        return self._memoized('total_value_by_author', (author,), compute)
 
     def get_all_authors(self) -> List[str]:
         """Get a sorted list of unique authors in the catalog.
         
         Returns:
         - List[str] of unique author names, sorted alphabetically
+
+        The sorted list is kept until the set of authors changes.
         """
-        authors = set()
-        for book in self.books:
-            author = book.get_author()
-            if author:  # Skip empty authors
-                authors.add(author)
-        return sorted(authors)
+        if self._sorted_authors is None:
+            # Skip empty authors
+            self._sorted_authors = sorted(author for author in self._authors if author)
+        return list(self._sorted_authors)
 
     def calculate_average_weight_by_author(self, author: str, debug: bool = False) -> float:
         """Calculate average weight of all books by a given author using tail recursion.
@@ -486,27 +686,35 @@ class BookService:
         >>> print(avg)
         1.1
         
-        Complexity: O(n) time and O(n) call-stack depth where n is number of books.
+        Complexity: O(k) time for the k books of the author (taken from the author
+        table) and O(1) call-stack depth (recursion simulated iteratively);
+        O(1) when memoized for the current catalog version (debug calls always recompute).
         """
         from utils.recursion.queue_recursion import avg_weight_by_author
         
-        # Convert Book objects to dict format expected by the recursion function
-        books_data = []
-        for book in self.books:
-            books_data.append({
-                'id': book.get_id(),
-                'ISBNCode': book.get_ISBNCode(),
-                'title': book.get_title(),
-                'author': book.get_author(),
-                'weight': book.get_weight(),
-                'price': book.get_price()
-            })
+        def compute():
+            # Only the author's books (from the author table): the others are skipped
+            books_data = []
+            for book in self.get_books_by_author(author):
+                books_data.append({
+                    'id': book.get_id(),
+                    'ISBNCode': book.get_ISBNCode(),
+                    'title': book.get_title(),
+                    'author': book.get_author(),
+                    'weight': book.get_weight(),
+                    'price': book.get_price()
+                })
+            return avg_weight_by_author(books_data, author, debug=debug)
         
-        return avg_weight_by_author(books_data, author, debug=debug)
+        if debug:
+            # The recursion trace is the point of a debug call
+            return compute()
+        return self._memoized('average_weight_by_author', (author,), compute)
 
     # -------------------- Brute Force Algorithm --------------------
 
-    def find_risky_book_combinations(self, threshold: float = 8.0) -> List[dict]:
+    def find_risky_book_combinations(self, threshold: float = 8.0, brute_force: bool = False,
+                                     workers: Optional[int] = None) -> List[dict]:
         """Find all combinations of 4 books that exceed weight threshold using brute force.
 
         This method implements the project requirement for a brute force algorithm
@@ -516,8 +724,17 @@ class BookService:
         The algorithm uses all books from the inventory to demonstrate the brute
         force pattern on the complete book catalog.
 
+        By default the pruned engine (risky_combinations.find_risky_combinations_pruned)
+        is used: it returns exactly the brute-force result but skips subtrees
+        that cannot exceed the threshold. Pass brute_force=True to run the
+        exhaustive reference implementation instead; with workers > 1 the
+        exhaustive scan is sharded across processes
+        (brute_force_parallel.find_risky_combinations_parallel, same result).
+
         Args:
             threshold: Maximum weight threshold in Kg (default 8.0 - shelf capacity).
+            brute_force: Use the exhaustive reference algorithm (default False).
+            workers: Worker processes for the exhaustive scan (None/1 = single process).
 
         Returns:
             List of dictionaries, each containing:
@@ -531,24 +748,93 @@ class BookService:
             >>> print(f"Found {len(risky)} risky combinations")
 
         Complexity:
-            Time: O(n^4) where n is the number of books (exhaustive search)
+            Time: O(n^4) with brute_force=True (exhaustive search);
+                  O(n log n + k log k) with the pruned engine
             Space: O(k) where k is the number of risky combinations found
         """
         from utils.algorithms.brute_force import find_risky_combinations
+        from utils.algorithms.risky_combinations import find_risky_combinations_pruned
+
+        def compute():
+            # Convert Book objects to dict format for the algorithm
+            books_data = []
+            for book in self.books:
+                books_data.append({
+                    'id': book.get_id(),
+                    'title': book.get_title(),
+                    'author': book.get_author(),
+                    'weight': book.get_weight(),
+                    'price': book.get_price()
+                })
+
+            if brute_force:
+                if workers is not None and workers > 1:
+                    from utils.algorithms.brute_force_parallel import find_risky_combinations_parallel
+                    return find_risky_combinations_parallel(books_data, threshold, workers)
+                # Exhaustive reference algorithm
+                return find_risky_combinations(books_data, threshold)
+            return find_risky_combinations_pruned(books_data, threshold)
+
+        return self._memoized('risky_combinations', (threshold, brute_force, workers), compute)
+
+    def list_risky_book_combinations(self, threshold: float = 8.0, limit: Optional[int] = None) -> List[dict]:
+        """Risky 4-book combinations in reference order, memoized per catalog version.
+
+        Same order as find_risky_book_combinations() (the brute-force nested
+        loops). With a limit only the first `limit` combinations of that
+        order are kept while streaming (heapq.nsmallest over the index
+        tuples), so memory stays O(limit) even for millions of risky sets.
 
-        # Convert Book objects to dict format for the algorithm
-        books_data = []
-        for book in self.books:
-            books_data.append({
-                'id': book.get_id(),
-                'title': book.get_title(),
-                'author': book.get_author(),
-                'weight': book.get_weight(),
-                'price': book.get_price()
-            })
+        Args:
+            threshold: Maximum weight threshold in Kg (default 8.0).
+            limit: Maximum number of combinations to return (None = all).
 
-        # Apply brute force algorithm
-        return find_risky_combinations(books_data, threshold)
+        Returns:
+            List of dictionaries with 'books', 'total_weight' and 'excess'.
+        """
+        if limit is None:
+            return self.find_risky_book_combinations(threshold)
+
+        def compute():
+            first = heapq.nsmallest(limit, self.iter_risky_book_combinations(threshold))
+            return [self.describe_risky_combination(indices, threshold) for indices in first]
+
+        return self._memoized('risky_combinations_first', (threshold, limit), compute)
+
+    def find_top_risky_book_combinations(self, k: int = 10, threshold: float = 8.0) -> List[dict]:
+        """The `k` heaviest 4-book combinations exceeding the threshold.
+
+        Uses a best-first search over the sorted weights (see
+        risky_combinations.find_top_risky_combinations), so only about k
+        combinations are examined instead of every risky one. Memoized per
+        catalog version.
+
+        Args:
+            k: Number of combinations wanted (default 10).
+            threshold: Maximum weight threshold in Kg (default 8.0).
+
+        Returns:
+            Up to k dictionaries with 'books', 'total_weight' and 'excess',
+            heaviest first.
+
+        Raises:
+            ValueError: If k is negative.
+        """
+        from utils.algorithms.risky_combinations import find_top_risky_combinations
+
+        def compute():
+            books_data = [
+                {
+                    'id': book.get_id(),
+                    'title': book.get_title(),
+                    'author': book.get_author(),
+                    'weight': book.get_weight()
+                }
+                for book in self.books
+            ]
+            return find_top_risky_combinations(books_data, k, threshold)
+
+        return self._memoized('top_risky_combinations', (k, threshold), compute)
 
     def count_possible_combinations(self) -> int:
         """Calculate how many 4-book combinations exist in the catalog.
@@ -563,9 +849,270 @@ class BookService:
         num_books = len(self.books)
         return count_total_combinations(num_books)
 
+    def iter_risky_book_combinations(self, threshold: float = 8.0, cancel=None, progress=None,
+                                     limit: Optional[int] = None,
+                                     trace=None) -> Iterator[Tuple[int, int, int, int]]:
+        """Lazily yield risky 4-book combinations as compact index tuples.
+
+        Streaming variant of find_risky_book_combinations(): nothing is
+        materialized, each combination is a tuple of 4 ascending indices into
+        the catalog (self.books) and combinations come in descending-position
+        order (sets with the heaviest books first; totals are not sorted).
+        Use describe_risky_combination() to turn a tuple into the result dict.
+
+        Args:
+            threshold: Maximum weight threshold in Kg (default 8.0).
+            cancel: Optional token with is_set() (e.g. threading.Event); the
+                generator stops once it is set.
+            progress: Optional callable receiving the completed fraction
+                (0.0-1.0) of the outer loop.
+            limit: Maximum number of combinations to yield (None = all).
+            trace: Optional step-trace hook receiving the pruning events
+                (e.g. a tracing.TraceRecorder).
+
+        Yields:
+            Tuples (i, j, k, m) of catalog indices, i < j < k < m.
+        """
+        from utils.algorithms.risky_combinations import iter_risky_quadruples, parse_weights
+
+        weights = parse_weights(self._weight_data())
+        return iter_risky_quadruples(weights, threshold, cancel=cancel, progress=progress, limit=limit,
+                                     trace=trace)
+
+    def find_risky_book_combinations_anytime(self, threshold: float = 8.0, time_budget: Optional[float] = None,
+                                             frontier: Optional[dict] = None) -> dict:
+        """Find risky 4-book combinations within a time budget, resumable.
+
+        Args:
+            threshold: Maximum weight threshold in Kg (default 8.0).
+            time_budget: Maximum time in seconds (None = run to completion).
+            frontier: 'frontier' of a previous interrupted result to continue.
+
+        Returns:
+            Dictionary with 'combinations' (descending-position order, same dicts as
+            find_risky_book_combinations), 'complete', 'coverage' and
+            'frontier', see risky_combinations.find_risky_combinations_anytime.
+
+        Raises:
+            ValueError: If the frontier belongs to another catalog or threshold.
+        """
+        from utils.algorithms.risky_combinations import find_risky_combinations_anytime
+
+        books_data = [
+            {
+                'id': book.get_id(),
+                'title': book.get_title(),
+                'author': book.get_author(),
+                'weight': book.get_weight()
+            }
+            for book in self.books
+        ]
+        return find_risky_combinations_anytime(books_data, threshold, time_budget, frontier)
+
+    def open_risky_result_store(self, threshold: float = 8.0, cancel=None, progress=None,
+                                limit: Optional[int] = None, trace=None, path: Optional[str] = None):
+        """Write the risky combinations to a disk store and open it for paging.
+
+        The descending-position stream is spilled to a compact binary file (see
+        risky_store) and memory-mapped, so millions of combinations can be
+        browsed page by page with O(page) memory. A complete store is reused
+        while the catalog and threshold do not change, after checking its
+        header (threshold and number of books).
+
+        Every new store gets its own file in data/cache, so writing one never
+        replaces a file another window still has memory-mapped (which fails
+        on Windows). Files of earlier stores are deleted once nothing maps
+        them any more.
+
+        May run on a worker thread. If the catalog changes while the store
+        is written, the store is still returned (it describes the catalog
+        as it was when the call started) but it is neither cached nor kept
+        on disk.
+
+        Args:
+            threshold: Maximum weight threshold in Kg (default 8.0).
+            cancel: Optional token with is_set(); a cancelled store is
+                returned incomplete and never reused.
+            progress: Optional callable receiving the completed fraction.
+            limit: Maximum number of combinations to store (None = all).
+            trace: Optional step-trace hook (e.g. a tracing.TraceRecorder).
+            path: Store file (default: a new data/cache/risky_*.bin file).
+
+        Returns:
+            risky_store.RiskyResultStore; the caller must close() it. Its
+            indices refer to self.books (see describe_risky_combination).
+        """
+        from utils.algorithms.risky_combinations import parse_weights
+        from utils.algorithms.risky_store import RiskyResultStore, write_risky_store
+
+        with self._store_lock:
+            version = self._catalog_version
+            cached = self._risky_store
+            if (cached is not None and cached[:3] == (version, threshold, limit)
+                    and (path is None or cached[3] == path) and os.path.exists(cached[3])):
+                store = RiskyResultStore(cached[3])
+                if store.threshold == threshold and store.num_books == len(self.books):
+                    return store
+                store.close()
+            self._discard_risky_store()
+            weights = parse_weights(self._weight_data())
+
+        owned = path is None
+        if owned:
+            cache_dir = FilePaths.get_custom_path('', 'cache')
+            os.makedirs(cache_dir, exist_ok=True)
+            handle, path = tempfile.mkstemp(prefix='risky_', suffix='.bin', dir=cache_dir)
+            os.close(handle)
+        else:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        try:
+            write_risky_store(path, weights, threshold,
+                              cancel=cancel, progress=progress, limit=limit, trace=trace)
+            store = RiskyResultStore(path)
+        except BaseException:
+            if owned:
+                self._remove_store_file(path)
+            raise
+
+        with self._store_lock:
+            if self._catalog_version != version:
+                # Written for an older catalog: never reused, never left behind
+                if owned:
+                    self._remove_store_file(path)
+            else:
+                if owned:
+                    self._store_files.add(path)
+                if store.complete or (limit is not None and store.count >= limit):
+                    self._risky_store = (version, threshold, limit, path)
+        return store
+
+    def _discard_risky_store(self) -> None:
+        """Forget the cached risky store and delete the store files this service wrote.
+
+        A file still mapped by a window cannot be deleted on Windows; it is
+        retried on the next call. Paths passed explicitly are never deleted.
+        """
+        with self._store_lock:
+            self._risky_store = None
+            for path in list(self._store_files):
+                self._store_files.discard(path)
+                self._remove_store_file(path)
+
+    def _remove_store_file(self, path: str) -> None:
+        """Delete a store file this service wrote, or keep it for a later retry."""
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError:
+            with self._store_lock:
+                self._store_files.add(path)
+
+    def describe_risky_combination(self, indices: Tuple[int, int, int, int], threshold: float = 8.0) -> dict:
+        """Build the result dict of find_risky_book_combinations() for one index tuple.
+
+        Args:
+            indices: Tuple of 4 catalog indices (from iter_risky_book_combinations).
+            threshold: Threshold used for the 'excess' field.
+
+        Returns:
+            Dictionary with 'books', 'total_weight' and 'excess'.
+        """
+        from utils.algorithms.risky_combinations import build_combination, parse_weights
+
+        books_data = [
+            {
+                'id': book.get_id(),
+                'title': book.get_title(),
+                'author': book.get_author(),
+                'weight': book.get_weight()
+            }
+            for book in (self.books[i] for i in indices)
+        ]
+        return build_combination(books_data, parse_weights(books_data), (0, 1, 2, 3), threshold)
+
+    def _weight_data(self) -> List[dict]:
+        """Minimal dict view of the catalog for the weight-counting algorithms."""
+        return [{'id': book.get_id(), 'weight': book.get_weight()} for book in self.books]
+
+    def count_risky_book_combinations(self, threshold: float = 8.0) -> int:
+        """Count the 4-book combinations exceeding `threshold` without listing them.
+
+        Uses sorted pair sums and bisect (O(n^2 log n)), so exact totals are
+        available for catalogs of thousands of books where enumerating the
+        combinations is infeasible.
+
+        Args:
+            threshold: Maximum weight threshold in Kg (default 8.0).
+
+        Returns:
+            Number of risky combinations.
+        """
+        from utils.algorithms.risky_combinations import count_risky_combinations
+
+        return count_risky_combinations(self._weight_data(), threshold)
+
+    def get_risky_combination_histogram(self, threshold: float = 8.0, bin_width: float = 0.5,
+                                        max_bins: int = 10, time_budget: Optional[float] = None,
+                                        cancel=None) -> dict:
+        """Histogram of the weight excess of risky 4-book combinations.
+
+        Args:
+            threshold: Maximum weight threshold in Kg (default 8.0).
+            bin_width: Width of each excess bin in Kg (default 0.5).
+            max_bins: Maximum number of bins; the last one is open-ended.
+            time_budget: Optional seconds after which the remaining
+                combinations go to the open-ended last bin.
+            cancel: Optional token with is_set(), checked like time_budget.
+
+        Returns:
+            Dictionary with 'total_combinations', 'risky_count', 'bins'
+            (list of {'from', 'to', 'count'}) and 'complete', see
+            risky_combinations.risky_excess_histogram.
+        """
+        from utils.algorithms.risky_combinations import risky_excess_histogram
+
+        return risky_excess_histogram(self._weight_data(), threshold, bin_width, max_bins,
+                                      time_budget=time_budget, cancel=cancel)
+
+    def estimate_risky_book_combinations(self, threshold: float = 8.0, precision: Optional[float] = 0.005,
+                                         confidence: float = 0.95, seed: Optional[int] = None,
+                                         relative_precision: Optional[float] = None) -> dict:
+        """Estimate the risky share of 4-book combinations by random sampling.
+
+        For catalogs where even the O(n^2 log n) exact count is too slow:
+        samples random combinations until the confidence interval is
+        narrower than the precision targets and enough risky combinations
+        were seen (see brute_force.estimate_risky_fraction).
+
+        Args:
+            threshold: Maximum weight threshold in Kg (default 8.0).
+            precision: Target half-width of the interval (0.005 = ±0.5
+                percentage points); None for no absolute target.
+            confidence: Confidence level of the interval (default 0.95).
+            seed: Random seed for a reproducible estimate (None = random).
+            relative_precision: Target half-width relative to the estimate
+                (0.1 = ±10%); use it when risky combinations are rare.
+
+        Returns:
+            Dictionary with 'fraction', 'low', 'high', 'estimated_count',
+            'count_low', 'count_high', 'total_combinations', 'samples',
+            'risky_samples', 'confidence' and 'converged'.
+
+        Raises:
+            ValueError: If a precision or the confidence is not between 0
+                and 1, or both precisions are None.
+        """
+        from utils.algorithms.brute_force import estimate_risky_fraction
+
+        return estimate_risky_fraction(self._weight_data(), threshold, precision, confidence, seed,
+                                       relative_precision=relative_precision)
+
     # -------------------- Backtracking Algorithm --------------------
 
-    def find_optimal_shelf_selection(self, max_capacity: float = 8.0) -> dict:
+    def find_optimal_shelf_selection(self, max_capacity: float = 8.0, method: str = 'backtracking',
+                                     resolution: float = 0.01, time_budget: Optional[float] = None,
+                                     frontier: Optional[dict] = None, trace=None) -> dict:
         """Find the optimal combination of books that maximizes value without exceeding weight capacity.
 
         This method implements the project requirement for a backtracking algorithm
@@ -574,10 +1121,26 @@ class BookService:
 
         The algorithm uses backtracking to explore all possible combinations efficiently,
         pruning branches that exceed the weight capacity. It demonstrates the complete
-        exploration and decision-making process.
+        exploration and decision-making process. For catalogs beyond ~30 books use
+        method='meet_in_the_middle' (exact, O(2^(n/2) * n), see knapsack_mitm),
+        method='branch_and_bound' (exact weights, fractional-bound pruning) or
+        method='dp', the dynamic-programming solver (O(n * W), see knapsack_dp).
+        method='auto' picks one from the number of candidate books
+        (knapsack_mitm.choose_shelf_method).
 
         Args:
             max_capacity: Maximum weight capacity in Kg (default 8.0 - shelf capacity).
+            method: 'backtracking' (exhaustive, default), 'meet_in_the_middle',
+                'branch_and_bound', 'dp' (dynamic programming) or 'auto'.
+            resolution: Weight discretization step in Kg for method='dp' (default 0.01).
+            time_budget: Optional maximum search time in seconds for
+                method='backtracking' or 'branch_and_bound'; the result then
+                reports 'complete' and the optimality 'gap'.
+            frontier: 'frontier' of an interrupted branch_and_bound result to
+                resume that search (same catalog and capacity).
+            trace: Optional step-trace hook (e.g. a tracing.TraceRecorder) for
+                method='backtracking' or 'branch_and_bound'. It only receives
+                events when the search runs, not for a memoized result.
 
         Returns:
             Dictionary containing:
@@ -585,6 +1148,17 @@ class BookService:
                 - 'total_weight': Total weight of selected books (in Kg)
                 - 'books': List of selected book dictionaries with full information
                 - 'indices': List of indices of selected books (for reference)
+                - 'search': Node counts, only for method='branch_and_bound'
+                  (see backtracking.solve_optimal_shelf_branch_and_bound)
+                - 'complete', 'gap' (and 'frontier' for branch_and_bound):
+                  anytime search status, see time_budget
+
+            Finished searches are memoized per catalog version and
+            parameters; the cached dictionary is shared, do not modify it.
+
+        Raises:
+            ValueError: If method is unknown, or a frontier is given for a
+                method other than branch_and_bound or does not match.
 
         Example:
             >>> service = BookService()
@@ -593,24 +1167,128 @@ class BookService:
             >>> print(f"Books selected: {len(result['books'])}")
 
         Complexity:
-            Time: O(2^n) worst case where n is the number of books (explores decision tree)
-            Space: O(n) for recursion depth + O(k) for solution where k is books selected
+            Time: O(2^n) worst case where n is the number of books (explores decision tree);
+                O(n * W) for method='dp' with W = max_capacity / resolution
+            Space: O(n) for the explicit search stack + O(k) for solution where k is books selected
         """
-        from utils.algorithms.backtracking import solve_optimal_shelf
+        from utils.algorithms.backtracking import solve_optimal_shelf, solve_optimal_shelf_branch_and_bound
+        from utils.algorithms.knapsack_dp import solve_optimal_shelf_dp
+        from utils.algorithms.knapsack_mitm import (
+            choose_shelf_method,
+            count_shelf_candidates,
+            solve_on_candidates,
+            solve_optimal_shelf_mitm,
+        )
 
-        # Convert Book objects to dict format for the algorithm
-        books_data = []
-        for book in self.books:
-            books_data.append({
+        solvers = {
+            'backtracking': lambda data: solve_optimal_shelf(data, max_capacity, trace=trace,
+                                                             time_budget=time_budget),
+            'meet_in_the_middle': lambda data: solve_optimal_shelf_mitm(data, max_capacity),
+            'branch_and_bound': lambda data: solve_optimal_shelf_branch_and_bound(
+                data, max_capacity, time_budget=time_budget, frontier=frontier, trace=trace),
+            'dp': lambda data: solve_optimal_shelf_dp(data, max_capacity, resolution),
+        }
+        if method != 'auto' and method not in solvers:
+            raise ValueError(f"Unknown shelf method '{method}'. Available: auto, {', '.join(solvers)}")
+
+        if frontier is not None and method != 'branch_and_bound':
+            raise ValueError("A search frontier can only be resumed with method='branch_and_bound'")
+
+        key = (self._catalog_version, 'optimal_shelf', (max_capacity, method, resolution, time_budget))
+        if frontier is None:
+            cached = self._results.get(key, _MISSING)
+            if cached is not _MISSING:
+                return cached
+
+        books_data = self._shelf_data()
+        if method == 'auto':
+            # The size bounds of the chooser count candidate books only
+            chosen = choose_shelf_method(count_shelf_candidates(books_data, max_capacity))
+            result = solve_on_candidates(books_data, max_capacity, solvers[chosen])
+        else:
+            result = solvers[method](books_data)
+        # Interrupted (anytime) searches are not final results: never cached
+        if frontier is None and result.get('complete', True):
+            self._results.put(key, result)
+        return result
+
+    def find_constrained_shelf_selection(self, max_capacity: float = 8.0, max_per_author: Optional[int] = None,
+                                         author_limits: Optional[Dict[str, int]] = None,
+                                         must_include: Optional[List[str]] = None,
+                                         must_exclude: Optional[List[str]] = None) -> dict:
+        """Find the optimal shelf selection under curator constraints.
+
+        Branch and bound with constraint propagation (see
+        backtracking.solve_optimal_shelf_constrained): infeasible branches are
+        pruned during the search instead of filtering unconstrained results.
+
+        Args:
+            max_capacity: Maximum weight capacity in Kg (default 8.0).
+            max_per_author: Maximum number of books per author (None = no limit).
+            author_limits: Per-author limits overriding max_per_author,
+                e.g. {'Gabriel García Márquez': 1} (case-insensitive).
+            must_include: Book ids or ISBNs that must be on the shelf.
+            must_exclude: Book ids or ISBNs that must not be on the shelf.
+
+        Returns:
+            Same dictionary as find_optimal_shelf_selection (with 'search'
+            node counts); each selected book also has 'group' (its author).
+
+        Raises:
+            ValueError: If an id/ISBN is unknown or the required books do not
+                fit the capacity or the author limits.
+        """
+        from utils.algorithms.backtracking import solve_optimal_shelf_constrained
+
+        return solve_optimal_shelf_constrained(
+            self._shelf_data(),
+            max_capacity,
+            max_per_group=max_per_author,
+            group_limits=author_limits,
+            group_key='author',
+            must_include=must_include or (),
+            must_exclude=must_exclude or (),
+        )
+
+    def get_shelf_capacity_sweep(self, max_capacity: float = 16.0, resolution: float = 0.01):
+        """Optimal shelf selections for every capacity up to `max_capacity`, solved once.
+
+        The DP sweep is cached and reused until the catalog changes (see
+        _invalidate_results), as long as the resolution is the same and it
+        covers `max_capacity`, so "what if the shelf held 6 / 10 / 12 Kg"
+        queries are answered without solving again.
+
+        Args:
+            max_capacity: Largest capacity to be queried in Kg (default 16.0).
+            resolution: Weight discretization step in Kg (default 0.01).
+
+        Returns:
+            knapsack_dp.ShelfCapacitySweep with value_at(), solution_at() and curve().
+        """
+        from utils.algorithms.knapsack_dp import ShelfCapacitySweep
+
+        cached = self._shelf_sweep
+        if (cached is not None and cached.resolution == resolution
+                and cached.max_capacity >= max_capacity):
+            return cached
+
+        sweep = ShelfCapacitySweep(self._shelf_data(), max_capacity, resolution)
+        self._shelf_sweep = sweep
+        return sweep
+
+    def _shelf_data(self) -> List[dict]:
+        """Convert Book objects to the dict format used by the shelf (knapsack) solvers."""
+        return [
+            {
                 'id': book.get_id(),
+                'isbn': book.get_ISBNCode(),
                 'title': book.get_title(),
                 'author': book.get_author(),
                 'weight': book.get_weight(),
                 'price': book.get_price()
-            })
-
-        # Apply backtracking algorithm
-        return solve_optimal_shelf(books_data, max_capacity)
+            }
+            for book in self.books
+        ]
 
 
 # Example:
@@ -1,12 +1,19 @@
 import os 
 import json
+from bisect import bisect_right
 from typing import List, Optional, Dict, Any, Tuple
 
 from models.Books import Book
 from models.inventory import Inventory
 from repositories.inventory_repository import InventoryRepository
-from utils.algorithms.AlgoritmosOrdenamiento import insercion_ordenada
-from utils.algorithms.AlgoritmosBusqueda import busqueda_lineal
+from utils.algorithms.AlgoritmosOrdenamiento import clave_isbn
+from utils.algorithms.sort_strategies import sort_by_keys
+from utils.algorithms.AlgoritmosBusqueda import (
+    busqueda_lineal,
+    busqueda_binaria_rango,
+    limite_inferior,
+    limite_superior,
+)
 from utils.config import FilePaths
 
 
@@ -29,9 +36,15 @@ class InventoryService:
           organized by ISBN. Each group contains all physical copies of books with
           the same ISBN. This is the primary working list for most operations.
           
-        - inventory_sorted (List[Inventory]): Sorted copy of inventory_general,
-          ordered by ISBN using the insertion sort algorithm (insercion_ordenada).
+        - inventory_sorted (List[Inventory]): Ordered index over the SAME
+          Inventory objects as inventory_general (no copies), ordered by ISBN
+          with the strategy named in SORT_STRATEGY (see sort_strategies).
           This sorted list enables efficient binary search operations.
+
+        - inventory_sorted_keys (List[tuple]): Canonical ISBN keys (see
+          AlgoritmosOrdenamiento.clave_isbn) parallel to inventory_sorted.
+          Rebuilt together with the sorted list so ISBN lookups can bisect
+          plain tuples instead of calling get_isbn() on every probe.
     
     Inventory Group Concept:
         Each Inventory object represents a logical group of books sharing the same ISBN:
@@ -45,13 +58,26 @@ class InventoryService:
     Synchronization:
         The service ensures both lists remain synchronized:
         1. All mutations (add/update/delete) are applied to inventory_general
-        2. synchronize_inventories() creates a sorted copy in inventory_sorted
-        3. Both lists are persisted to JSON files via the repository
+        2. On cold load, synchronize_inventories() builds the sorted index in
+           inventory_sorted (full sort)
+        3. Afterwards each mutation updates inventory_sorted incrementally:
+           bisect insert for a new group, positional delete for a removed
+           group, re-index only when a group's ISBN key changes (this is what
+           keeps the shared objects from corrupting the sorted order)
+        4. Both lists are persisted to JSON files via the repository
+
+        With check_consistency=True the sorted-view invariant is verified
+        after every mutation (see verify_sorted_invariant()); meant for tests.
     
     Attributes:
         repository (InventoryRepository): Handles persistence to JSON files
         inventory_general (List[Inventory]): Unsorted inventory groups
         inventory_sorted (List[Inventory]): Sorted inventory groups (by ISBN)
+        inventory_sorted_keys (List[tuple]): ISBN keys parallel to inventory_sorted
+        check_consistency (bool): Verify the sorted-view invariant after mutations
+        SORT_STRATEGY (str): Sort strategy for the cold rebuild ('auto' picks
+            Timsort for real inventories; 'insertion' keeps the teaching
+            algorithm)
     
     Example:
         >>> service = InventoryService()
@@ -62,7 +88,10 @@ class InventoryService:
         ...     print(f"{inv.get_isbn()}: {inv.get_stock()} available")
     """
 
-    def __init__(self, repository: InventoryRepository = None):
+    # Strategy used by synchronize_inventories() (see utils.algorithms.sort_strategies)
+    SORT_STRATEGY = 'auto'
+
+    def __init__(self, repository: InventoryRepository = None, check_consistency: bool = False):
         """Initialize the InventoryService with an optional repository.
 
         Creates a new inventory service instance, loads existing inventory data
@@ -82,6 +111,9 @@ class InventoryService:
             repository (InventoryRepository, optional): Repository instance for
                 persistence operations. If None, creates a new InventoryRepository
                 with default file paths. Defaults to None.
+            check_consistency (bool, optional): If True, verify_sorted_invariant()
+                runs after every mutation and raises on violation. Intended for
+                tests; it costs O(n) per mutation. Defaults to False.
 
         Returns:
             None
@@ -109,6 +141,11 @@ class InventoryService:
 
         self.inventory_general: List[Inventory] = []
         self.inventory_sorted: List[Inventory] = []
+        self.inventory_sorted_keys: List[tuple] = []
+        self.check_consistency = check_consistency
+
+        # id(group) -> key under which the group is stored in inventory_sorted
+        self._sorted_keys_by_group: Dict[int, tuple] = {}
 
         self._load_inventories()
         
@@ -222,7 +259,7 @@ class InventoryService:
         
         Side Effects:
             - Adds book to inventory_general (to existing or new group)
-            - Synchronizes inventory_sorted (creates sorted copy)
+            - Updates inventory_sorted incrementally (bisect insert for new groups)
             - Persists both lists to JSON files
         
         Example:
@@ -245,23 +282,24 @@ class InventoryService:
                 if existing_book.get_id() == book.get_id():
                     raise ValueError(f"A book with id '{book.get_id()}' already exists in inventory")
 
-        # Find existing inventory group with same ISBN
+        # Find existing inventory group with same ISBN (binary search on the
+        # sorted index, which references the same group objects)
         target_inventory = None
-        for inventory in self.inventory_general:
-            if inventory.get_isbn() == book.get_ISBNCode():
-                target_inventory = inventory
-                break
+        start, end = self.find_isbn_range(book.get_ISBNCode())
+        if start < end:
+            target_inventory = self.inventory_sorted[start]
 
         if target_inventory:
-            # Add to existing group
+            # Add to existing group (its ISBN key does not change)
             target_inventory.add_item(book)
         else:
             # Create new group
             new_inventory = Inventory(stock=1, items=[book])
             self.inventory_general.append(new_inventory)
+            self._sorted_insert(new_inventory)
 
-        # Synchronize and save
-        self.synchronize_inventories()
+        # Save (sorted view already maintained incrementally)
+        self._commit_mutation()
 
     def update_book_in_inventory(self, book_id: str, updated_book: Book) -> None:
         """Update a book's information in the inventory system.
@@ -301,7 +339,8 @@ class InventoryService:
             - Updates book data in inventory_general
             - May move book between groups (if ISBN changed)
             - Removes empty groups
-            - Synchronizes inventory_sorted
+            - Updates inventory_sorted incrementally (reposition only if the
+              ISBN changed)
             - Persists changes to JSON files
         
         Example:
@@ -317,11 +356,15 @@ class InventoryService:
         """
         found = False
         old_inventory = None
+        old_isbn = None
         
         # Find the book in inventory
         for inventory in self.inventory_general:
             for idx, book in enumerate(inventory.get_items()):
                 if book.get_id() == book_id:
+                    # Remember the group's ISBN before mutating it (the
+                    # replaced book may be the group's representative)
+                    old_isbn = inventory.get_isbn()
                     # Update book in place
                     items = inventory.get_items()
                     items[idx] = updated_book
@@ -336,14 +379,16 @@ class InventoryService:
             raise ValueError(f"Book with id '{book_id}' not found in inventory")
         
         # If ISBN changed, move to different group
-        if old_inventory and old_inventory.get_isbn() != updated_book.get_ISBNCode():
+        if old_inventory and old_isbn != updated_book.get_ISBNCode():
             # Remove from old group
             old_inventory.remove_item(book_id)
             
             # Remove empty groups (groups with no items).
             # Do NOT remove groups that have stock == 0 because they represent
             # out-of-stock ISBN groups which we keep for reservation/waitlist logic.
-            self.inventory_general = [inv for inv in self.inventory_general if len(inv.get_items()) > 0]
+            self._drop_empty_groups()
+            if old_inventory.get_items():
+                self._sorted_reposition(old_inventory)
             
             # Add to new group (or create it)
             target_inventory = None
@@ -357,8 +402,12 @@ class InventoryService:
             else:
                 new_inventory = Inventory(stock=1, items=[updated_book])
                 self.inventory_general.append(new_inventory)
+                self._sorted_insert(new_inventory)
+        else:
+            # Same ISBN: the shared group already reflects the new data
+            self._sorted_reposition(old_inventory)
         
-        self.synchronize_inventories()
+        self._commit_mutation()
 
     def delete_book_from_inventory(self, book_id: str) -> None:
         """
@@ -370,34 +419,43 @@ class InventoryService:
         Raises:
         - ValueError: if book not found
         """
-        found = False
+        found = None
         
         for inventory in self.inventory_general:
             if inventory.remove_item(book_id):
-                found = True
+                found = inventory
                 break
         
-        if not found:
+        if found is None:
             raise ValueError(f"Book with id '{book_id}' not found in inventory")
         
         # Remove empty groups (groups with no items). Keep groups with stock == 0
         # so reservations / waiting lists can reference them.
-        self.inventory_general = [inv for inv in self.inventory_general if len(inv.get_items()) > 0]
+        self._drop_empty_groups()
+        if found.get_items():
+            self._sorted_reposition(found)
 
-        self.synchronize_inventories()
+        self._commit_mutation()
 
     def synchronize_inventories(self) -> None:
         """Synchronize the sorted inventory list with the general inventory list.
 
-        This method ensures that inventory_sorted remains a properly ordered copy
-        of inventory_general by creating a deep copy and applying the insertion
-        sort algorithm. Both lists are then persisted to their respective JSON files.
+        This method rebuilds inventory_sorted as an ordered index over the
+        groups of inventory_general, sorted with the SORT_STRATEGY strategy.
+        Both lists are then persisted to their respective JSON files.
+
+        This is the full (cold) rebuild: it runs at initialization, after the
+        general list is replaced wholesale (reload/regeneration) and whenever
+        callers need to resynchronize after touching inventory_general
+        directly. The CRUD methods of this service do NOT call it; they keep
+        inventory_sorted up to date incrementally.
         
         Synchronization Process:
-            1. Create deep copy of each Inventory object in inventory_general
-               (includes copying all Book objects to avoid shared references)
-            2. Store copies in inventory_sorted list
-            3. Apply insertion sort algorithm (insercion_ordenada) to sort by ISBN
+            1. Reference every Inventory object of inventory_general (no copies)
+            2. Store the references in inventory_sorted
+            3. Compute the canonical ISBN key of every group once and sort the
+               groups by those keys (sort_by_keys), which also yields the key
+               array (inventory_sorted_keys)
             4. Persist both lists to JSON files via repository
         
         Why Synchronization?
@@ -410,13 +468,18 @@ class InventoryService:
             - Fast searches on sorted list
         
         Sorting Algorithm:
-            Uses insercion_ordenada (insertion sort) from AlgoritmosOrdenamiento.
-            Time Complexity: O(n²) worst case, but efficient for small datasets
-            and nearly-sorted data. The inventory is sorted by ISBN in ascending order.
-        
-        Deep Copy Rationale:
-            Deep copying prevents mutations to inventory_general from affecting
-            inventory_sorted, maintaining data integrity across both lists.
+            Uses the strategy named in SORT_STRATEGY (utils.algorithms.sort_strategies).
+            With 'auto', already sorted input is detected in O(n), tiny inputs
+            use insertion sort and everything else uses Timsort, O(n log n).
+            'insertion' and 'merge' keep the teaching algorithms available.
+            The inventory is sorted by ISBN in ascending order (stable).
+        
+        Shared References:
+            Both lists hold the SAME Inventory/Book objects, so stock or borrow
+            changes made through inventory_general are immediately visible in
+            inventory_sorted without copying. The only thing that can break the
+            sorted order is a change of a group's ISBN; the service handles it
+            by re-indexing that group (see _sorted_reposition()).
         
         Args:
             None
@@ -432,8 +495,9 @@ class InventoryService:
             - Writes to both JSON files (inventory_general.json, inventory_sorted.json)
         
         Performance:
-            Called after every mutation operation (add/update/delete). For large
-            inventories, consider batching operations to reduce synchronization overhead.
+            O(n log n) with the default strategy (O(n²) with 'insertion').
+            Only used on cold load; single add/update/delete operations cost O(log n) for the
+            bisect plus O(n) for the positional list insert/delete.
         
         Example:
             >>> service = InventoryService()
@@ -442,32 +506,108 @@ class InventoryService:
             >>> service.synchronize_inventories()
             >>> # Now inventory_sorted is updated and sorted
         """
-        # Create deep copy of inventory_general to inventory_sorted
-        self.inventory_sorted = []
-        for inv in self.inventory_general:
-            # Create new Inventory with same data
-            books_copy = []
-            for book in inv.get_items():
-                book_copy = Book(
-                    book.get_id(),
-                    book.get_ISBNCode(),
-                    book.get_title(),
-                    book.get_author(),
-                    book.get_weight(),
-                    book.get_price(),
-                    book.get_isBorrowed()
-                )
-                books_copy.append(book_copy)
-            
-            inv_copy = Inventory(stock=inv.get_stock(), items=books_copy)
-            self.inventory_sorted.append(inv_copy)
-
-        # Sort using the insertion sort algorithm
-        insercion_ordenada(self.inventory_sorted)
+        # Ordered index over the same Inventory objects (no deep copy),
+        # sorted by keys computed once per group
+        keys = [clave_isbn(inv.get_isbn()) for inv in self.inventory_general]
+        self.inventory_sorted, self.inventory_sorted_keys = sort_by_keys(
+            self.inventory_general, keys, self.SORT_STRATEGY
+        )
+
+        # Remember the key each group is stored under, so later mutations
+        # can locate it with a bisect even after its ISBN changed
+        self._sorted_keys_by_group = {
+            id(inv): key for inv, key in zip(self.inventory_sorted, self.inventory_sorted_keys)
+        }
 
         # Save both inventories
         self._save_inventories()
 
+    # -------------------- Incremental sorted-view maintenance --------------------
+    def _sorted_position(self, inv: Inventory, key: tuple) -> int:
+        """Locate `inv` in inventory_sorted by bisecting its stored key, O(log n + k)."""
+        start = limite_inferior(self.inventory_sorted_keys, key)
+        end = limite_superior(self.inventory_sorted_keys, key)
+        for pos in range(start, end):
+            if self.inventory_sorted[pos] is inv:
+                return pos
+        raise ValueError(f"Sorted inventory invariant violated: group with key {key} not found")
+
+    def _sorted_insert(self, inv: Inventory) -> None:
+        """Bisect-insert a new general group into the sorted view."""
+        key = clave_isbn(inv.get_isbn())
+        # bisect_right keeps groups with equal ISBN in insertion order (stable)
+        pos = bisect_right(self.inventory_sorted_keys, key)
+        self.inventory_sorted.insert(pos, inv)
+        self.inventory_sorted_keys.insert(pos, key)
+        self._sorted_keys_by_group[id(inv)] = key
+
+    def _sorted_remove(self, inv: Inventory) -> None:
+        """Positional delete of a general group from the sorted view."""
+        key = self._sorted_keys_by_group.pop(id(inv), None)
+        if key is None:
+            return
+        pos = self._sorted_position(inv, key)
+        del self.inventory_sorted[pos]
+        del self.inventory_sorted_keys[pos]
+
+    def _sorted_reposition(self, inv: Inventory) -> None:
+        """Re-index a group inside the sorted view only if its ISBN key changed."""
+        if self._sorted_keys_by_group.get(id(inv)) == clave_isbn(inv.get_isbn()):
+            return
+        self._sorted_remove(inv)
+        self._sorted_insert(inv)
+
+    def _drop_empty_groups(self) -> None:
+        """Remove groups without items from inventory_general and the sorted view."""
+        remaining: List[Inventory] = []
+        for inv in self.inventory_general:
+            if len(inv.get_items()) > 0:
+                remaining.append(inv)
+            else:
+                self._sorted_remove(inv)
+        self.inventory_general = remaining
+
+    def _commit_mutation(self) -> None:
+        """Optionally verify the sorted-view invariant, then persist both lists."""
+        if self.check_consistency:
+            self.verify_sorted_invariant()
+        self._save_inventories()
+
+    def verify_sorted_invariant(self) -> None:
+        """Check that inventory_sorted is a sorted, complete index of inventory_general.
+
+        Verifies that:
+        - inventory_sorted and inventory_sorted_keys have the same length as
+          inventory_general,
+        - every key matches the ISBN of its group and keys are non-decreasing,
+        - every general group appears exactly once in inventory_sorted (same
+          object), stored under the group's current ISBN key.
+
+        Complexity: O(n).
+
+        Raises:
+        - ValueError: describing the first violation found.
+        """
+        n = len(self.inventory_general)
+        if len(self.inventory_sorted) != n or len(self.inventory_sorted_keys) != n:
+            raise ValueError(
+                f"Sorted inventory invariant violated: sizes differ "
+                f"(general={n}, sorted={len(self.inventory_sorted)}, keys={len(self.inventory_sorted_keys)})"
+            )
+
+        for pos, (inv, key) in enumerate(zip(self.inventory_sorted, self.inventory_sorted_keys)):
+            if clave_isbn(inv.get_isbn()) != key:
+                raise ValueError(f"Sorted inventory invariant violated: stale key at position {pos}")
+            if pos > 0 and self.inventory_sorted_keys[pos - 1] > key:
+                raise ValueError(f"Sorted inventory invariant violated: order broken at position {pos}")
+
+        if len(self._sorted_keys_by_group) != n or {id(inv) for inv in self.inventory_sorted} != {id(inv) for inv in self.inventory_general}:
+            raise ValueError("Sorted inventory invariant violated: sorted view does not index the general groups")
+        for inv in self.inventory_general:
+            key = self._sorted_keys_by_group.get(id(inv))
+            if key != clave_isbn(inv.get_isbn()):
+                raise ValueError(f"Sorted inventory invariant violated: ISBN '{inv.get_isbn()}' not re-indexed")
+
     def _regenerate_from_books(self) -> None:
         """
         Regenerate inventory from books.json if inventory is empty.
@@ -620,23 +760,38 @@ class InventoryService:
     def find_by_isbn(self, isbn: str) -> List[Inventory]:
         """Find inventory items by ISBN using binary search on `inventory_sorted`.
 
+        The sorted index references the same Inventory objects as
+        `inventory_general`, so the returned groups are the live objects.
+
         Parameters:
         - isbn: ISBN string to search
 
         Returns:
         - List[Inventory] matching the ISBN (may be multiple)
-
-        Raises:
-        - ImportError: if `buscar_binario` not available.
         """
-        # Simple linear search fallback: scan the general inventory list and
-        # collect items whose book ISBN matches the requested value.
-        # This avoids depending on external binary-search implementation.
         if isbn is None:
             return []
 
-        matches: List[Inventory] = [inv for inv in self.inventory_general if inv.get_book().get_ISBNCode() == isbn]
-        return matches
+        start, end = self.find_isbn_range(isbn)
+        return self.inventory_sorted[start:end]
+
+    def find_isbn_range(self, isbn: str) -> Tuple[int, int]:
+        """Locate all groups with `isbn` in `inventory_sorted` in O(log n).
+
+        Uses the canonical key array maintained next to the sorted list and
+        bisect-based lower/upper bounds (busqueda_binaria_rango), so no
+        get_isbn() call or int() conversion happens per probe.
+
+        Parameters:
+        - isbn: ISBN string to search
+
+        Returns:
+        - Half-open range (start, end) of positions in `inventory_sorted`.
+          The range is empty (start == end) when the ISBN is not present.
+        """
+        if isbn is None:
+            return 0, 0
+        return busqueda_binaria_rango(self.inventory_sorted_keys, isbn)
 
     def get_isbns_with_zero_stock(self) -> List[Tuple[str, Optional[str]]]:
         """Return a list of (ISBN, title) tuples for ISBN groups whose total stock sums to 0.
@@ -689,6 +844,59 @@ class InventoryService:
                 continue
         return results
 
+    def get_copy_groups(self) -> List[Dict[str, Any]]:
+        """Return one entry per ISBN with its weight, price and available copies.
+
+        Inventory groups sharing an ISBN are merged; the weight, price, title
+        and author come from the first group's sample book.
+
+        Returns:
+            List of dicts with 'isbn', 'title', 'author', 'weight', 'price'
+            and 'copies' (available, not borrowed).
+        """
+        groups: Dict[str, Dict[str, Any]] = {}
+        for inv in self.inventory_general:
+            try:
+                book = inv.get_book()
+                if book is None:
+                    continue
+                isbn = book.get_ISBNCode()
+                entry = groups.get(isbn)
+                if entry is None:
+                    entry = groups[isbn] = {
+                        'isbn': isbn,
+                        'title': book.get_title(),
+                        'author': book.get_author(),
+                        'weight': book.get_weight(),
+                        'price': book.get_price(),
+                        'copies': 0
+                    }
+                entry['copies'] += inv.get_available_count()
+            except Exception:
+                continue
+        return list(groups.values())
+
+    def find_optimal_shelf_copies(self, max_capacity: float = 8.0, resolution: float = 0.01) -> Dict[str, Any]:
+        """Bounded knapsack over ISBN groups: how many copies of each ISBN to shelve.
+
+        Each ISBN is one item that can be taken up to its available copy
+        count, solved with binary splitting of the counts in
+        O(groups * W * log copies) instead of treating every copy as a
+        separate 0/1 item.
+
+        Args:
+            max_capacity: Maximum shelf weight in Kg (default 8.0).
+            resolution: Weight discretization step in Kg (default 0.01).
+
+        Returns:
+            Dictionary with 'max_value', 'total_weight', 'total_copies',
+            'groups' (copies chosen per ISBN) and 'items', see
+            utils.algorithms.knapsack_bounded.solve_bounded_shelf.
+        """
+        from utils.algorithms.knapsack_bounded import solve_bounded_shelf
+
+        return solve_bounded_shelf(self.get_copy_groups(), max_capacity, resolution)
+
     def find_by_title(self, title: str) -> List[Inventory]:
         """Find inventory items by book title using recursive linear search.
 
@@ -700,7 +908,7 @@ class InventoryService:
             Uses busqueda_lineal from AlgoritmosBusqueda module, which implements
             recursive linear search with the following characteristics:
             - Time Complexity: O(n) where n is the number of inventory groups
-            - Space Complexity: O(n) for recursion stack
+            - Space Complexity: O(1) (recursion executed as a loop)
             - Case-insensitive matching
             - Supports partial matches (substring search)
         
@@ -780,7 +988,7 @@ class InventoryService:
             Uses busqueda_lineal from AlgoritmosBusqueda module, which implements
             recursive linear search with the following characteristics:
             - Time Complexity: O(n) where n is the number of inventory groups
-            - Space Complexity: O(n) for recursion stack
+            - Space Complexity: O(1) (recursion executed as a loop)
             - Case-insensitive matching
             - Supports partial matches (substring search)
         
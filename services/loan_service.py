@@ -9,7 +9,6 @@ from repositories.loan_history_repository import LoanHistoryRepository
 from utils.structures.stack import Stack
 from utils.validators import LoanValidator, ValidationError
 from utils.logger import LibraryLogger
-from utils.algorithms.AlgoritmosBusqueda import busqueda_binaria
 
 # Configurar logger
 logger = LibraryLogger.get_logger(__name__)
@@ -355,18 +354,15 @@ class LoanService:
         
         # CRITICAL: Check reservation queue using búsqueda binaria (required by project spec)
         try:
-            # Get sorted inventory to use binary search
-            # Use inventory_sorted which is already sorted by insercion_ordenada algorithm
+            # Binary search over the canonical ISBN key array kept next to
+            # inventory_sorted (bisect lower/upper bound, O(log n))
             if self.inventory_service:
-                # Use the pre-sorted inventory (sorted with insercion_ordenada algorithm)
-                inventario_ordenado = self.inventory_service.inventory_sorted
-                
                 # Use búsqueda binaria to verify book exists in inventory
                 isbn_returned = loan.get_isbn()
-                index = busqueda_binaria(inventario_ordenado, isbn_returned)
+                inicio, fin = self.inventory_service.find_isbn_range(isbn_returned)
                 
-                # If book found in inventory, check for pending reservations
-                if index != -1:
+                # If book found in inventory (non-empty range), check for pending reservations
+                if inicio < fin:
                     # Lazy import to avoid circular dependency
                     from services.reservation_service import ReservationService
                     reservation_service = ReservationService()
@@ -11,7 +11,7 @@ import json
 from typing import List, Dict, Any
 
 from services.inventory_service import InventoryService
-from utils.report_helpers import ordenar_y_generar_reporte
+from utils.report_helpers import ordenar_y_generar_reporte, generar_reporte_externo
 from utils.config import FilePaths
 from utils.logger import LibraryLogger
 
@@ -44,7 +44,33 @@ class ReportService:
     3. Aplica Merge Sort por precio
     4. Genera reporte con estadísticas
     5. Exporta a data/inventory_value.json
+
+    ESTRATEGIA DE ORDENAMIENTO:
+    ===========================
+    SORT_STRATEGY selecciona la estrategia de utils.algorithms.sort_strategies
+    ('auto' = Timsort sobre precios precalculados). Con None se usa el
+    Merge Sort didáctico (merge_sort_books_by_price). El orden es estable en
+    ambos casos, por lo que el reporte es idéntico. Para reportes grandes en
+    máquinas con varios núcleos, 'parallel_merge' ordena trozos del arreglo de
+    precios en procesos separados (ProcessPoolExecutor) y los mezcla;
+    'merge_bottom_up' es el Merge Sort iterativo sin slicing.
+
+    INVENTARIOS MÁS GRANDES QUE LA MEMORIA:
+    =======================================
+    Si el número de copias supera EXTERNAL_SORT_THRESHOLD, el reporte se genera
+    con ordenamiento externo (runs en disco + heapq.merge) y se escribe en flujo
+    al archivo; ver generate_inventory_value_report_external().
     """
+
+    # Estrategia de ordenamiento por precio (None = Merge Sort didáctico)
+    SORT_STRATEGY = 'auto'
+
+    # Con más copias que este umbral se usa el ordenamiento externo
+    # (generate_inventory_value_report_external); None lo desactiva
+    EXTERNAL_SORT_THRESHOLD = 500_000
+
+    # Copias ordenadas en memoria por cada run del ordenamiento externo
+    EXTERNAL_RUN_SIZE = 100_000
     
     def __init__(self, inventory_service: InventoryService = None):
         """Inicializar ReportService.
@@ -103,6 +129,10 @@ class ReportService:
         5. Genera reporte serializable con estadísticas
         6. Exporta a data/inventory_value.json
         
+        Si hay más de EXTERNAL_SORT_THRESHOLD copias, los pasos 2-6 se delegan a
+        generate_inventory_value_report_external() (mismo archivo, memoria
+        acotada) y el diccionario retornado no incluye 'books' sino 'books_file'.
+        
         FORMATO DEL REPORTE:
         ====================
         {
@@ -145,6 +175,15 @@ class ReportService:
             
             # PASO 1: Obtener inventario general (grupos de libros por ISBN)
             inventory_groups = self.inventory_service.inventory_general
+
+            # Inventarios enormes: ordenamiento externo en disco (memoria acotada)
+            total_copias = sum(len(grupo.get_items()) for grupo in inventory_groups)
+            if self.EXTERNAL_SORT_THRESHOLD is not None and total_copias > self.EXTERNAL_SORT_THRESHOLD:
+                logger.info(
+                    f"{total_copias} copias superan el umbral de {self.EXTERNAL_SORT_THRESHOLD}: "
+                    f"usando ordenamiento externo"
+                )
+                return self._write_external_report(inventory_groups)
             
             # PASO 2: Expandir grupos a lista plana de Books
             # Cada grupo (Inventory) tiene múltiples items (Books)
@@ -176,10 +215,10 @@ class ReportService:
             else:
                 # PASO 4: Aplicar Merge Sort para ordenar por precio
                 # ordenar_y_generar_reporte() hace:
-                # 1. merge_sort_books_by_price(todos_los_libros)
+                # 1. Ordenar por precio con SORT_STRATEGY (o Merge Sort si es None)
                 # 2. generar_reporte_global(libros_ordenados)
                 # 3. Calcular estadísticas (total, promedio, min, max)
-                resultado = ordenar_y_generar_reporte(todos_los_libros)
+                resultado = ordenar_y_generar_reporte(todos_los_libros, self.SORT_STRATEGY)
                 
                 # PASO 5: Construir estructura final del reporte
                 # IMPORTANTE: Nombres en INGLÉS para consistencia con todo el sistema
@@ -211,6 +250,76 @@ class ReportService:
             logger.error(f"Error al generar reporte de inventario: {e}")
             raise
     
+    def generate_inventory_value_report_external(self, run_size: int = None) -> Dict[str, Any]:
+        """Generar el reporte de valor con ordenamiento externo (memoria acotada).
+        
+        PROPÓSITO:
+        ==========
+        Variante de generate_inventory_value_report() para inventarios con
+        millones de copias. En lugar de expandir todas las copias en una lista,
+        ordenarla en memoria, construir otra lista de diccionarios y volcarla
+        con json.dump, las copias se recorren como flujo:
+        
+        1. Se leen las copias grupo por grupo (generador, sin lista plana)
+        2. Se ordenan runs acotados por precio y se vuelcan a archivos temporales
+        3. Se mezclan los runs con heapq.merge (k-way merge)
+        4. Cada libro se escribe directamente en data/inventory_value.json
+        
+        Las estadísticas (total, suma, mínimo, máximo) se calculan en la misma
+        pasada de lectura. El archivo resultante tiene el mismo formato y el
+        mismo orden (estable) que el del método en memoria.
+        
+        Parameters:
+        -----------
+        run_size : int, opcional
+            Copias ordenadas en memoria por run. Por defecto EXTERNAL_RUN_SIZE.
+        
+        RETORNO:
+        ========
+        Dict[str, Any]
+            Estadísticas del reporte (total_books, total_price, average_price,
+            min_price, max_price) y 'books_file' con la ruta del archivo. La
+            lista 'books' NO se incluye: solo existe en el archivo.
+        
+        EXCEPCIONES:
+        ============
+        - IOError: si no se puede escribir el archivo de reporte
+        """
+        try:
+            logger.info("Iniciando reporte de inventario con ordenamiento externo...")
+            
+            self.inventory_service._load_inventories()
+            self.inventory_service.synchronize_inventories()
+            
+            return self._write_external_report(self.inventory_service.inventory_general, run_size)
+            
+        except Exception as e:
+            logger.error(f"Error al generar reporte externo de inventario: {e}")
+            raise
+    
+    def _write_external_report(self, inventory_groups: List[Any], run_size: int = None) -> Dict[str, Any]:
+        """Ordenar por precio vía runs en disco y escribir el reporte en flujo."""
+        # Generador de copias físicas: nunca se construye la lista plana
+        copias = (libro for grupo in inventory_groups for libro in grupo.get_items())
+        
+        resultado = generar_reporte_externo(
+            copias,
+            FilePaths.INVENTORY_VALUE_REPORT,
+            tamano_run=run_size or self.EXTERNAL_RUN_SIZE,
+            estrategia=self.SORT_STRATEGY or 'auto',
+        )
+        
+        logger.info(f"Reporte exportado a: {FilePaths.INVENTORY_VALUE_REPORT}")
+        
+        return {
+            'total_books': resultado['total_libros'],
+            'total_price': resultado['precio_total'],
+            'average_price': resultado['precio_promedio'],
+            'min_price': resultado['precio_minimo'],
+            'max_price': resultado['precio_maximo'],
+            'books_file': resultado['ruta_reporte'],
+        }
+    
     def get_inventory_summary(self) -> Dict[str, Any]:
         """Obtener resumen rápido del inventario sin ordenar.
         
@@ -1131,6 +1131,122 @@ class ShelfService:
 		
 		return removed_count
 
+	# -------------------- Multi-shelf assignment --------------------
+
+	def plan_assignment(self, books: List[Book], heuristic: str = 'best_fit',
+						max_rounds: int = 5, time_budget: float = 1.0) -> dict:
+		"""Plan how to place unassigned books across all shelves (no changes made).
+		
+		Solves the multiple knapsack problem over every shelf with its own
+		capacity: a first-fit/best-fit decreasing heuristic followed by a bounded
+		local search (insert, relocate and swap moves) that maximizes the total
+		value placed. Books already on a shelf keep their placement and count
+		towards its load.
+		
+		Args:
+			books: Candidate books. Books already assigned to a shelf, duplicates
+				and books without a valid weight are ignored.
+			heuristic: 'best_fit' (default) or 'first_fit'.
+			max_rounds: Maximum local-search rounds.
+			time_budget: Maximum local-search time in seconds.
+		
+		Returns:
+			dict: Plan with keys:
+				- 'assignments': List of {'shelf_id', 'book'} placements
+				- 'unplaced': Books that did not fit anywhere
+				- 'placed_value': Total price of the planned placements
+				- 'heuristic_value': Value placed before the local search
+				- 'improvements': Local-search moves accepted
+		
+		Raises:
+			ValueError: If the heuristic is unknown.
+		
+		See Also:
+			- apply_assignment: Apply a plan with a single save
+			- utils.algorithms.shelf_assignment.assign_books_to_shelves: Algorithm
+		"""
+		from utils.algorithms.shelf_assignment import assign_books_to_shelves
+
+		assigned = {b.get_id() for s in self._shelves for b in getattr(s, '_Shelf__books', [])}
+
+		candidates: List[Book] = []
+		weights: List[float] = []
+		values: List[float] = []
+		for book in books:
+			book_id = book.get_id()
+			if book_id in assigned:
+				continue
+			try:
+				weight = float(book.get_weight())
+				price = float(book.get_price())
+			except Exception:
+				continue
+			assigned.add(book_id)
+			candidates.append(book)
+			weights.append(weight)
+			values.append(price)
+
+		outcome = assign_books_to_shelves(
+			weights,
+			values,
+			[shelf.capacity for shelf in self._shelves],
+			[self.total_weight(shelf.get_id()) for shelf in self._shelves],
+			heuristic=heuristic,
+			max_rounds=max_rounds,
+			time_budget=time_budget,
+		)
+
+		assignments = []
+		unplaced = []
+		for book, position in zip(candidates, outcome['assignment']):
+			if position < 0:
+				unplaced.append(book)
+			else:
+				assignments.append({'shelf_id': self._shelves[position].get_id(), 'book': book})
+
+		return {
+			'assignments': assignments,
+			'unplaced': unplaced,
+			'placed_value': outcome['value'],
+			'heuristic_value': outcome['heuristic_value'],
+			'improvements': outcome['improvements']
+		}
+
+	def apply_assignment(self, plan: dict) -> int:
+		"""Apply a plan from plan_assignment() with one batched save.
+		
+		Every placement is re-validated with the add_book rules (shelf exists,
+		capacity, no duplicate ID on the shelf); invalid placements are skipped.
+		Shelves are persisted once at the end instead of once per book.
+		
+		Args:
+			plan: Dictionary returned by plan_assignment().
+		
+		Returns:
+			int: Number of books placed.
+		"""
+		placed = 0
+		for entry in plan.get('assignments', []):
+			shelf = self.find_shelf(entry['shelf_id'])
+			book = entry['book']
+			if shelf is None:
+				continue
+			books_list: List[Book] = getattr(shelf, '_Shelf__books')
+			try:
+				weight = book.get_weight()
+			except Exception:
+				continue
+			if self.total_weight(entry['shelf_id']) + weight > shelf.capacity:
+				continue
+			if any(existing.get_id() == book.get_id() for existing in books_list):
+				continue
+			books_list.append(book)
+			placed += 1
+
+		if placed > 0:
+			self._save_shelves()
+		return placed
+
 	# -------------------- Persistence (delegated to repository) --------------------
 
 	def _load_shelves(self) -> None:
@@ -1207,6 +1323,7 @@ class ShelfService:
 			- move_book: Book moved between shelves
 			- set_capacity: Capacity modified
 			- remove_book_from_all_shelves: Book removed from all locations
+			- apply_assignment: Planned books placed (one save for the batch)
 		
 		Args:
 			None
@@ -419,8 +419,7 @@ class AuthorValueReport(ctk.CTkToplevel):
             
             2. Data Collection:
                - Log calculation start
-               - Retrieve all books from database
-               - Filter books by selected author
+               - Get the selected author's books (author table)
                - Count matching books
             
             3. Calculation:
@@ -487,8 +486,8 @@ class AuthorValueReport(ctk.CTkToplevel):
             - Logs calculation start, result, and any errors
         
         Performance:
-            - Time: O(n) where n = total books (filters + recursion)
-            - Space: O(n) for stack frames during recursion
+            - Time: O(k) where k = books by the author (author table + recursion)
+            - Space: O(1) call-stack depth (recursion simulated iteratively)
             - UI update: O(m) where m = books by author (formatting)
         
         See Also:
@@ -508,9 +507,8 @@ class AuthorValueReport(ctk.CTkToplevel):
         try:
             logger.info(f"Calculando valor total para autor: {author}")
             
-            # Get all books to count how many belong to this author
-            all_books = self.controller.get_all_books()
-            author_books = [b for b in all_books if b.get_author() == author]
+            # Books of this author from the precomputed author table
+            author_books = self.controller.get_books_by_author(author)
             book_count = len(author_books)
             
             # Calculate using stack recursion
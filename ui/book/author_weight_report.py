@@ -639,9 +639,8 @@ class AuthorWeightReport(ctk.CTkToplevel):
         try:
             logger.info(f"Calculando peso promedio para autor: {author} (debug={debug_mode})")
             
-            # Get all books to show details
-            all_books = self.controller.get_all_books()
-            author_books = [b for b in all_books if b.get_author() == author]
+            # Books of this author (author table, no catalog scan)
+            author_books = self.controller.get_books_by_author(author)
             book_count = len(author_books)
             
             # Display results
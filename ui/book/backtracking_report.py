@@ -138,6 +138,7 @@ from controllers.book_controller import BookController
 from ui import theme
 from ui import widget_factory as wf
 from utils.logger import LibraryLogger
+from utils.algorithms.tracing import TraceRecorder
 
 logger = LibraryLogger.get_logger(__name__)
 
@@ -147,6 +148,19 @@ WARNING_COLOR = "#F39C12"  # Orange for warnings
 INFO_COLOR = "#3498DB"     # Blue for info
 CARD_BG_COLOR = "#F5F5F5"  # Light gray for cards
 
+# Capacity range solved once by the capacity sweep (what-if comparisons)
+SWEEP_MAX_CAPACITY = 16.0
+
+# Maximum seconds the branch-and-bound search may run before the report
+# shows the best selection found so far
+REPORT_TIME_BUDGET = 2.0
+
+# Exploration trace kept for the report: last events and uniform sample
+# (bounded memory, whatever the size of the search)
+TRACE_LAST_EVENTS = 200
+TRACE_SAMPLE_SIZE = 200
+TRACE_EVENTS_SHOWN = 8
+
 
 class BacktrackingReport(ctk.CTkToplevel):
     """Backtracking algorithm visualization window for optimal shelf book selection.
@@ -565,9 +579,16 @@ class BacktrackingReport(ctk.CTkToplevel):
         )
         btn_close.pack(side="right", padx=5)
     
-    def _load_report(self):
+    def _load_report(self, use_sweep: bool = False):
         """Load and display backtracking algorithm results with formatted output.
         
+        With use_sweep=True (capacity changes) the solution is read from the
+        cached capacity sweep (one DP solve for every capacity up to
+        SWEEP_MAX_CAPACITY) instead of running the search again, but only
+        when the sweep is exact for that capacity (weights and capacity on
+        its resolution grid); otherwise the branch-and-bound search runs.
+        Header and footer describe the method that produced the result.
+        
         Executes the backtracking algorithm via controller, retrieves the optimal
         solution, updates all statistics labels, and formats comprehensive results
         in the textbox including book details, metrics, and algorithm explanation.
@@ -700,8 +721,22 @@ class BacktrackingReport(ctk.CTkToplevel):
             all_books = self.controller.get_all_books()
             total_books = len(all_books)
             
-            # Run backtracking algorithm
-            result = self.controller.find_optimal_shelf_selection(self.max_capacity)
+            recorder = TraceRecorder(TRACE_LAST_EVENTS, TRACE_SAMPLE_SIZE)
+            sweep = None
+            if use_sweep:
+                # What-if capacity: answered from the cached capacity sweep when it is exact
+                sweep = self.controller.get_shelf_capacity_sweep(max(SWEEP_MAX_CAPACITY, self.max_capacity))
+                if not sweep.is_exact_at(self.max_capacity):
+                    sweep = None
+            if sweep is not None:
+                result = sweep.solution_at(self.max_capacity)
+            else:
+                # Run backtracking with branch and bound (fractional-bound pruning)
+                result = self.controller.find_optimal_shelf_selection(
+                    self.max_capacity, method='branch_and_bound', time_budget=REPORT_TIME_BUDGET,
+                    trace=recorder
+                )
+            search = result.get('search', {})
             
             max_value = result['max_value']
             total_weight = result['total_weight']
@@ -731,20 +766,56 @@ class BacktrackingReport(ctk.CTkToplevel):
                 msg += "• No hay libros en el catálogo\n"
                 self.results_text.insert("1.0", msg)
             else:
-                header = f"✅ Solución Óptima Encontrada\n"
-                header += "=" * 80 + "\n\n"
-                header += f"El algoritmo de backtracking exploró todas las posibles combinaciones\n"
-                header += f"y encontró la solución que maximiza el valor sin exceder {self.max_capacity} Kg.\n\n"
+                if sweep is not None:
+                    header = f"✅ Solución Óptima Encontrada (barrido de capacidades)\n"
+                    header += "=" * 80 + "\n\n"
+                    header += f"Programación dinámica resuelta una sola vez para todas las capacidades hasta\n"
+                    header += f"{sweep.max_capacity} Kg, en pasos de {sweep.resolution} Kg. Todos los pesos son múltiplos\n"
+                    header += f"de ese paso, así que la solución para {self.max_capacity} Kg es exacta.\n\n"
+                elif result.get('complete', True):
+                    header = f"✅ Solución Óptima Encontrada\n"
+                    header += "=" * 80 + "\n\n"
+                    header += f"La búsqueda con ramificación y poda recorrió el árbol de decisiones, descartando\n"
+                    header += f"solo las ramas que no podían mejorar la mejor solución, y encontró la que\n"
+                    header += f"maximiza el valor sin exceder {self.max_capacity} Kg.\n\n"
+                else:
+                    header = f"⏱️ Mejor Solución Encontrada (límite de {REPORT_TIME_BUDGET:g} s)\n"
+                    header += "=" * 80 + "\n\n"
+                    header += f"La búsqueda se detuvo al agotar el tiempo. La solución mostrada está\n"
+                    header += f"como máximo un {result['gap'] * 100:.2f}% por debajo del valor óptimo.\n\n"
                 header += f"📊 RESUMEN:\n"
                 header += f"  • Valor Total: ${max_value:,.2f} COP\n"
                 header += f"  • Peso Total: {total_weight:.2f} Kg / {self.max_capacity} Kg\n"
                 header += f"  • Libros: {books_count}\n"
                 header += f"  • Valor promedio por libro: ${max_value/books_count:,.2f} COP\n"
                 header += f"  • Peso promedio por libro: {total_weight/books_count:.2f} Kg\n"
-                
                 if total_weight > 0:
                     header += f"  • Eficiencia (COP/Kg): ${max_value/total_weight:,.2f}\n"
                 
+                if search:
+                    explored = search['nodes_explored']
+                    tree_size = search['tree_size']
+                    header += f"\n🌳 EXPLORACIÓN (ramificación y poda):\n"
+                    header += f"  • Nodos explorados: {explored:,} de {tree_size:,} del árbol completo\n"
+                    header += f"  • Ramas podadas por la cota fraccional: {search['nodes_pruned']:,}\n"
+                    header += f"  • Solución inicial voraz: ${search['greedy_value']:,.2f} COP\n"
+                    if explored > 0:
+                        header += f"  • Reducción: {tree_size / explored:,.0f}x menos nodos\n"
+                
+                # Trace of this run (empty when the result came from the cache)
+                trace_summary = recorder.summary()
+                if trace_summary['events']:
+                    header += f"\n🔍 TRAZA DE LA EXPLORACIÓN:\n"
+                    header += f"  • Eventos registrados: {trace_summary['events']:,}\n"
+                    header += f"  • Mejoras de la mejor solución: {trace_summary['best_updates']:,}\n"
+                    header += f"  • Podas (cota o capacidad): {trace_summary['pruned']:,}\n"
+                    header += f"  • Muestra uniforme de nodos visitados (profundidad → valor):\n"
+                    nodes = [e for e in recorder.sample() if e['event'] == 'node']
+                    step = max(len(nodes) // TRACE_EVENTS_SHOWN, 1)
+                    for event in nodes[::step][:TRACE_EVENTS_SHOWN]:
+                        header += (f"      #{event['seq']:,}: profundidad {event['depth']} → "
+                                   f"${event['value']:,.2f} COP\n")
+                
                 header += "\n" + "=" * 80 + "\n\n"
                 header += "📚 LIBROS SELECCIONADOS:\n\n"
                 self.results_text.insert("1.0", header)
@@ -765,12 +836,22 @@ class BacktrackingReport(ctk.CTkToplevel):
                 
                 footer = "\n" + "=" * 80 + "\n\n"
                 footer += "💡 ALGORITMO UTILIZADO:\n"
-                footer += "  • Tipo: Backtracking (Exploración con retroceso)\n"
+                if sweep is not None:
+                    footer += "  • Tipo: Programación dinámica (barrido de capacidades)\n"
+                else:
+                    footer += "  • Tipo: Backtracking con ramificación y poda (cota fraccional)\n"
                 footer += "  • Problema: Mochila 0/1 (Knapsack Problem)\n"
                 footer += "  • Objetivo: Maximizar valor total\n"
                 footer += "  • Restricción: Peso máximo de estantería\n"
-                footer += "  • Complejidad: O(2^n) con poda efectiva\n"
-                footer += "  • Garantía: Solución óptima global\n"
+                if sweep is not None:
+                    footer += f"  • Complejidad: O(n · W), W = capacidad / {sweep.resolution} Kg\n"
+                    footer += "  • Garantía: Solución óptima global (pesos en la resolución del barrido)\n"
+                else:
+                    footer += "  • Complejidad: O(2^n) con poda efectiva\n"
+                    if result.get('complete', True):
+                        footer += "  • Garantía: Solución óptima global\n"
+                    else:
+                        footer += f"  • Garantía: A lo sumo {result['gap'] * 100:.2f}% por debajo del óptimo\n"
                 self.results_text.insert("end", footer)
             
             logger.info(f"Reporte de backtracking cargado: {books_count} libros, valor ${max_value:,.2f}")
@@ -894,7 +975,7 @@ class BacktrackingReport(ctk.CTkToplevel):
             
             self.max_capacity = new_capacity
             logger.info(f"Capacidad actualizada a {self.max_capacity} Kg")
-            self._load_report()
+            self._load_report(use_sweep=True)
             
         except ValueError as e:
             messagebox.showerror(
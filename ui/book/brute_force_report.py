@@ -171,6 +171,7 @@ See Also:
     - ui.main_menu: Entry point for opening this window
 """
 
+import threading
 import customtkinter as ctk
 from tkinter import messagebox
 from typing import Optional
@@ -180,6 +181,7 @@ from controllers.book_controller import BookController
 from ui import theme
 from ui import widget_factory as wf
 from utils.logger import LibraryLogger
+from utils.algorithms.tracing import TraceRecorder
 
 logger = LibraryLogger.get_logger(__name__)
 
@@ -188,6 +190,40 @@ SUCCESS_COLOR = "#2ECC71"  # Green for success
 ERROR_COLOR = "#E74C3C"    # Red for errors
 CARD_BG_COLOR = "#F5F5F5"  # Light gray for cards
 
+# At most this many risky combinations are written to the on-disk result
+# store (descending-position order, 24 bytes each: sets with the heaviest
+# books first, not sorted by total); the exact total and the excess
+# histogram always cover all of them
+MAX_STORED_COMBINATIONS = 5_000_000
+
+# Combinations shown per page (only the visible page is read from disk)
+PAGE_SIZE = 50
+
+# Milliseconds between checks of the background worker (analysis and store writer)
+STORE_POLL_MS = 100
+
+# Above this many pair sums (n(n-1)/2, about 1000 books) the risky total is
+# estimated by random sampling (Monte Carlo, with a 95% confidence interval)
+# instead of counted exactly. Every histogram pass sorts and bisects all
+# pair sums: at this size one pass takes ~0.4 s and ~40 MB, the full
+# histogram a few seconds; at 3000 books it took 40 s and 166 MB
+EXACT_COUNT_MAX_PAIR_SUMS = 500_000
+
+# Relative half-width targeted by that estimate (±10% of the count), so a
+# rare risk is not reported from a handful of sampled hits
+ESTIMATE_RELATIVE_PRECISION = 0.1
+
+# Seconds the excess histogram may spend on bin edges; past it the
+# remaining combinations are grouped in one open-ended bin
+HISTOGRAM_TIME_BUDGET = 5.0
+
+# Heaviest risky combinations summarized above the paged listing
+TOP_HEAVIEST_SHOWN = 5
+
+# Pruning trace of the listing: counters only, no events kept in memory
+TRACE_LAST_EVENTS = 0
+TRACE_SAMPLE_SIZE = 0
+
 
 class BruteForceReport(ctk.CTkToplevel):
     """Brute force algorithm visualization for risky 4-book combinations detection.
@@ -359,6 +395,18 @@ class BruteForceReport(ctk.CTkToplevel):
         
         self.controller = BookController()
         self.threshold = 8.0  # Default shelf capacity
+
+        # Listing state: cancel token and worker thread writing the result
+        # store, the open (memory-mapped) store and the visible page
+        self._stream_cancel: Optional[threading.Event] = None
+        self._store_thread: Optional[threading.Thread] = None
+        self._store_outcome: dict = {}
+        self._analysis_shown = False
+        self._store = None
+        self._page_offset = 0
+        self._results_header = ""
+        self._stream_progress = 0.0
+        self._stream_trace = TraceRecorder(TRACE_LAST_EVENTS, TRACE_SAMPLE_SIZE)
         
         # Window configuration
         self.title("🔍 Análisis de Combinaciones Riesgosas - Fuerza Bruta")
@@ -572,13 +620,39 @@ class BruteForceReport(ctk.CTkToplevel):
         stats_inner.grid_columnconfigure(1, weight=1)
         
         # Scrollable results frame
-        results_label = ctk.CTkLabel(
+        self.results_label = ctk.CTkLabel(
             main_frame, 
             text="Combinaciones Riesgosas Encontradas:",
             font=theme.get_font(self, size=14, weight="bold"),
             text_color=theme.TEXT_COLOR
         )
-        results_label.pack(anchor="w", pady=(0, 5))
+        self.results_label.pack(anchor="w", pady=(0, 5))
+        
+        # Pager over the on-disk result store
+        pager_frame = ctk.CTkFrame(main_frame, fg_color=theme.BG_COLOR)
+        pager_frame.pack(fill="x", pady=(0, 5))
+        
+        self.btn_prev_page = wf.create_small_button(
+            pager_frame,
+            "◀ Anterior",
+            command=self._prev_page
+        )
+        self.btn_prev_page.pack(side="left", padx=5)
+        
+        self.lbl_page = ctk.CTkLabel(
+            pager_frame,
+            text="Página -",
+            font=theme.get_font(self, size=12),
+            text_color=theme.TEXT_COLOR
+        )
+        self.lbl_page.pack(side="left", padx=10)
+        
+        self.btn_next_page = wf.create_small_button(
+            pager_frame,
+            "Siguiente ▶",
+            command=self._next_page
+        )
+        self.btn_next_page.pack(side="left", padx=5)
         
         self.results_text = ctk.CTkTextbox(
             main_frame,
@@ -638,10 +712,19 @@ class BruteForceReport(ctk.CTkToplevel):
                - Call controller.count_possible_combinations()
                - Returns C(n,4) using factorial formula
             
-            3. Brute Force Execution:
-               - Call controller.find_risky_book_combinations(threshold)
-               - Returns list of risky combination dictionaries
-               - Count risky combinations (m)
+            3. Risky Combination Analysis (worker thread, _write_store):
+               - Call controller.get_risky_combination_histogram(threshold,
+                 time_budget=HISTOGRAM_TIME_BUDGET, cancel)
+               - Exact risky count (m) and excess histogram, no enumeration
+               - Above EXACT_COUNT_MAX_PAIR_SUMS pair sums, call
+                 controller.estimate_risky_book_combinations(threshold)
+                 instead (sampled estimate with confidence interval)
+               - Call controller.open_risky_result_store(threshold, cancel,
+                 progress, limit=MAX_STORED_COMBINATIONS) in the same thread
+                 (results spilled to a memory-mapped file)
+               - _poll_store (Tk main loop, after()) shows the numbers when
+                 they arrive, then one page at a time with
+                 controller.get_risky_result_page()
             
             4. Statistics Update:
                - Update total_books label
@@ -657,7 +740,9 @@ class BruteForceReport(ctk.CTkToplevel):
                - Return early (no detailed results)
             
             7. Format Detailed Results:
-               - Insert header with count
+               - Insert header with count, histogram and the
+                 TOP_HEAVIEST_SHOWN heaviest combinations (best-first
+                 search, controller.find_top_risky_book_combinations)
                - Iterate through risky combinations
                - Format each combination with books details
                - Insert into textbox
@@ -673,8 +758,14 @@ class BruteForceReport(ctk.CTkToplevel):
             # Count combinations
             total = controller.count_possible_combinations()  # Returns int
             
-            # Find risky combinations
-            risky = controller.find_risky_book_combinations(threshold)  # Returns list[dict]
+            # Worker thread: exact count + histogram, then spill the combinations to disk
+            histogram = controller.get_risky_combination_histogram(
+                threshold, time_budget=HISTOGRAM_TIME_BUDGET, cancel=cancel)  # Returns dict
+            estimate = controller.estimate_risky_book_combinations(
+                threshold, precision=None, relative_precision=ESTIMATE_RELATIVE_PRECISION)  # Large catalogs
+            top = controller.find_top_risky_book_combinations(TOP_HEAVIEST_SHOWN, threshold)
+            store = controller.open_risky_result_store(threshold, cancel, progress, limit)
+            page = controller.get_risky_result_page(store, offset, PAGE_SIZE)
             ```
         
         Result Data Structure:
@@ -810,48 +901,37 @@ class BruteForceReport(ctk.CTkToplevel):
             # Count total combinations
             total_combinations = self.controller.count_possible_combinations()
             
-            # Run brute force algorithm
-            risky_combinations = self.controller.find_risky_book_combinations(self.threshold)
-            risky_count = len(risky_combinations)
-            
-            # Update statistics
+            # Update statistics (the risky total arrives from the worker thread)
             self.lbl_total_books.configure(text=f"📚 Total de libros: {total_books}")
             self.lbl_combinations.configure(text=f"🔢 Combinaciones a explorar: {total_combinations:,}")
             self.lbl_risky_found.configure(
-                text=f"⚠️ Combinaciones riesgosas: {risky_count}",
-                text_color=ERROR_COLOR if risky_count > 0 else SUCCESS_COLOR
+                text="⚠️ Combinaciones riesgosas: calculando...",
+                text_color=theme.TEXT_COLOR
             )
             self.lbl_threshold.configure(text=f"⚖️ Umbral: {self.threshold} Kg")
             
+            # Stop any analysis or listing still running and close the previous store
+            self._cancel_stream()
+            
             # Clear previous results
             self.results_text.delete("1.0", "end")
+            self.lbl_page.configure(text="Página -")
+            self._results_header = ""
+            self._analysis_shown = False
             
-            # Display results
-            if risky_count == 0:
-                msg = "✅ ¡Excelente! No se encontraron combinaciones riesgosas.\n\n"
-                msg += "Todas las posibles combinaciones de 4 libros están dentro del límite seguro.\n"
-                msg += f"Todas las combinaciones pesan menos de {self.threshold} Kg.\n"
-                self.results_text.insert("1.0", msg)
-            else:
-                header = f"⚠️ Se encontraron {risky_count} combinaciones riesgosas:\n"
-                header += "=" * 80 + "\n\n"
-                self.results_text.insert("1.0", header)
-                
-                for idx, combo in enumerate(risky_combinations, 1):
-                    combo_text = f"Combinación #{idx}:\n"
-                    combo_text += f"  📊 Peso Total: {combo['total_weight']:.2f} Kg\n"
-                    combo_text += f"  ⚠️ Excede por: {combo['excess']:.2f} Kg\n"
-                    combo_text += f"  📚 Libros:\n"
-                    
-                    for i, book in enumerate(combo['books'], 1):
-                        combo_text += f"    {i}. [{book['id']}] {book['title']}\n"
-                        combo_text += f"       Autor: {book['author']}\n"
-                        combo_text += f"       Peso: {book['weight']:.2f} Kg\n"
-                    
-                    combo_text += "\n" + "-" * 80 + "\n\n"
-                    self.results_text.insert("end", combo_text)
-            
-            logger.info(f"Reporte de fuerza bruta cargado: {risky_count} combinaciones riesgosas")
+            # Count, histogram and store run in a worker thread; _poll_store shows them
+            cancel = threading.Event()
+            self._stream_cancel = cancel
+            self._stream_progress = 0.0
+            self._stream_trace = TraceRecorder(TRACE_LAST_EVENTS, TRACE_SAMPLE_SIZE)
+            self._store_outcome = {}
+            self._store_thread = threading.Thread(
+                target=self._write_store,
+                args=(self.threshold, total_books, cancel, self._store_outcome, self._stream_trace),
+                daemon=True
+            )
+            self._store_thread.start()
+            self._poll_store(cancel)
             
         except Exception as e:
             logger.error(f"Error al cargar reporte de fuerza bruta: {e}")
@@ -860,6 +940,233 @@ class BruteForceReport(ctk.CTkToplevel):
                 f"No se pudo cargar el reporte.\n\nError: {str(e)}"
             )
     
+    def _analyze_risk(self, threshold: float, total_books: int, cancel: threading.Event) -> dict:
+        """Worker thread: heaviest combinations plus the exact or estimated risky total."""
+        # Most dangerous sets first (best-first search, also tells whether any exists)
+        top = self.controller.find_top_risky_book_combinations(TOP_HEAVIEST_SHOWN, threshold)
+        analysis = {'top': top, 'histogram': None, 'estimate': None}
+        if not top:
+            return analysis
+        
+        if total_books * (total_books - 1) // 2 > EXACT_COUNT_MAX_PAIR_SUMS:
+            # Sampled estimate with confidence interval (cost independent of n)
+            analysis['estimate'] = self.controller.estimate_risky_book_combinations(
+                threshold, precision=None, relative_precision=ESTIMATE_RELATIVE_PRECISION
+            )
+        else:
+            # Exact totals and excess histogram without enumerating (O(n² log n))
+            analysis['histogram'] = self.controller.get_risky_combination_histogram(
+                threshold, time_budget=HISTOGRAM_TIME_BUDGET, cancel=cancel
+            )
+        return analysis
+    
+    def _show_analysis(self, analysis: dict):
+        """Show the risky total and the results header computed by the worker thread."""
+        top = analysis['top']
+        histogram = analysis['histogram']
+        estimate = analysis['estimate']
+        
+        if histogram is not None:
+            risky_count = histogram['risky_count']
+            risky_text = f"{risky_count:,}"
+        elif estimate is not None:
+            risky_count = estimate['estimated_count']
+            risky_text = (
+                f"≈{risky_count:,} ({estimate['count_low']:,} - {estimate['count_high']:,}, "
+                f"{estimate['confidence']:.0%})"
+            )
+        else:
+            risky_count = 0
+            risky_text = "0"
+        
+        self.lbl_risky_found.configure(
+            text=f"⚠️ Combinaciones riesgosas: {risky_text}",
+            text_color=ERROR_COLOR if top else SUCCESS_COLOR
+        )
+        
+        # Display results
+        if not top:
+            msg = "✅ ¡Excelente! No se encontraron combinaciones riesgosas.\n\n"
+            msg += "Todas las posibles combinaciones de 4 libros están dentro del límite seguro.\n"
+            msg += f"Todas las combinaciones pesan menos de {self.threshold} Kg.\n"
+            self.results_text.insert("1.0", msg)
+        else:
+            header = f"⚠️ Se encontraron {risky_text} combinaciones riesgosas:\n"
+            header += "=" * 80 + "\n\n"
+            if histogram is not None:
+                header += "📈 Distribución del exceso sobre el umbral:\n"
+                for bin_info in histogram['bins']:
+                    upper = f"{bin_info['to']:.2f}" if bin_info['to'] is not None else "∞"
+                    header += f"  ({bin_info['from']:.2f}, {upper}] Kg: {bin_info['count']:,}\n"
+                if not histogram['complete']:
+                    header += (
+                        f"   ℹ️ Límite de {HISTOGRAM_TIME_BUDGET:.0f} s alcanzado: el último intervalo "
+                        f"agrupa el resto.\n"
+                    )
+            else:
+                header += (
+                    f"🎲 Estimación por muestreo: {estimate['fraction']:.4%} de las combinaciones "
+                    f"({estimate['low']:.4%} - {estimate['high']:.4%}, "
+                    f"{estimate['samples']:,} muestras)\n"
+                )
+                if not estimate['converged']:
+                    header += (
+                        f"   ⚠️ Riesgo muy poco frecuente: no se alcanzó la precisión de "
+                        f"±{ESTIMATE_RELATIVE_PRECISION:.0%} con el máximo de muestras.\n"
+                    )
+            header += "\n"
+            
+            header += f"🔝 Las {len(top)} combinaciones más pesadas:\n"
+            for combo in top:
+                ids = ", ".join(str(book['id']) for book in combo['books'])
+                header += f"  {combo['total_weight']:.2f} Kg (+{combo['excess']:.2f}): {ids}\n"
+            header += "\n"
+            if risky_count > MAX_STORED_COMBINATIONS:
+                header += (
+                    f"ℹ️ Se guardan las primeras {MAX_STORED_COMBINATIONS:,} combinaciones "
+                    f"de {risky_text} (empezando por los libros más pesados; no ordenadas "
+                    f"por peso total).\n"
+                )
+            header += "\n"
+            self._results_header = header
+            self.results_text.insert("1.0", header)
+        
+        logger.info(f"Reporte de fuerza bruta cargado: {risky_count} combinaciones riesgosas")
+    
+    def _set_stream_progress(self, fraction: float):
+        """Progress callback of the streaming generator (fraction of the outer loop)."""
+        self._stream_progress = fraction
+
+    def _write_store(self, threshold: float, total_books: int, cancel: threading.Event,
+                     outcome: dict, trace: TraceRecorder):
+        """Worker thread: analyze the risk, then spill the risky combinations to disk.
+        
+        Runs off the Tk main loop (no widget access); the analysis, the store
+        or the error is left in `outcome` for _poll_store.
+        """
+        try:
+            analysis = self._analyze_risk(threshold, total_books, cancel)
+            outcome['analysis'] = analysis
+            if not analysis['top'] or cancel.is_set():
+                return
+            outcome['store'] = self.controller.open_risky_result_store(
+                threshold,
+                cancel=cancel,
+                progress=self._set_stream_progress,
+                limit=MAX_STORED_COMBINATIONS,
+                trace=trace
+            )
+        except Exception as e:
+            outcome['error'] = e
+
+    def _poll_store(self, cancel: threading.Event):
+        """Show the analysis once the worker has it, progress while the store is written, then the first page."""
+        if cancel.is_set():
+            return
+        analysis = self._store_outcome.get('analysis')
+        if analysis is not None and not self._analysis_shown:
+            self._analysis_shown = True
+            self._show_analysis(analysis)
+        if self._store_thread is not None and self._store_thread.is_alive():
+            if analysis is None:
+                text = "Combinaciones Riesgosas Encontradas: calculando..."
+            else:
+                text = f"Combinaciones Riesgosas Encontradas: guardando en disco ({self._stream_progress:.0%})..."
+            self.results_label.configure(text=text)
+            self.after(STORE_POLL_MS, lambda: self._poll_store(cancel))
+            return
+        
+        if 'error' in self._store_outcome:
+            error = self._store_outcome['error']
+            if analysis is None:
+                logger.error(f"Error al cargar reporte de fuerza bruta: {error}")
+                self.results_label.configure(text="Combinaciones Riesgosas Encontradas:")
+                messagebox.showerror("Error", f"No se pudo cargar el reporte.\n\nError: {str(error)}")
+            else:
+                logger.error(f"Error al guardar combinaciones riesgosas: {error}")
+                self.results_label.configure(text="Combinaciones Riesgosas Encontradas: error al guardar")
+            return
+        
+        if 'store' not in self._store_outcome:
+            # No risky combination: nothing to list
+            self.results_label.configure(text="Combinaciones Riesgosas Encontradas: 0")
+            return
+        
+        self._store = self._store_outcome['store']
+        self._page_offset = 0
+        text = f"Combinaciones Riesgosas Encontradas: {len(self._store):,} guardadas"
+        # A store reused from the cache ran no enumeration: no pruning to report
+        trace_summary = self._stream_trace.summary()
+        if trace_summary['events']:
+            text += f" ({trace_summary['skipped']:,} combinaciones descartadas por poda sin revisarlas)"
+        self.results_label.configure(text=text)
+        self._show_page()
+
+    def _show_page(self):
+        """Render only the current page of the result store."""
+        if self._store is None:
+            return
+        total = len(self._store)
+        pages = max((total + PAGE_SIZE - 1) // PAGE_SIZE, 1)
+        page = self._page_offset // PAGE_SIZE + 1
+        
+        self.results_text.delete("1.0", "end")
+        self.results_text.insert("1.0", self._results_header)
+        combos = self.controller.get_risky_result_page(self._store, self._page_offset, PAGE_SIZE)
+        for idx, combo in enumerate(combos, self._page_offset + 1):
+            self.results_text.insert("end", self._format_combination(idx, combo))
+        
+        self.lbl_page.configure(text=f"Página {page:,} de {pages:,} ({total:,} combinaciones)")
+
+    def _prev_page(self):
+        """Show the previous page of the result store."""
+        if self._store is not None and self._page_offset > 0:
+            self._page_offset = max(self._page_offset - PAGE_SIZE, 0)
+            self._show_page()
+
+    def _next_page(self):
+        """Show the next page of the result store."""
+        if self._store is not None and self._page_offset + PAGE_SIZE < len(self._store):
+            self._page_offset += PAGE_SIZE
+            self._show_page()
+
+    @staticmethod
+    def _format_combination(idx: int, combo: dict) -> str:
+        """Format one risky combination for the results textbox."""
+        combo_text = f"Combinación #{idx}:\n"
+        combo_text += f"  📊 Peso Total: {combo['total_weight']:.2f} Kg\n"
+        combo_text += f"  ⚠️ Excede por: {combo['excess']:.2f} Kg\n"
+        combo_text += f"  📚 Libros:\n"
+        
+        for i, book in enumerate(combo['books'], 1):
+            combo_text += f"    {i}. [{book['id']}] {book['title']}\n"
+            combo_text += f"       Autor: {book['author']}\n"
+            combo_text += f"       Peso: {book['weight']:.2f} Kg\n"
+        
+        combo_text += "\n" + "-" * 80 + "\n\n"
+        return combo_text
+
+    def _cancel_stream(self):
+        """Stop the store writer (if running) and close the open result store."""
+        if self._stream_cancel is not None:
+            self._stream_cancel.set()
+        if self._store_thread is not None:
+            # The writer polls the cancel token, so it stops promptly
+            self._store_thread.join()
+            store = self._store_outcome.get('store')
+            if store is not None and store is not self._store:
+                store.close()
+        if self._store is not None:
+            self._store.close()
+        self._stream_cancel = None
+        self._store_thread = None
+        self._store = None
+
+    def destroy(self):
+        """Stop the store writer and close the result store before closing the window."""
+        self._cancel_stream()
+        super().destroy()
+
     def _change_threshold(self):
         """Open input dialog to change weight threshold and recalculate results.
         
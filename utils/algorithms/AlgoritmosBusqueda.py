@@ -5,6 +5,13 @@ Recursive search algorithms used by the library management system:
 1. Binary Search: by ISBN over a sorted inventory (O(log n))
 2. Linear Search: by Title or Author over the general inventory (O(n))
 
+Execution model:
+----------------
+Both algorithms are defined recursively, but they are executed as loops
+(each iteration is one recursive call of the definition). This keeps the
+results identical while avoiding RecursionError and call-frame overhead on
+large inventories. Pass ``trace=callable`` to observe every simulated call.
+
 Binary Search - Critical Use:
 -----------------------------
 The binary search function is critical for checking whether a returned book
@@ -22,14 +29,29 @@ Linear Search - Use:
 Use the linear search to find books by partial Title or Author in the general
 inventory. It does not require sorting and is useful for flexible text searches.
 
+Range Search - Key Arrays:
+--------------------------
+busqueda_binaria_rango() works on the precomputed canonical ISBN key array
+kept next to the sorted inventory and returns the full range of matching
+positions using bisect (lower/upper bound).
+
 Author: Library Management System
 Date: 2025-12-03
 """
 
+from bisect import bisect_left, bisect_right
+
+from utils.algorithms.AlgoritmosOrdenamiento import clave_isbn
 
-def busqueda_binaria(inventario_ordenado, isbn_buscado, inicio=0, fin=None):
+
+def busqueda_binaria(inventario_ordenado, isbn_buscado, inicio=0, fin=None, trace=None):
     """
-    Search for a book by ISBN in a sorted inventory using recursive binary search.
+    Search for a book by ISBN in a sorted inventory using binary search.
+
+    The algorithm is the classic recursive binary search, executed as a loop:
+    every iteration corresponds to one recursive call of the textbook version
+    (same midpoints, same probes, same result) but without growing the Python
+    call stack.
 
     Important precondition:
     - The inventory MUST be sorted by ISBN prior to calling this function. If the
@@ -45,13 +67,16 @@ def busqueda_binaria(inventario_ordenado, isbn_buscado, inicio=0, fin=None):
         The ISBN string to search for.
 
     inicio : int, optional
-        The starting index for the search range (default: 0). This is intended for
-        internal recursive calls and should not be modified by external callers.
+        The starting index for the search range (default: 0).
 
     fin : int, optional
-        The ending index for the search range (default: len(inventario)-1). This
-        is intended for internal recursive calls and should not be modified by
-        external callers.
+        The ending index for the search range (default: len(inventario)-1).
+
+    trace : callable, optional
+        Step-trace hook. When given, it is called once per simulated recursive
+        call with a dict ``{'depth', 'inicio', 'fin', 'medio', 'isbn_medio'}``
+        (``medio``/``isbn_medio`` are None on the empty-range base case). Used
+        by the teaching UIs to show the recursion.
 
     Returns
     -------
@@ -75,46 +100,58 @@ def busqueda_binaria(inventario_ordenado, isbn_buscado, inicio=0, fin=None):
     ... else:
     ...     print("Book not found")
     """
-    # If this is the first call, determine the list size
-    if fin is None:
-        fin = len(inventario_ordenado) - 1
-    
     # Base case: empty list
     if not inventario_ordenado:
         return -1
-    
-    # Base case: sublist has no elements
-    if inicio > fin:
-        return -1
-    
-    # Compute the midpoint
-    medio = (inicio + fin) // 2
-    
-    # Get the ISBN at the midpoint
-    isbn_medio = inventario_ordenado[medio].get_isbn()
-    
-    # Base case: element found
-    if isbn_medio == isbn_buscado:
-        return medio
-    
-    # Recursive case: search left half (move to medio - 1)
-    elif isbn_medio > isbn_buscado:
-        return busqueda_binaria(inventario_ordenado, isbn_buscado, inicio, medio - 1)
-    
-    # Recursive case: search right half (move to medio + 1)
-    else:
-        return busqueda_binaria(inventario_ordenado, isbn_buscado, medio + 1, fin)
-
-
-def busqueda_lineal(inventario, criterio_busqueda, indice=0):
+
+    # If this is the first call, determine the list size
+    if fin is None:
+        fin = len(inventario_ordenado) - 1
+
+    profundidad = 0
+    while True:
+        # Base case: sublist has no elements
+        if inicio > fin:
+            if trace is not None:
+                trace({'depth': profundidad, 'inicio': inicio, 'fin': fin,
+                       'medio': None, 'isbn_medio': None})
+            return -1
+
+        # Compute the midpoint
+        medio = (inicio + fin) // 2
+
+        # Get the ISBN at the midpoint
+        isbn_medio = inventario_ordenado[medio].get_isbn()
+
+        if trace is not None:
+            trace({'depth': profundidad, 'inicio': inicio, 'fin': fin,
+                   'medio': medio, 'isbn_medio': isbn_medio})
+
+        # Base case: element found
+        if isbn_medio == isbn_buscado:
+            return medio
+
+        # "Recursive" case: search left half (move to medio - 1)
+        if isbn_medio > isbn_buscado:
+            fin = medio - 1
+        # "Recursive" case: search right half (move to medio + 1)
+        else:
+            inicio = medio + 1
+
+        profundidad += 1
+
+
+def busqueda_lineal(inventario, criterio_busqueda, indice=0, trace=None):
     """
-    Search inventory recursively by partial Title or Author using linear search.
+    Search inventory by partial Title or Author using linear search.
 
     Characteristics
     ---------------
     - Does NOT require the inventory to be sorted.
     - Performs partial, case- and accent-insensitive matching.
-    - Implemented recursively as a simple linear scan.
+    - Follows the recursive linear-search definition (one element per step,
+      advance to ``indice + 1``) but runs as a loop, so it works on
+      inventories of any size without hitting ``RecursionError``.
 
     Parameters
     ----------
@@ -127,8 +164,12 @@ def busqueda_lineal(inventario, criterio_busqueda, indice=0):
         supported (e.g. "Quijote" matches "Don Quijote de la Mancha").
 
     indice : int, optional
-        Current index used by recursion (default: 0). Do not change when calling
-        externally; this parameter is for internal recursion only.
+        Index where the scan starts (default: 0). Callers use it to resume the
+        search right after a previous match.
+
+    trace : callable, optional
+        Step-trace hook called once per simulated recursive call with a dict
+        ``{'depth', 'indice', 'match'}``.
 
     Returns
     -------
@@ -139,44 +180,128 @@ def busqueda_lineal(inventario, criterio_busqueda, indice=0):
     Complexity
     ----------
     Time: O(n) worst-case (scans all elements).
-    Space: O(n) due to recursion depth in the worst case.
+    Space: O(1) extra space (no recursion stack).
 
     Notes
     -----
     This function relies on helper routines to normalize text for
     case- and accent-insensitive comparisons. See: utils.search_helpers.normalizar_texto()
     """
-    # Base case: reached end of list without finding element
-    if indice >= len(inventario):
-        return -1
-    
-    # Get current inventory's book
-    libro_actual = inventario[indice].get_book()
-    
-    # If there is no book at this inventory position, continue
-    if libro_actual is None:
-        # Recursive case: continue scanning the rest of the list
-        return busqueda_lineal(inventario, criterio_busqueda, indice + 1)
-    
-    # Get current book's title and author
-    titulo = libro_actual.get_title() or ""
-    autor = libro_actual.get_author() or ""
-    
     # Import helper to normalize text (case and accent insensitive)
     from utils.search_helpers import normalizar_texto
-    
-    # Normalize strings for comparison
+
+    # The criterion does not change between steps: normalize it only once
     criterio_norm = normalizar_texto(criterio_busqueda)
-    titulo_norm = normalizar_texto(titulo)
-    autor_norm = normalizar_texto(autor)
-    
-    # Base case: found the element (partial match in title or author)
-    if criterio_norm in titulo_norm or criterio_norm in autor_norm:
-        return indice
-    
-    # Recursive case: continue searching the remainder of the list
-    return busqueda_lineal(inventario, criterio_busqueda, indice + 1)
-
-
-__all__ = ['busqueda_binaria', 'busqueda_lineal']
+
+    inicio = indice
+    total = len(inventario)
+    while indice < total:
+        # Get current inventory's book
+        libro_actual = inventario[indice].get_book()
+
+        encontrado = False
+        if libro_actual is not None:
+            # Normalize title and author for comparison
+            titulo_norm = normalizar_texto(libro_actual.get_title() or "")
+            autor_norm = normalizar_texto(libro_actual.get_author() or "")
+            encontrado = criterio_norm in titulo_norm or criterio_norm in autor_norm
+
+        if trace is not None:
+            trace({'depth': indice - inicio, 'indice': indice, 'match': encontrado})
+
+        # Base case: found the element (partial match in title or author)
+        if encontrado:
+            return indice
+
+        # "Recursive" case: continue with the remainder of the list
+        indice += 1
+
+    # Base case: reached end of list without finding element
+    return -1
+
+
+def limite_inferior(claves_ordenadas, clave):
+    """
+    Return the first position whose key is >= `clave` (lower bound).
+
+    Parameters
+    ----------
+    claves_ordenadas : list
+        Keys sorted in ascending order (e.g. the canonical ISBN keys kept
+        next to ``inventory_sorted``).
+    clave : Any
+        Key to locate. Must be comparable with the elements of the list.
+
+    Returns
+    -------
+    int
+        Insertion point in ``[0, len(claves_ordenadas)]``.
+    """
+    return bisect_left(claves_ordenadas, clave)
+
+
+def limite_superior(claves_ordenadas, clave):
+    """
+    Return the first position whose key is > `clave` (upper bound).
+
+    Parameters
+    ----------
+    claves_ordenadas : list
+        Keys sorted in ascending order.
+    clave : Any
+        Key to locate.
+
+    Returns
+    -------
+    int
+        Insertion point in ``[0, len(claves_ordenadas)]``.
+    """
+    return bisect_right(claves_ordenadas, clave)
+
+
+def busqueda_binaria_rango(claves_ordenadas, isbn_buscado):
+    """
+    Find the full range of positions holding `isbn_buscado` in a key array.
+
+    Unlike busqueda_binaria (which returns one arbitrary matching index and
+    calls get_isbn() on every probe), this function works on a precomputed
+    array of canonical ISBN keys (see AlgoritmosOrdenamiento.clave_isbn) and
+    uses two bisections, so every probe is a plain tuple comparison.
+
+    Parameters
+    ----------
+    claves_ordenadas : list
+        Canonical ISBN keys, sorted ascending and parallel to the sorted
+        inventory list.
+    isbn_buscado : str
+        The ISBN to search for.
+
+    Returns
+    -------
+    Tuple[int, int]
+        Half-open range ``(inicio, fin)``: positions ``inicio <= i < fin`` match.
+        The range is empty (``inicio == fin``) when the ISBN is not present.
+
+    Complexity
+    ----------
+    Time: O(log n). Space: O(1).
+
+    Example
+    -------
+    >>> inicio, fin = busqueda_binaria_rango(claves, "9780140449134")
+    >>> coincidencias = inventario_ordenado[inicio:fin]
+    """
+    clave = clave_isbn(isbn_buscado)
+    inicio = bisect_left(claves_ordenadas, clave)
+    fin = bisect_right(claves_ordenadas, clave, inicio)
+    return inicio, fin
+
+
+__all__ = [
+    'busqueda_binaria',
+    'busqueda_lineal',
+    'limite_inferior',
+    'limite_superior',
+    'busqueda_binaria_rango',
+]
 
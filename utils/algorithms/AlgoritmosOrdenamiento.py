@@ -9,6 +9,8 @@ behavior and to ensure stable, predictable results for the inventory.
 
 Highlights:
 - Merge Sort: stable O(n log n) sorting
+- Bottom-up Merge Sort: iterative variant over precomputed keys with one
+    scratch buffer (merge_sort_bottom_up_indices)
 - Sorts Book objects by price in ascending order
 - Modular, reusable code suitable for reporting and debugging
 
@@ -34,16 +36,48 @@ from utils.logger import LibraryLogger
 # Configurar logger
 logger = LibraryLogger.get_logger(__name__)
 
-def _comparar_isbn_mayor(isbn1, isbn2):
+def clave_isbn(isbn):
     """
-    Compare two ISBNs preferring numeric comparison when possible.
+    Return the canonical sort key of an ISBN.
 
     Purpose:
-    - If both ISBNs are purely numeric, compare them as integers (numeric
-      ordering). This avoids incorrect lexicographic ordering where "2" > "123".
-    - If either ISBN contains non-numeric characters (dashes, letters), fall
-      back to standard lexicographic comparison. This preserves compatibility
-      with common ISBN formats such as "978-...".
+    - Purely numeric ISBNs are ordered as integers (numeric ordering). This
+      avoids incorrect lexicographic ordering where "2" > "123".
+    - ISBNs containing non-numeric characters (dashes, letters) keep standard
+      lexicographic ordering and are placed after the numeric ones, so mixed
+      lists still have a well-defined total order.
+
+    The key is computed once per element, which lets sorting and searching
+    compare plain tuples instead of converting strings on every comparison.
+
+    Parameters
+    ----------
+    isbn : str
+        ISBN value.
+
+    Returns
+    -------
+    tuple
+        ``(0, int(isbn), isbn)`` for numeric ISBNs, ``(1, 0, str(isbn))``
+        otherwise. The original string is the last component, so two keys
+        are equal only when the ISBN strings are equal ("0123" != "123").
+
+    Example
+    -------
+    >>> clave_isbn("9780140449134") < clave_isbn("978-0-14")
+    True
+    >>> clave_isbn("2") < clave_isbn("123")
+    True
+    """
+    try:
+        return (0, int(isbn), str(isbn))
+    except (ValueError, TypeError):
+        return (1, 0, '' if isbn is None else str(isbn))
+
+
+def _comparar_isbn_mayor(isbn1, isbn2):
+    """
+    Compare two ISBNs using their canonical keys.
 
     Parameters
     ----------
@@ -53,17 +87,12 @@ def _comparar_isbn_mayor(isbn1, isbn2):
     Returns
     -------
     bool
-        True if isbn1 > isbn2 (numeric comparison when applicable), otherwise False.
+        True if isbn1 sorts after isbn2 (see clave_isbn), otherwise False.
     """
-    try:
-        # Try numeric conversion; if both are numeric then compare as integers
-        return int(isbn1) > int(isbn2)
-    except (ValueError, TypeError):
-        # Fallback to lexicographic comparison for non-numeric ISBNs
-        return isbn1 > isbn2
+    return clave_isbn(isbn1) > clave_isbn(isbn2)
 
 
-def insercion_ordenada(lista_libros):
+def insercion_ordenada(lista_libros, claves=None):
     """
     Sort an inventory list in-place using Insertion Sort by ISBN ascending.
 
@@ -71,6 +100,9 @@ def insercion_ordenada(lista_libros):
     -------
     This insertion sort implementation modifies the input list in-place.
     It is simple, stable, and efficient for small or nearly-sorted lists.
+    The canonical ISBN key of every element is computed once before sorting
+    (see clave_isbn) and moved together with its element, so the inner loop
+    compares precomputed tuples instead of calling get_isbn() and int().
 
     Parameters
     ----------
@@ -78,6 +110,11 @@ def insercion_ordenada(lista_libros):
         A list of Inventory objects. Each object must implement get_isbn() and
         return an ISBN value (string or numeric) used as the sorting key.
 
+    claves : list, optional
+        Output list. When given, it is filled (in-place) with the canonical
+        ISBN keys of the sorted list, position by position. This is the key
+        array used by the bisect-based searches in AlgoritmosBusqueda.
+
     Returns
     -------
     list
@@ -91,29 +128,38 @@ def insercion_ordenada(lista_libros):
     - Sorting small result sets for predictable output
     """
 
-    # Early validation: empty or single-element lists are already sorted
-    if not lista_libros or len(lista_libros) <= 1:
+    # Early validation: an empty list is already sorted
+    if not lista_libros:
+        if claves is not None:
+            claves[:] = []
         return lista_libros
 
+    # Precompute the canonical key of every element (one conversion each)
+    claves_locales = [clave_isbn(inventario.get_isbn()) for inventario in lista_libros]
+
     # Insertion sort: iterate from the second element and insert into the
     # sorted left portion of the list
     for i in range(1, len(lista_libros)):
         # Select the element to insert
         inventario_actual = lista_libros[i]
-        isbn_actual = inventario_actual.get_isbn()
+        clave_actual = claves_locales[i]
 
         # Find the insertion position by shifting larger elements to the right
         j = i - 1
 
-        # While there are elements to the left and they are greater than the
-        # current ISBN, shift them one position to the right. Comparison uses
-        # _comparar_isbn_mayor which prefers numeric comparison when possible.
-        while j >= 0 and _comparar_isbn_mayor(lista_libros[j].get_isbn(), isbn_actual):
+        # While there are elements to the left and their key is greater than
+        # the current key, shift them (and their keys) one position right.
+        while j >= 0 and claves_locales[j] > clave_actual:
             lista_libros[j + 1] = lista_libros[j]
+            claves_locales[j + 1] = claves_locales[j]
             j -= 1
 
         # Insert the current inventory at its correct position
         lista_libros[j + 1] = inventario_actual
+        claves_locales[j + 1] = clave_actual
+
+    if claves is not None:
+        claves[:] = claves_locales
 
     # Return the sorted list (sorting is in-place)
     return lista_libros
@@ -223,6 +269,241 @@ def merge(left: List[Any], right: List[Any]) -> List[Any]:
     return resultado
 
 
+def insertion_sort_indices(claves: List[Any]) -> List[int]:
+    """
+    Return the stable ascending permutation of `claves` using Insertion Sort.
+
+    Key-array variant of insercion_ordenada: it sorts positions instead of
+    objects, so it works for any precomputed key (ISBN keys, prices...).
+
+    Parameters
+    ----------
+    claves : List[Any]
+        Precomputed, mutually comparable keys. The list is not modified.
+
+    Returns
+    -------
+    List[int]
+        Positions of `claves` in ascending key order (ties keep input order).
+
+    Complexity
+    ----------
+    O(n + inversions): O(n) on sorted input, O(n²) worst case.
+    """
+    orden = list(range(len(claves)))
+    for i in range(1, len(orden)):
+        actual = orden[i]
+        clave_actual = claves[actual]
+        j = i - 1
+        while j >= 0 and claves[orden[j]] > clave_actual:
+            orden[j + 1] = orden[j]
+            j -= 1
+        orden[j + 1] = actual
+    return orden
+
+
+def merge_sort_indices(claves: List[Any]) -> List[int]:
+    """
+    Return the stable ascending permutation of `claves` using Merge Sort.
+
+    Key-array variant of merge_sort_books_by_price (same divide-and-conquer
+    structure and the same <= tie rule, so it is stable).
+
+    Parameters
+    ----------
+    claves : List[Any]
+        Precomputed, mutually comparable keys. The list is not modified.
+
+    Returns
+    -------
+    List[int]
+        Positions of `claves` in ascending key order.
+
+    Complexity
+    ----------
+    O(n log n) in all cases.
+    """
+    def ordenar(posiciones):
+        # Base case: 0 or 1 positions are already sorted
+        if len(posiciones) <= 1:
+            return posiciones
+        medio = len(posiciones) // 2
+        izquierda = ordenar(posiciones[:medio])
+        derecha = ordenar(posiciones[medio:])
+
+        resultado = []
+        i = j = 0
+        while i < len(izquierda) and j < len(derecha):
+            # Use <= to guarantee stability: left element comes first on ties
+            if claves[izquierda[i]] <= claves[derecha[j]]:
+                resultado.append(izquierda[i])
+                i += 1
+            else:
+                resultado.append(derecha[j])
+                j += 1
+        resultado.extend(izquierda[i:])
+        resultado.extend(derecha[j:])
+        return resultado
+
+    return ordenar(list(range(len(claves))))
+
+
+def merge_sort_bottom_up_indices(claves: List[Any]) -> List[int]:
+    """
+    Return the stable ascending permutation of `claves` using an iterative
+    bottom-up Merge Sort.
+
+    Same merge rule as merge_sort_books_by_price (<= keeps ties in input
+    order) but without recursion: runs of width 1, 2, 4, ... are merged
+    pass by pass between the working arrays and ONE preallocated scratch
+    buffer (positions and keys move together, so the inner loop compares
+    precomputed keys directly). The two buffers swap roles after every
+    pass instead of building new merged lists. Block copies (runs already
+    in order, and the tail left after a merge) use slice assignment, which
+    creates a short-lived temporary slice but runs at C speed. When two
+    neighbouring runs are already in order they are copied without
+    comparisons, which makes presorted input cheap.
+
+    Parameters
+    ----------
+    claves : List[Any]
+        Precomputed, mutually comparable keys (e.g. prices). The list is not
+        modified.
+
+    Returns
+    -------
+    List[int]
+        Positions of `claves` in ascending key order.
+
+    Complexity
+    ----------
+    O(n log n) time, O(n) extra space (scratch buffer plus temporary
+    slices of at most n elements), O(1) stack.
+    """
+    n = len(claves)
+    origen_pos = list(range(n))
+    origen_cl = list(claves)
+    if n <= 1:
+        return origen_pos
+
+    # Scratch buffer, reused by every pass
+    destino_pos = [0] * n
+    destino_cl = [None] * n
+
+    ancho = 1
+    while ancho < n:
+        for inicio in range(0, n, 2 * ancho):
+            medio = min(inicio + ancho, n)
+            fin = min(inicio + 2 * ancho, n)
+
+            # Single run or runs already in order: copy the block as-is
+            if medio >= fin or origen_cl[medio - 1] <= origen_cl[medio]:
+                destino_pos[inicio:fin] = origen_pos[inicio:fin]
+                destino_cl[inicio:fin] = origen_cl[inicio:fin]
+                continue
+
+            i, j, k = inicio, medio, inicio
+            while i < medio and j < fin:
+                # Use <= to guarantee stability: left element comes first on ties
+                if origen_cl[i] <= origen_cl[j]:
+                    destino_pos[k] = origen_pos[i]
+                    destino_cl[k] = origen_cl[i]
+                    i += 1
+                else:
+                    destino_pos[k] = origen_pos[j]
+                    destino_cl[k] = origen_cl[j]
+                    j += 1
+                k += 1
+
+            # Copy the remaining tail (only one of the two is non-empty)
+            if i < medio:
+                destino_pos[k:fin] = origen_pos[i:medio]
+                destino_cl[k:fin] = origen_cl[i:medio]
+            else:
+                destino_pos[k:fin] = origen_pos[j:fin]
+                destino_cl[k:fin] = origen_cl[j:fin]
+
+        # The merged pass becomes the source of the next one
+        origen_pos, destino_pos = destino_pos, origen_pos
+        origen_cl, destino_cl = destino_cl, origen_cl
+        ancho *= 2
+
+    return origen_pos
+
+
+def merge_sort_books_by_price_bottom_up(lista_libros: List[Any]) -> List[Any]:
+    """
+    Sort a list of Book objects by price with the bottom-up Merge Sort.
+
+    Drop-in alternative to merge_sort_books_by_price: same stable order, but
+    get_price() is called once per book and the sort itself runs over the
+    price array (see merge_sort_bottom_up_indices).
+
+    Parameters
+    ----------
+    lista_libros : List[Any]
+        A list of Book objects implementing get_price().
+
+    Returns
+    -------
+    List[Any]
+        A new list containing the same Book objects sorted by ascending price.
+    """
+    precios = [libro.get_price() for libro in lista_libros]
+    return [lista_libros[i] for i in merge_sort_bottom_up_indices(precios)]
+
+
+def radix_sort_indices(claves: List[int], bits_por_pasada: int = 16) -> List[int]:
+    """
+    Return the stable ascending permutation of integer `claves` using LSD Radix Sort.
+
+    Each pass distributes the positions into 2**bits_por_pasada buckets by one
+    digit of the key, starting from the least significant digit. Because every
+    pass is stable, the final order is sorted by the full key. Suitable for
+    13-digit ISBNs (3 passes of 16 bits) and integer COP prices (1-2 passes).
+
+    Parameters
+    ----------
+    claves : List[int]
+        Non-negative integer keys. The list is not modified.
+    bits_por_pasada : int, optional
+        Digit size in bits (default: 16, i.e. 65536 buckets).
+
+    Returns
+    -------
+    List[int]
+        Positions of `claves` in ascending key order (ties keep input order).
+
+    Raises
+    ------
+    ValueError
+        If a key is negative or not an integer.
+
+    Complexity
+    ----------
+    O(d · (n + 2**bits_por_pasada)) where d = ceil(bits(max key) / bits_por_pasada).
+    """
+    for clave in claves:
+        if not isinstance(clave, int) or isinstance(clave, bool) or clave < 0:
+            raise ValueError("radix sort requires non-negative integer keys")
+
+    orden = list(range(len(claves)))
+    if len(orden) <= 1:
+        return orden
+
+    mascara = (1 << bits_por_pasada) - 1
+    maximo = max(claves)
+    desplazamiento = 0
+    while True:
+        cubetas = [[] for _ in range(mascara + 1)]
+        for posicion in orden:
+            cubetas[(claves[posicion] >> desplazamiento) & mascara].append(posicion)
+        orden = [posicion for cubeta in cubetas for posicion in cubeta]
+        desplazamiento += bits_por_pasada
+        if (maximo >> desplazamiento) == 0:
+            return orden
+
+
 # NOTE:
 # Reporting helper functions (generar_reporte_global,
 # ordenar_y_generar_reporte, verificar_ordenamiento) have been moved to
@@ -230,8 +511,14 @@ def merge(left: List[Any], right: List[Any]) -> List[Any]:
 # algorithms. To use those helpers import them from utils.report_helpers.
 
 __all__ = [
+    'clave_isbn',
     'insercion_ordenada',
     'merge_sort_books_by_price',
     'merge',
+    'insertion_sort_indices',
+    'merge_sort_indices',
+    'merge_sort_bottom_up_indices',
+    'merge_sort_books_by_price_bottom_up',
+    'radix_sort_indices',
 ]
 
@@ -10,14 +10,67 @@ Project Requirement:
     capacity (8 Kg) of a shelf. The algorithm must demonstrate the exploration
     and its execution.
 
+Exact weights:
+    Adding float weights in different orders can round a selection that
+    weighs exactly the capacity (3.3 + 1.1 + 0.7 + 2.2 + 0.7 = 8.0) to just
+    above or below it, so solvers visiting books in different orders would
+    disagree on feasibility. Every exact solver (backtracking, branch and
+    bound, the constrained search and knapsack_mitm) therefore compares
+    weights as integers in units of 10^-d Kg (see weight_units), where d
+    is the largest number of decimals among the weights and the capacity.
+
 Author: Library Management System Team
 Date: 2025
 """
 
+import math
+import time
+from bisect import bisect_right
+from decimal import Decimal
+
+# Weights with more decimals than this are rounded to 10^-MAX_WEIGHT_DECIMALS Kg
+MAX_WEIGHT_DECIMALS = 9
+
+
+def weight_units(weights, max_capacity):
+    """Convert weights and capacity to exact integers in a common unit.
+    
+    The unit is 10^-d Kg, with d the largest number of decimals (of the
+    shortest repr) among the weights and the capacity, at most
+    MAX_WEIGHT_DECIMALS. Sums of the converted weights are exact, so the
+    capacity test gives the same answer whatever the order of the books.
+    
+    Parameters:
+    - weights: List of weights in Kg; None entries are kept as None.
+    - max_capacity: Capacity in Kg.
+    
+    Returns:
+    - (units, capacity_units, scale): integer weights parallel to `weights`,
+      the capacity in the same unit, and the number of units per Kg.
+    
+    Example:
+    >>> weight_units([2.5, 1.25, None], 8.0)
+    ([250, 125, None], 800, 100)
+    """
+    def decimal(value):
+        return Decimal(repr(float(value)))
+    
+    decimals = 0
+    for value in [max_capacity] + weights:
+        if value is not None:
+            decimals = max(decimals, -decimal(value).as_tuple().exponent)
+    scale = 10 ** min(decimals, MAX_WEIGHT_DECIMALS)
+    
+    def to_units(value):
+        return int((decimal(value) * scale).to_integral_value())
+    
+    return [None if w is None else to_units(w) for w in weights], to_units(max_capacity), scale
+
 
 def knapsack_backtracking(index, current_weight, current_value, current_selection,
-                         max_capacity, weights, values, best_solution):
-    """Recursive auxiliary function that explores the decision tree.
+                         max_capacity, weights, values, best_solution, trace=None,
+                         deadline=None):
+    """Explore the include/exclude decision tree of the knapsack problem.
     
     This function implements the backtracking pattern by exploring two branches
     at each decision point:
@@ -46,59 +99,94 @@ def knapsack_backtracking(index, current_weight, current_value, current_selectio
             # Rama 2: NO INCLUIR el libro actual
             backtracking(índice+1, peso_actual, valor_actual, selección_actual)
     
+    Execution:
+        The recursion above is run with an explicit stack of pending calls
+        instead of Python frames. The "include" branch is pushed last so it is
+        explored first, which reproduces the recursive visiting order exactly
+        (same best solution, same tie-breaking) without RecursionError on
+        long book lists.
+    
     Parameters:
     - index: Current index in the book list (0-based)
     - current_weight: Accumulated weight so far (in Kg)
     - current_value: Accumulated value so far (in COP)
     - current_selection: List of indices of books selected in this branch
     - max_capacity: Maximum weight capacity (8 Kg for shelf)
-    - weights: List of book weights (parallel to values)
+    - weights: List of book weights (parallel to values), in the same unit
+               as max_capacity (solve_optimal_shelf passes the exact integer
+               units of weight_units); None marks books that never fit
     - values: List of book prices (parallel to weights)
     - best_solution: Dictionary to store the best solution found (mutable state)
                      Keys: 'max_value', 'selection'
+    - trace: Optional step-trace hook called once per explored node with a
+             dict {'event': 'node', 'depth', 'index', 'weight', 'value',
+             'decision'} where decision is 'include', 'exclude' or None for
+             the root call; also with {'event': 'prune', ...} when an
+             "include" branch exceeds the capacity and {'event': 'best', ...}
+             when the best solution improves (see tracing.TraceRecorder).
+    - deadline: Optional time.perf_counter() value. When it passes, the
+                search stops early and sets best_solution['complete'] = False
+                (best_solution then holds the best leaf found so far).
     
     Returns:
-    - None (updates best_solution dict in place)
+    - None (updates best_solution dict in place; current_selection is left
+      as it was received)
     
     """
-    
-    # --- BASE CASE ---
-    # If we have reached the end of the books list
-    if index == len(weights):
-        # Compare if the current branch is better than the best recorded solution
-        if current_value > best_solution["max_value"]:
-            best_solution["max_value"] = current_value
-            best_solution["selection"] = list(current_selection)  # Copy the list
-        return
-
-    # --- BRANCH 1: INCLUDE THE BOOK ---
-    # Only enter if the weight does not exceed capacity
-    if current_weight + weights[index] <= max_capacity:
-        current_selection.append(index)  # Make decision
-        
-        knapsack_backtracking(
-            index + 1,
-            current_weight + weights[index],
-            current_value + values[index],
-            current_selection,
-            max_capacity, weights, values, best_solution
-        )
-        
-        current_selection.pop()  # Backtracking (Undo decision)
+    n = len(weights)
+    base_length = len(current_selection)
 
-    # --- BRANCH 2: DO NOT INCLUDE THE BOOK ---
-    # Move to next without adding weight or value
-    knapsack_backtracking(
-        index + 1,
-        current_weight,
-        current_value,
-        current_selection,
-        max_capacity, weights, values, best_solution
-    )
+    # Each pending call: (index, weight, value, selection length, decision)
+    pending = [(index, current_weight, current_value, base_length, None)]
+    explored = 0
+
+    while pending:
+        if deadline is not None and explored & 1023 == 0 and time.perf_counter() > deadline:
+            best_solution["complete"] = False
+            break
+        explored += 1
+        idx, weight, value, length, decision = pending.pop()
+
+        # Undo the decisions of the branch we are leaving (BACKTRACKING)
+        del current_selection[length:]
+        if decision == 'include':
+            current_selection.append(idx - 1)  # Make decision
+
+        if trace is not None:
+            trace({'event': 'node', 'depth': idx - index, 'index': idx, 'weight': weight,
+                   'value': value, 'decision': decision})
+
+        # --- BASE CASE ---
+        # If we have reached the end of the books list
+        if idx == n:
+            # Compare if the current branch is better than the best recorded solution
+            if value > best_solution["max_value"]:
+                best_solution["max_value"] = value
+                best_solution["selection"] = list(current_selection)  # Copy the list
+                if trace is not None:
+                    trace({'event': 'best', 'depth': idx - index, 'value': value})
+            continue
+
+        selected = len(current_selection)
+
+        # --- BRANCH 2: DO NOT INCLUDE THE BOOK ---
+        # Pushed first so it is explored after the whole "include" subtree
+        pending.append((idx + 1, weight, value, selected, 'exclude'))
+
+        # --- BRANCH 1: INCLUDE THE BOOK ---
+        # Only enter if the weight does not exceed capacity
+        if weights[idx] is not None and weight + weights[idx] <= max_capacity:
+            pending.append((idx + 1, weight + weights[idx], value + values[idx],
+                            selected, 'include'))
+        elif trace is not None:
+            trace({'event': 'prune', 'depth': idx - index + 1, 'index': idx, 'reason': 'capacity'})
 
+    # Leave the caller's selection untouched
+    del current_selection[base_length:]
 
-def solve_optimal_shelf(books_data, max_capacity=8.0):
-    """Main function that prepares data and initiates the backtracking recursion.
+
+def solve_optimal_shelf(books_data, max_capacity=8.0, trace=None, time_budget=None):
+    """Main function that prepares data and initiates the backtracking search.
     
     This function solves the knapsack problem for books on a shelf:
     - Input: List of books with weights and prices
@@ -112,6 +200,12 @@ def solve_optimal_shelf(books_data, max_capacity=8.0):
     - books_data: List of dictionaries containing book information.
                   Each dict must have: 'id', 'title', 'author', 'weight', 'price' keys.
     - max_capacity: Maximum weight capacity in Kg (default 8.0 - shelf capacity)
+    - trace: Optional step-trace hook forwarded to knapsack_backtracking
+             (event weights are in the integer units of weight_units)
+    - time_budget: Optional maximum search time in seconds. When given, the
+                   result also has 'complete' (False if the budget ran out)
+                   and 'gap', the relative optimality gap of the returned
+                   selection against the fractional-knapsack bound.
     
     Returns:
     - Dictionary containing:
@@ -151,11 +245,16 @@ def solve_optimal_shelf(books_data, max_capacity=8.0):
         try:
             weight = float(book.get('weight', 0))
             price = float(book.get('price', 0))
-            weights.append(weight)
-            values.append(price)
         except (ValueError, TypeError):
             # Skip books with invalid data
             continue
+        if not math.isfinite(weight) or not math.isfinite(price):
+            # Never selected, as in parse_shelf_items
+            weights.append(None)
+            values.append(None)
+            continue
+        weights.append(weight)
+        values.append(price)
     
     # Use a dictionary to store the global state of the best solution.
     # This is necessary because integers in Python are immutable when passed by function.
@@ -164,23 +263,51 @@ def solve_optimal_shelf(books_data, max_capacity=8.0):
         "selection": []
     }
     
-    # Initiate the backtracking recursion
+    # Exact integer weights, so the capacity test does not depend on rounding
+    unit_weights, unit_capacity, _ = weight_units(weights, max_capacity)
+    
+    # Initiate the backtracking search
     knapsack_backtracking(
         0,   # initial index
         0,   # initial weight
         0,   # initial value
         [],  # empty initial selection
-        max_capacity,
-        weights,
+        unit_capacity,
+        unit_weights,
         values,
-        best_solution
+        best_solution,
+        trace,
+        time.perf_counter() + time_budget if time_budget is not None else None
     )
     
     # Build detailed result with book information
+    result = build_shelf_result(books_data, weights, values,
+                                best_solution["selection"], best_solution["max_value"])
+    if time_budget is not None:
+        result['complete'] = best_solution.get("complete", True)
+        result['gap'] = 0.0 if result['complete'] else optimality_gap(
+            best_solution["max_value"], fractional_bound(max_capacity, weights, values))
+    return result
+
+
+def build_shelf_result(books_data, weights, values, selection, max_value):
+    """Build the result dictionary shared by all shelf (knapsack) solvers.
+    
+    Parameters:
+    - books_data: List of book dictionaries the selection refers to.
+    - weights, values: Parsed weights (Kg) and prices (COP), indexed like
+      the selection.
+    - selection: Indices of the selected books.
+    - max_value: Total value of the selection.
+    
+    Returns:
+    - Dictionary with 'max_value', 'total_weight', 'books' and 'indices'
+      (see solve_optimal_shelf).
+    """
     selected_books = []
     total_weight = 0.0
     
-    for idx in best_solution["selection"]:
+    for idx in selection:
         book = books_data[idx]
         selected_books.append({
             'id': book.get('id', 'N/A'),
@@ -192,11 +319,573 @@ def solve_optimal_shelf(books_data, max_capacity=8.0):
         total_weight += weights[idx]
     
     return {
-        'max_value': best_solution["max_value"],
+        'max_value': max_value,
         'total_weight': round(total_weight, 2),
         'books': selected_books,
-        'indices': best_solution["selection"]
+        'indices': selection
+    }
+
+
+def parse_shelf_items(books_data):
+    """Parse weights and prices aligned with books_data for the shelf solvers.
+    
+    Parameters:
+    - books_data: List of dictionaries with 'weight' (Kg) and 'price' (COP).
+    
+    Returns:
+    - (weights, values): two lists parallel to books_data; both hold None
+      for books with invalid or non-finite data.
+    
+    Raises:
+    - ValueError: if a book has a negative weight.
+    """
+    weights = []
+    values = []
+    
+    for book in books_data:
+        try:
+            weight = float(book.get('weight', 0))
+            price = float(book.get('price', 0))
+        except (ValueError, TypeError):
+            weight = price = None
+        if weight is None or not math.isfinite(weight) or not math.isfinite(price):
+            weights.append(None)
+            values.append(None)
+            continue
+        if weight < 0:
+            raise ValueError(f"Book weight cannot be negative: {weight}")
+        weights.append(weight)
+        values.append(price)
+    
+    return weights, values
+
+
+def knapsack_branch_and_bound(max_capacity, weights, values, deadline=None, max_nodes=None,
+                              frontier=None, trace=None):
+    """Branch-and-bound variant of knapsack_backtracking.
+    
+    Same include/exclude decision tree, with three changes that cut the
+    number of explored nodes by orders of magnitude:
+    
+    1. Items are visited in decreasing value density (price / weight), so
+       the fractional relaxation below is a valid upper bound.
+    2. The incumbent is seeded with the greedy solution (take items in
+       density order while they fit) before the search starts.
+    3. Every node computes the fractional-knapsack bound of its subtree:
+       current value + remaining items in density order while they fit +
+       the fitting fraction of the next one. If that bound cannot beat the
+       incumbent, the whole subtree is pruned.
+    
+    Weights are used exactly (no discretization): the search runs on the
+    integer units of weight_units, so a selection weighing exactly the
+    capacity is accepted whatever the visiting order. It runs on an
+    explicit stack, "include" branch first, like knapsack_backtracking.
+    
+    Anytime search:
+        With `deadline` (a time.perf_counter() value) or `max_nodes` the
+        search stops when the budget runs out and returns the incumbent, the
+        optimality gap (largest bound among the pending nodes) and the
+        pending nodes as a JSON-serializable frontier. Passing that frontier
+        back (same weights, values and capacity) resumes the search exactly
+        where it stopped.
+    
+    Parameters:
+    - max_capacity: Maximum weight capacity (Kg)
+    - weights: List of book weights; None marks books to ignore
+    - values: List of book prices (parallel to weights)
+    - deadline: Optional time.perf_counter() value at which to stop
+    - max_nodes: Optional maximum number of nodes to explore in this call
+    - frontier: Optional frontier returned by a previous, interrupted call
+    - trace: Optional step-trace hook (see tracing.TraceRecorder) called with
+             {'event': 'node', 'depth', 'weight', 'value'} per explored node,
+             {'event': 'prune', 'depth', 'bound', 'reason': 'bound' or
+             'capacity'} per cut subtree and {'event': 'best', 'depth',
+             'value'} when the incumbent improves. Depths follow the density
+             order of the search.
+    
+    Returns:
+    - Dictionary with:
+        * 'selection': Ascending indices of the best selection found
+        * 'nodes_explored': Decision-tree nodes visited (all calls)
+        * 'nodes_pruned': Nodes whose subtree was cut by the bound
+        * 'greedy_value': Value of the greedy seed
+        * 'complete': True if the search finished (selection is optimal)
+        * 'upper_bound': Upper bound on the optimal value
+        * 'frontier': State to resume from, or None when complete
+    
+    Raises:
+    - ValueError: if the frontier does not belong to these items.
+    
+    Complexity:
+    - Time: O(n log n) for sorting + O(log n) per explored node (bound via
+      prefix sums and bisect); O(2^n) worst case
+    - Space: O(n) for the explicit stack (at most one pending sibling per depth)
+    """
+    weights, max_capacity, scale = weight_units(weights, max_capacity)
+    
+    # Items that can ever help: they fit alone and have a positive value
+    items = [i for i, w in enumerate(weights)
+             if w is not None and w <= max_capacity and values[i] > 0]
+    items.sort(key=lambda i: (-(values[i] / weights[i]) if weights[i] > 0 else -math.inf, i))
+    m = len(items)
+    w_sorted = [weights[i] for i in items]
+    v_sorted = [values[i] for i in items]
+    
+    # Prefix sums for O(log n) fractional bounds
+    prefix_w = [0]
+    prefix_v = [0.0]
+    for w, v in zip(w_sorted, v_sorted):
+        prefix_w.append(prefix_w[-1] + w)
+        prefix_v.append(prefix_v[-1] + v)
+    
+    def upper_bound(depth, weight, value):
+        # Last k such that items depth..k-1 all fit in the remaining capacity
+        k = bisect_right(prefix_w, prefix_w[depth] + (max_capacity - weight), depth) - 1
+        bound = value + prefix_v[k] - prefix_v[depth]
+        if k < m and w_sorted[k] > 0:
+            room = max_capacity - weight - (prefix_w[k] - prefix_w[depth])
+            bound += v_sorted[k] * max(room, 0) / w_sorted[k]
+        return bound
+    
+    current_selection = []
+    
+    if frontier is None:
+        # Greedy seed for the incumbent
+        best_value = 0
+        best_selection = []
+        greedy_weight = 0
+        for pos in range(m):
+            if greedy_weight + w_sorted[pos] <= max_capacity:
+                greedy_weight += w_sorted[pos]
+                best_value += v_sorted[pos]
+                best_selection.append(pos)
+        greedy_value = best_value
+        nodes_explored = 0
+        nodes_pruned = 0
+        # Each pending node: (depth, weight, value, selection length, decision, base)
+        pending = [(0, 0, 0, 0, None, None)]
+    else:
+        if frontier.get('items') != m or frontier.get('scale') != scale:
+            raise ValueError("frontier does not belong to this problem")
+        best_value = frontier['best_value']
+        best_selection = list(frontier['best_selection'])
+        greedy_value = frontier['greedy_value']
+        nodes_explored = frontier['nodes_explored']
+        nodes_pruned = frontier['nodes_pruned']
+        # Resumed nodes carry their own selection (base)
+        pending = [(depth, weight, value, 0, None, list(base))
+                   for depth, weight, value, base in reversed(frontier['pending'])]
+    
+    explored_here = 0
+    interrupted = False
+    
+    while pending:
+        if ((max_nodes is not None and explored_here >= max_nodes)
+                or (deadline is not None and explored_here & 255 == 0
+                    and time.perf_counter() > deadline)):
+            interrupted = True
+            break
+        depth, weight, value, length, decision, base = pending.pop()
+        nodes_explored += 1
+        explored_here += 1
+        
+        # Undo the decisions of the branch we are leaving (BACKTRACKING)
+        if base is not None:
+            current_selection[:] = base
+        else:
+            del current_selection[length:]
+            if decision == 'include':
+                current_selection.append(depth - 1)
+        
+        if trace is not None:
+            trace({'event': 'node', 'depth': depth, 'weight': weight / scale, 'value': value})
+        
+        # Every node is a feasible selection: update the incumbent
+        if value > best_value:
+            best_value = value
+            best_selection = list(current_selection)
+            if trace is not None:
+                trace({'event': 'best', 'depth': depth, 'value': value})
+        
+        if depth == m:
+            continue
+        
+        # --- BOUND: prune subtrees that cannot beat the incumbent ---
+        node_bound = upper_bound(depth, weight, value)
+        if node_bound <= best_value:
+            nodes_pruned += 1
+            if trace is not None:
+                trace({'event': 'prune', 'depth': depth, 'bound': node_bound, 'reason': 'bound'})
+            continue
+        
+        selected = len(current_selection)
+        
+        # --- BRANCH 2: DO NOT INCLUDE THE BOOK (explored last) ---
+        pending.append((depth + 1, weight, value, selected, 'exclude', None))
+        
+        # --- BRANCH 1: INCLUDE THE BOOK ---
+        if weight + w_sorted[depth] <= max_capacity:
+            pending.append((depth + 1, weight + w_sorted[depth], value + v_sorted[depth],
+                            selected, 'include', None))
+        elif trace is not None:
+            trace({'event': 'prune', 'depth': depth + 1, 'bound': None, 'reason': 'capacity'})
+    
+    next_frontier = None
+    bound = best_value
+    if interrupted:
+        # Materialize every pending node with its own selection, bottom of
+        # the stack first. Stack order guarantees current_selection[:length]
+        # is still the path prefix of each pending node.
+        saved = []
+        for depth, weight, value, length, decision, base in pending:
+            if base is None:
+                base = current_selection[:length] + ([depth - 1] if decision == 'include' else [])
+            saved.append([depth, weight, value, base])
+            bound = max(bound, upper_bound(depth, weight, value) if depth < m else value)
+        next_frontier = {
+            'items': m,
+            'scale': scale,
+            'pending': saved[::-1],
+            'best_value': best_value,
+            'best_selection': best_selection,
+            'greedy_value': greedy_value,
+            'nodes_explored': nodes_explored,
+            'nodes_pruned': nodes_pruned
+        }
+    
+    return {
+        'selection': sorted(items[pos] for pos in best_selection),
+        'nodes_explored': nodes_explored,
+        'nodes_pruned': nodes_pruned,
+        'greedy_value': greedy_value,
+        'complete': not interrupted,
+        'upper_bound': bound,
+        'frontier': next_frontier
+    }
+
+
+def fractional_bound(max_capacity, weights, values):
+    """Fractional-knapsack upper bound on the optimal value (items in density order)."""
+    items = [(w, v) for w, v in zip(weights, values)
+             if w is not None and w <= max_capacity and v > 0]
+    items.sort(key=lambda item: -(item[1] / item[0]) if item[0] > 0 else -math.inf)
+    bound = 0.0
+    room = max_capacity
+    for w, v in items:
+        if w <= room:
+            room -= w
+            bound += v
+        else:
+            bound += v * room / w
+            break
+    return bound
+
+
+def optimality_gap(value, upper_bound):
+    """Relative optimality gap (0.0 = proven optimal) of `value` given a bound."""
+    if upper_bound <= 0 or value >= upper_bound:
+        return 0.0
+    return (upper_bound - value) / upper_bound
+
+
+def solve_optimal_shelf_branch_and_bound(books_data, max_capacity=8.0, time_budget=None,
+                                         max_nodes=None, frontier=None, trace=None):
+    """Solve the shelf knapsack problem with branch and bound.
+    
+    Exact alternative to solve_optimal_shelf for larger catalogs when the
+    weight discretization of the DP solver (knapsack_dp) is not acceptable.
+    With a time or node budget it becomes an anytime solver: it returns the
+    best selection found so far, its optimality gap and a frontier to resume.
+    
+    Parameters:
+    - books_data: List of dictionaries containing book information
+                  ('id', 'title', 'author', 'weight', 'price').
+    - max_capacity: Maximum weight capacity in Kg (default 8.0)
+    - time_budget: Optional maximum search time in seconds
+    - max_nodes: Optional maximum number of nodes to explore
+    - frontier: Optional 'frontier' of a previous interrupted result (same
+                books and capacity) to resume the search
+    - trace: Optional step-trace hook forwarded to knapsack_branch_and_bound
+    
+    Returns:
+    - Same dictionary as solve_optimal_shelf ('max_value', 'total_weight',
+      'books', 'indices') plus:
+        * 'search': Node counts ('nodes_explored', 'nodes_pruned',
+          'tree_size' = 2^(n+1) - 1, 'greedy_value')
+        * 'complete': True if the selection is proven optimal
+        * 'gap': Relative optimality gap (0.0 when complete)
+        * 'frontier': Resumable search state (None when complete)
+    
+    Among selections with the same maximum value, the one returned may
+    differ from solve_optimal_shelf.
+    """
+    weights, values = parse_shelf_items(books_data)
+    deadline = time.perf_counter() + time_budget if time_budget is not None else None
+    outcome = knapsack_branch_and_bound(max_capacity, weights, values, deadline, max_nodes, frontier,
+                                        trace)
+    
+    selection = outcome['selection']
+    max_value = 0
+    for idx in selection:
+        max_value += values[idx]
+    
+    result = build_shelf_result(books_data, weights, values, selection, max_value)
+    result['search'] = {
+        'nodes_explored': outcome['nodes_explored'],
+        'nodes_pruned': outcome['nodes_pruned'],
+        'tree_size': 2 ** (sum(w is not None for w in weights) + 1) - 1,
+        'greedy_value': outcome['greedy_value']
+    }
+    result['complete'] = outcome['complete']
+    result['gap'] = optimality_gap(max_value, outcome['upper_bound'])
+    result['frontier'] = outcome['frontier']
+    return result
+
+
+def _group_of(book, group_key):
+    """Normalized group (e.g. author) of a book for cardinality limits."""
+    return str(book.get(group_key, '')).strip().casefold()
+
+
+def knapsack_constrained(max_capacity, weights, values, groups, group_limits,
+                         forced_in=(), forced_out=()):
+    """Branch and bound with group cardinality limits and forced decisions.
+    
+    Extends knapsack_branch_and_bound with constraint propagation:
+    
+    - Forced inclusions are fixed before the search: their weight, value and
+      group counts form the root node, and they never appear in the tree.
+    - Forced exclusions, books of groups already at their limit and books
+      that no longer fit are removed before the search.
+    - When an inclusion fills a group, the remaining books of that group are
+      skipped (excluded without branching).
+    - The fractional bound skips the books of full groups.
+    
+    Infeasible branches are never generated, so a constrained query costs
+    about the same as an unconstrained branch-and-bound search instead of
+    enumerating unconstrained solutions and filtering them afterwards.
+    
+    Weights are compared in the exact integer units of weight_units.
+    
+    Parameters:
+    - max_capacity: Maximum weight capacity (Kg)
+    - weights: List of book weights; None marks books to ignore
+    - values: List of book prices (parallel to weights)
+    - groups: Group label of each book (parallel to weights)
+    - group_limits: Callable mapping a group label to its maximum number of
+                    books (None = unlimited)
+    - forced_in: Indices that must be selected
+    - forced_out: Indices that must not be selected
+    
+    Returns:
+    - Same dictionary as knapsack_branch_and_bound ('selection',
+      'nodes_explored', 'nodes_pruned', 'greedy_value')
+    
+    Raises:
+    - ValueError: if the forced inclusions are invalid, exceed the capacity
+      or break a group limit.
+    """
+    forced_in = sorted(set(forced_in))
+    forced_out = set(forced_out)
+    kg_capacity = max_capacity
+    weights, max_capacity, scale = weight_units(weights, max_capacity)
+    
+    counts = {}
+    base_weight = 0
+    base_value = 0
+    for idx in forced_in:
+        if idx in forced_out:
+            raise ValueError(f"Book {idx} cannot be both included and excluded")
+        if weights[idx] is None:
+            raise ValueError(f"Book {idx} has invalid weight or price data")
+        base_weight += weights[idx]
+        base_value += values[idx]
+        counts[groups[idx]] = counts.get(groups[idx], 0) + 1
+    if base_weight > max_capacity:
+        raise ValueError(
+            f"Required books weigh {base_weight / scale:.2f} Kg, more than the capacity of {kg_capacity} Kg"
+        )
+    for group, count in counts.items():
+        limit = group_limits(group)
+        if limit is not None and count > limit:
+            raise ValueError(f"Required books exceed the limit of {limit} for '{group}'")
+    
+    def room_in(group):
+        limit = group_limits(group)
+        return None if limit is None else limit - counts.get(group, 0)
+    
+    # Candidates that can still help, in decreasing value density
+    capacity = max_capacity - base_weight
+    fixed = set(forced_in)
+    items = [i for i, w in enumerate(weights)
+             if w is not None and i not in fixed and i not in forced_out
+             and w <= capacity and values[i] > 0 and room_in(groups[i]) != 0]
+    items.sort(key=lambda i: (-(values[i] / weights[i]) if weights[i] > 0 else -math.inf, i))
+    m = len(items)
+    w_sorted = [weights[i] for i in items]
+    v_sorted = [values[i] for i in items]
+    g_sorted = [groups[i] for i in items]
+    
+    def upper_bound(depth, weight, value):
+        # Fractional relaxation over the books whose group still has room
+        bound = value
+        room = capacity - weight
+        for pos in range(depth, m):
+            if room_in(g_sorted[pos]) == 0:
+                continue
+            if w_sorted[pos] <= room:
+                room -= w_sorted[pos]
+                bound += v_sorted[pos]
+            else:
+                if w_sorted[pos] > 0:
+                    bound += v_sorted[pos] * room / w_sorted[pos]
+                break
+        return bound
+    
+    def next_allowed(depth):
+        # Skip books whose group is already full (propagated exclusion)
+        while depth < m and room_in(g_sorted[depth]) == 0:
+            depth += 1
+        return depth
+    
+    # Greedy seed respecting capacity and group limits
+    best_value = 0
+    best_selection = []
+    greedy_weight = 0
+    for pos in range(m):
+        if room_in(g_sorted[pos]) != 0 and greedy_weight + w_sorted[pos] <= capacity:
+            greedy_weight += w_sorted[pos]
+            best_value += v_sorted[pos]
+            best_selection.append(pos)
+            counts[g_sorted[pos]] = counts.get(g_sorted[pos], 0) + 1
+    for pos in best_selection:
+        counts[g_sorted[pos]] -= 1
+    greedy_value = best_value
+    
+    nodes_explored = 0
+    nodes_pruned = 0
+    current_selection = []
+    
+    # Each pending node: (depth, weight, value, selection length, decision)
+    pending = [(next_allowed(0), 0, 0, 0, None)]
+    
+    while pending:
+        depth, weight, value, length, decision = pending.pop()
+        nodes_explored += 1
+        
+        # Undo the decisions of the branch we are leaving (BACKTRACKING)
+        for pos in current_selection[length:]:
+            counts[g_sorted[pos]] -= 1
+        del current_selection[length:]
+        if decision is not None and decision >= 0:
+            current_selection.append(decision)
+            counts[g_sorted[decision]] = counts.get(g_sorted[decision], 0) + 1
+        depth = next_allowed(depth)
+        
+        if value > best_value:
+            best_value = value
+            best_selection = list(current_selection)
+        
+        if depth == m:
+            continue
+        
+        # --- BOUND: prune subtrees that cannot beat the incumbent ---
+        if upper_bound(depth, weight, value) <= best_value:
+            nodes_pruned += 1
+            continue
+        
+        selected = len(current_selection)
+        
+        # --- BRANCH 2: DO NOT INCLUDE THE BOOK (explored last) ---
+        pending.append((depth + 1, weight, value, selected, -1))
+        
+        # --- BRANCH 1: INCLUDE THE BOOK ---
+        if weight + w_sorted[depth] <= capacity:
+            pending.append((depth + 1, weight + w_sorted[depth], value + v_sorted[depth],
+                            selected, depth))
+    
+    return {
+        'selection': sorted(forced_in + [items[pos] for pos in best_selection]),
+        'nodes_explored': nodes_explored,
+        'nodes_pruned': nodes_pruned,
+        'greedy_value': base_value + greedy_value
+    }
+
+
+def solve_optimal_shelf_constrained(books_data, max_capacity=8.0, max_per_group=None,
+                                    group_limits=None, group_key='author',
+                                    must_include=(), must_exclude=()):
+    """Solve the shelf knapsack problem under curator constraints.
+    
+    Examples of constraints:
+    - "at most 2 books per author": max_per_group=2
+    - "at most 1 book by García Márquez": group_limits={'García Márquez': 1}
+    - "always include these ISBNs": must_include=['9780307474728', ...]
+    - "never include B007": must_exclude=['B007']
+    
+    Parameters:
+    - books_data: List of dictionaries containing book information
+                  ('id', 'isbn', 'title', 'author', 'weight', 'price').
+    - max_capacity: Maximum weight capacity in Kg (default 8.0)
+    - max_per_group: Default maximum number of books per group (None = no limit)
+    - group_limits: Dict {group: limit} overriding max_per_group for
+                    specific groups (matched case-insensitively)
+    - group_key: Book key defining the groups (default 'author')
+    - must_include: Book ids or ISBNs that must be selected (every copy
+                    matching an ISBN is required)
+    - must_exclude: Book ids or ISBNs that must not be selected
+    
+    Returns:
+    - Same dictionary as solve_optimal_shelf_branch_and_bound ('max_value',
+      'total_weight', 'books', 'indices', 'search'), with 'group' added to
+      every selected book.
+    
+    Raises:
+    - ValueError: if an identifier matches no book, or the required books
+      exceed the capacity or a group limit.
+    """
+    weights, values = parse_shelf_items(books_data)
+    groups = [_group_of(book, group_key) for book in books_data]
+    
+    limits = {str(k).strip().casefold(): v for k, v in (group_limits or {}).items()}
+    
+    def limit_for(group):
+        return limits.get(group, max_per_group)
+    
+    def resolve(identifiers):
+        wanted = {str(x) for x in identifiers}
+        found = set()
+        indices = []
+        for idx, book in enumerate(books_data):
+            for key in ('id', 'isbn'):
+                value = book.get(key)
+                if value is not None and str(value) in wanted:
+                    indices.append(idx)
+                    found.add(str(value))
+                    break
+        missing = wanted - found
+        if missing:
+            raise ValueError(f"Unknown books: {', '.join(sorted(missing))}")
+        return indices
+    
+    outcome = knapsack_constrained(max_capacity, weights, values, groups, limit_for,
+                                   resolve(must_include), resolve(must_exclude))
+    
+    selection = outcome['selection']
+    max_value = 0
+    for idx in selection:
+        max_value += values[idx]
+    
+    result = build_shelf_result(books_data, weights, values, selection, max_value)
+    for book, idx in zip(result['books'], selection):
+        book['group'] = books_data[idx].get(group_key)
+    result['search'] = {
+        'nodes_explored': outcome['nodes_explored'],
+        'nodes_pruned': outcome['nodes_pruned'],
+        'tree_size': 2 ** (sum(w is not None for w in weights) + 1) - 1,
+        'greedy_value': outcome['greedy_value']
     }
+    return result
 
 
 # Example usage for testing:
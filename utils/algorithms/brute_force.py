@@ -9,14 +9,30 @@ Project Requirement:
     exceed a risk threshold of 8 Kg (maximum shelf capacity).
     The algorithm must exhaustively explore all combinations.
 
+This exhaustive version is kept as the reference implementation. The
+pruned, output-sensitive engine used by BookService lives in
+risky_combinations.py and must return exactly the same result, as must
+the multi-process sharded scan in brute_force_parallel.py.
+
+For catalogs too large even for an exact count, estimate_risky_fraction
+samples random 4-book combinations (Monte Carlo) and returns the risky
+fraction with a confidence interval.
+
 Author: Library Management System Team
 Date: 2025
 """
 
-from typing import List, Dict, Any
+import math
+import random
+from array import array
+from itertools import repeat
+from operator import add, and_, lt, ne
+from statistics import NormalDist
+from typing import List, Dict, Any, Callable, Optional
 
 
-def find_risky_combinations(books_data: List[Dict[str, Any]], threshold: float = 8.0) -> List[Dict[str, Any]]:
+def find_risky_combinations(books_data: List[Dict[str, Any]], threshold: float = 8.0,
+                            trace: Optional[Callable[[Dict[str, Any]], None]] = None) -> List[Dict[str, Any]]:
     """Find all combinations of 4 books that exceed the weight threshold using brute force.
     
     This algorithm exhaustively explores ALL possible combinations of 4 books
@@ -41,6 +57,10 @@ def find_risky_combinations(books_data: List[Dict[str, Any]], threshold: float =
     - books_data: List of dictionaries containing book information.
                   Each dict must have: 'id', 'title', 'weight' keys.
     - threshold: Maximum weight threshold in Kg (default 8.0).
+    - trace: Optional step-trace hook (see tracing.TraceRecorder) called once
+             per combination checked with {'event': 'node', 'indices',
+             'total_weight', 'risky'}. For C(n, 4) combinations pass a
+             bounded recorder, not a list.
     
     Returns:
     - List of dictionaries, each containing:
@@ -110,6 +130,10 @@ def find_risky_combinations(books_data: List[Dict[str, Any]], threshold: float =
                         # Skip combinations with invalid weight data
                         continue
                     
+                    if trace is not None:
+                        trace({'event': 'node', 'indices': (i, j, k, m),
+                               'total_weight': total_weight, 'risky': total_weight > threshold})
+                    
                     # If total weight exceeds the threshold, record the combination
                     if total_weight > threshold:
                         # ADD (books[i], books[j], books[k], books[m]) TO result
@@ -178,6 +202,154 @@ def count_total_combinations(num_books: int) -> int:
     return result
 
 
+# Risky samples required before the estimator may stop (a handful of hits
+# gives a precise-looking but very wide interval when the risk is rare)
+MIN_RISKY_SAMPLES = 30
+
+
+def _wilson_interval(successes: int, samples: int, z: float) -> tuple:
+    """Wilson score interval of a binomial proportion (stays inside [0, 1])."""
+    p = successes / samples
+    z2 = z * z
+    center = (p + z2 / (2 * samples)) / (1 + z2 / samples)
+    half = z * math.sqrt(p * (1 - p) / samples + z2 / (4 * samples * samples)) / (1 + z2 / samples)
+    return max(center - half, 0.0), min(center + half, 1.0)
+
+
+def estimate_risky_fraction(books_data: List[Dict[str, Any]], threshold: float = 8.0,
+                            precision: Optional[float] = 0.005, confidence: float = 0.95,
+                            seed: Optional[int] = None, batch_size: int = 4096,
+                            max_samples: int = 1_000_000, relative_precision: Optional[float] = None,
+                            min_risky_samples: int = MIN_RISKY_SAMPLES) -> Dict[str, Any]:
+    """Estimate the fraction of 4-book combinations exceeding the threshold by sampling.
+
+    Draws uniformly random 4-book combinations in batches and stops as soon
+    as the confidence interval of the risky fraction is narrow enough, so
+    the cost depends on the requested precision, not on the catalog size.
+
+    Algorithm Logic:
+        Each batch draws four independent index lists and keeps the rows
+        whose four indices are all different (a uniform random combination).
+        Weights live in an array('d') and the lookups, sums, comparisons and
+        distinctness checks run through map() over the whole batch. After
+        every batch the Wilson score interval is computed; sampling stops
+        once at least `min_risky_samples` risky combinations were seen and
+        the half-width is at most `precision` (absolute) and at most
+        `relative_precision` times the estimate, or after `max_samples`.
+        Use the relative mode when risky combinations are rare: an absolute
+        ±0.5% says little about a fraction of 0.1%.
+
+    Parameters:
+    - books_data: List of dictionaries with at least 'weight'.
+    - threshold: Maximum weight threshold in Kg (default 8.0).
+    - precision: Target half-width of the interval, as a fraction (0.005 =
+      ±0.5 percentage points); None for no absolute target.
+    - confidence: Confidence level of the interval (default 0.95).
+    - seed: Random seed for a reproducible estimate (None = random).
+    - batch_size: Combinations drawn per batch.
+    - max_samples: Stop after about this many sampled combinations even if
+      the precision was not reached.
+    - relative_precision: Target half-width relative to the estimate (0.1 =
+      ±10% of the estimated fraction); None for no relative target.
+    - min_risky_samples: Risky samples needed before stopping early
+      (default MIN_RISKY_SAMPLES). If the risk is so rare that they are
+      never seen, sampling runs to max_samples and 'converged' is False.
+
+    Returns:
+    - Dictionary containing:
+        * 'fraction': Estimated risky fraction
+        * 'low', 'high': Confidence interval of the fraction
+        * 'total_combinations': C(n, 4)
+        * 'estimated_count', 'count_low', 'count_high': The same, scaled to
+          a number of combinations
+        * 'samples': Combinations sampled; 'risky_samples': how many were risky
+        * 'confidence': Confidence level used
+        * 'converged': True if the precision targets were reached
+
+    Raises:
+    - ValueError: If a precision, confidence, batch_size, max_samples or
+      min_risky_samples is out of range, or both precisions are None.
+
+    Complexity:
+    - Time: O(n + S) for S samples: about (z / (2 * precision))^2 in the
+      worst case (fraction near 0.5) for the absolute target, about
+      (z / relative_precision)^2 / fraction for the relative one. Space: O(n + batch_size).
+
+    Notes:
+    - Books with an invalid weight count as non-risky, like in
+      find_risky_combinations. The four weights are added in sampling
+      order, so sums that equal the threshold up to rounding may be
+      classified differently from the reference.
+
+    Example:
+    >>> estimate = estimate_risky_fraction(books, 8.0, precision=0.01, seed=1)
+    >>> print(f"{estimate['fraction']:.1%} ({estimate['low']:.1%} - {estimate['high']:.1%})")
+    """
+    if precision is None and relative_precision is None:
+        raise ValueError("precision or relative_precision is required")
+    for target in (precision, relative_precision):
+        if target is not None and not 0 < target < 1:
+            raise ValueError("precision and relative_precision must be between 0 and 1")
+    if min_risky_samples < 0:
+        raise ValueError("min_risky_samples must not be negative")
+    if not 0 < confidence < 1:
+        raise ValueError("confidence must be between 0 and 1")
+    if batch_size < 1 or max_samples < 1:
+        raise ValueError("batch_size and max_samples must be positive")
+
+    # Invalid weights become -inf: every sum containing one is not risky
+    weights = array('d')
+    for book in books_data:
+        try:
+            weights.append(float(book.get('weight', 0)))
+        except (ValueError, TypeError):
+            weights.append(-math.inf)
+
+    n = len(weights)
+    total = count_total_combinations(n)
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    rng = random.Random(seed)
+    population = range(n)
+    weight_of = weights.__getitem__
+
+    samples = 0
+    risky = 0
+    low, high = 0.0, 1.0
+    converged = total == 0
+    while not converged and samples < max_samples:
+        a, b, c, d = (rng.choices(population, k=batch_size) for _ in range(4))
+        distinct = list(map(and_,
+                            map(and_, map(and_, map(ne, a, b), map(ne, a, c)), map(and_, map(ne, a, d), map(ne, b, c))),
+                            map(and_, map(ne, b, d), map(ne, c, d))))
+        sums = map(add, map(add, map(add, map(weight_of, a), map(weight_of, b)), map(weight_of, c)),
+                   map(weight_of, d))
+        samples += sum(distinct)
+        risky += sum(map(and_, distinct, map(lt, repeat(threshold), sums)))
+        if samples:
+            low, high = _wilson_interval(risky, samples, z)
+            half = (high - low) / 2
+            converged = (risky >= min_risky_samples
+                         and (precision is None or half <= precision)
+                         and (relative_precision is None or half <= relative_precision * risky / samples))
+
+    fraction = risky / samples if samples else 0.0
+    if total == 0:
+        low = high = 0.0
+    return {
+        'fraction': fraction,
+        'low': low,
+        'high': high,
+        'total_combinations': total,
+        'estimated_count': round(fraction * total),
+        'count_low': math.floor(low * total),
+        'count_high': math.ceil(high * total),
+        'samples': samples,
+        'risky_samples': risky,
+        'confidence': confidence,
+        'converged': converged
+    }
+
+
 # Example usage for testing:
 if __name__ == "__main__":
     # Test data: 5 books with varying weights
@@ -0,0 +1,254 @@
+"""Multi-process sharded brute-force risky combination scan.
+
+Parallel mode of brute_force.find_risky_combinations: the outer loop index
+i of the four nested loops is split into contiguous shards that are scanned
+by a ProcessPoolExecutor. The result is identical to the single-process
+brute force (same combinations, same order, same rounded totals).
+
+Sharding:
+    Outer index i owns C(n - i - 1, 3) combinations (every j < k < m after
+    it), so equal-width shards would give the first worker almost all the
+    work. shard_outer_range() cuts the outer range at the points where the
+    cumulative C(n - i - 1, 3) reaches equal fractions of C(n, 4).
+
+Workers:
+    The weight array is sent ONCE per worker process through the pool
+    initializer (never per task); each task is just a (start, end) range.
+    Inside a shard the innermost loop runs through map()/compress() at C
+    speed while keeping the reference summation order
+    ((w_i + w_j) + w_k) + w_m.
+
+Deterministic merge:
+    Executor.map returns shard results in submission order and shards are
+    contiguous, so concatenating them reproduces the nested-loop order;
+    counts are simply added.
+
+Benchmark:
+    benchmark() times the scan for several worker counts; run this module
+    directly to print the table (python -m utils.algorithms.brute_force_parallel).
+
+Author: Library Management System Team
+Date: 2025
+"""
+
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import compress, islice, repeat
+from math import comb
+from operator import add, lt
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from utils.algorithms.risky_combinations import build_combination, parse_weights
+
+# Shards per worker: more shards than workers smooth out uneven shards
+SHARDS_PER_WORKER = 4
+
+# Weight array and threshold of the current worker process (set by _init_worker)
+_weights: List[float] = []
+_threshold: float = 8.0
+
+
+def _init_worker(weights: List[float], threshold: float) -> None:
+    """Pool initializer: receive the weight array once per worker process."""
+    global _weights, _threshold
+    _weights = weights
+    _threshold = threshold
+
+
+def _scan_shard(task: Tuple[int, int, bool]) -> Any:
+    """Scan the outer indices [start, end) of the four nested loops.
+
+    Returns the number of risky combinations when count_only is set, else
+    the list of risky position tuples in nested-loop order.
+    """
+    start, end, count_only = task
+    W = _weights
+    T = _threshold
+    n = len(W)
+    count = 0
+    found: List[Tuple[int, int, int, int]] = []
+
+    for i in range(start, end):
+        wi = W[i]
+        for j in range(i + 1, n - 2):
+            sij = wi + W[j]
+            for k in range(j + 1, n - 1):
+                s3 = sij + W[k]
+                # T < s3 + w_m for every m > k, evaluated at C speed
+                risky = map(lt, repeat(T), map(add, repeat(s3), islice(W, k + 1, None)))
+                if count_only:
+                    count += sum(risky)
+                else:
+                    for m in compress(range(k + 1, n), risky):
+                        found.append((i, j, k, m))
+
+    return count if count_only else found
+
+
+def shard_outer_range(n: int, shards: int) -> List[Tuple[int, int]]:
+    """Split the outer index range of C(n, 4) into work-balanced shards.
+
+    Parameters:
+    - n: Number of books.
+    - shards: Desired number of shards.
+
+    Returns:
+    - Contiguous (start, end) ranges covering 0..n-3 whose C(n - i - 1, 3)
+      sums are as equal as possible (fewer ranges when n is small).
+    """
+    outer = max(n - 3, 0)
+    if outer == 0:
+        return []
+    shards = max(1, shards)
+    total = comb(n, 4)
+
+    ranges = []
+    start = 0
+    done = 0
+    boundary = 1
+    for i in range(outer):
+        done += comb(n - i - 1, 3)
+        # Close the shard once the cumulative work reaches the next boundary
+        if done * shards >= total * boundary and i + 1 < outer:
+            ranges.append((start, i + 1))
+            start = i + 1
+            while boundary < shards and done * shards >= total * boundary:
+                boundary += 1
+    ranges.append((start, outer))
+    return ranges
+
+
+def _run_shards(weights: List[float], threshold: float, workers: Optional[int], count_only: bool) -> Iterator[Any]:
+    """Yield the result of every shard, in shard order."""
+    workers = workers or os.cpu_count() or 1
+    shards = shard_outer_range(len(weights), workers * SHARDS_PER_WORKER)
+    tasks = [(start, end, count_only) for start, end in shards]
+
+    if workers <= 1 or len(tasks) <= 1:
+        _init_worker(weights, threshold)
+        for task in tasks:
+            yield _scan_shard(task)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(weights, threshold)) as pool:
+        yield from pool.map(_scan_shard, tasks)
+
+
+def _valid(books_data: List[Dict[str, Any]]) -> Tuple[List[Optional[float]], List[int]]:
+    """Parsed weights and the catalog indices of the books with a valid weight."""
+    weights = parse_weights(books_data)
+    return weights, [i for i, w in enumerate(weights) if w is not None]
+
+
+def iter_risky_quadruples_parallel(books_data: List[Dict[str, Any]], threshold: float = 8.0,
+                                   workers: Optional[int] = None) -> Iterator[Tuple[int, int, int, int]]:
+    """Yield risky catalog index quadruples in brute-force order, scanning in parallel.
+
+    Results are streamed shard by shard: the first shard is yielded as soon
+    as it is done while later shards are still being scanned.
+
+    Parameters:
+    - books_data: List of dictionaries with a 'weight' key.
+    - threshold: Weight threshold in Kg (default 8.0).
+    - workers: Worker processes (default: os.cpu_count(); 1 = in-process).
+
+    Yields:
+    - Ascending tuples (i, j, k, m) of catalog indices.
+    """
+    weights, valid = _valid(books_data)
+    compact = [weights[i] for i in valid]
+    for shard in _run_shards(compact, threshold, workers, count_only=False):
+        for a, b, c, d in shard:
+            yield (valid[a], valid[b], valid[c], valid[d])
+
+
+def find_risky_combinations_parallel(books_data: List[Dict[str, Any]], threshold: float = 8.0,
+                                     workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Parallel drop-in replacement for brute_force.find_risky_combinations.
+
+    Parameters:
+    - books_data: List of dictionaries containing book information.
+    - threshold: Maximum weight threshold in Kg (default 8.0).
+    - workers: Worker processes (default: os.cpu_count(); 1 = in-process).
+
+    Returns:
+    - Same list of {'books', 'total_weight', 'excess'} dictionaries, in the
+      same order, as the single-process brute force.
+
+    Complexity:
+    - Time: O(n^4 / p) with p workers (still exhaustive).
+    """
+    weights = parse_weights(books_data)
+    return [
+        build_combination(books_data, weights, indices, threshold)
+        for indices in iter_risky_quadruples_parallel(books_data, threshold, workers)
+    ]
+
+
+def count_risky_combinations_parallel(books_data: List[Dict[str, Any]], threshold: float = 8.0,
+                                      workers: Optional[int] = None) -> int:
+    """Count risky combinations with the parallel exhaustive scan (no results kept).
+
+    Parameters:
+    - books_data: List of dictionaries with a 'weight' key.
+    - threshold: Weight threshold in Kg (default 8.0).
+    - workers: Worker processes (default: os.cpu_count(); 1 = in-process).
+
+    Returns:
+    - Number of combinations whose weight exceeds the threshold.
+    """
+    weights, valid = _valid(books_data)
+    compact = [weights[i] for i in valid]
+    return sum(_run_shards(compact, threshold, workers, count_only=True))
+
+
+def benchmark(num_books: int = 200, worker_counts: Tuple[int, ...] = (1, 2, 4, 8),
+              threshold: float = 8.0, seed: int = 42) -> List[Dict[str, Any]]:
+    """Time the parallel exhaustive count for several worker counts.
+
+    Parameters:
+    - num_books: Size of the random catalog (weights uniform in 0.2-3.0 Kg).
+    - worker_counts: Worker counts to measure; 1 is the single-process baseline.
+    - threshold: Weight threshold in Kg.
+    - seed: Random seed for a reproducible catalog.
+
+    Returns:
+    - One dict per worker count: 'workers', 'seconds', 'speedup' (vs the
+      first entry) and 'risky_count' (identical for every entry).
+    """
+    rng = random.Random(seed)
+    books = [{'id': f'B{i:04d}', 'weight': round(rng.uniform(0.2, 3.0), 2)} for i in range(num_books)]
+
+    rows = []
+    baseline = None
+    for workers in worker_counts:
+        began = time.perf_counter()
+        risky_count = count_risky_combinations_parallel(books, threshold, workers)
+        seconds = time.perf_counter() - began
+        baseline = baseline or seconds
+        rows.append({
+            'workers': workers,
+            'seconds': round(seconds, 3),
+            'speedup': round(baseline / seconds, 2),
+            'risky_count': risky_count
+        })
+    return rows
+
+
+__all__ = [
+    'shard_outer_range',
+    'iter_risky_quadruples_parallel',
+    'find_risky_combinations_parallel',
+    'count_risky_combinations_parallel',
+    'benchmark',
+]
+
+
+if __name__ == "__main__":
+    print(f"=== Parallel Brute Force Benchmark (cpu_count={os.cpu_count()}) ===")
+    print(f"{'workers':>8} {'seconds':>10} {'speedup':>8} {'risky':>12}")
+    for row in benchmark():
+        print(f"{row['workers']:>8} {row['seconds']:>10} {row['speedup']:>8} {row['risky_count']:>12,}")
@@ -0,0 +1,160 @@
+"""external_sort.py
+
+External (disk-backed) merge sort for record streams larger than memory.
+
+The classic in-memory Merge Sort needs the whole input as one list. This
+module applies the same divide-and-merge idea with the disk as working
+storage:
+
+1. Run generation: read the input stream in chunks of at most ``run_size``
+   records, sort each chunk in memory by its precomputed key (any strategy
+   from sort_strategies) and spill it to a temporary file (a "run").
+2. K-way merge: merge the sorted runs with ``heapq.merge``, which keeps only
+   one pending record per run in memory. When there are more than
+   ``fan_in`` runs, groups of runs are first merged into bigger runs so the
+   number of simultaneously open files stays bounded.
+
+Memory use is O(run_size + fan_in) records regardless of the input size.
+The sort is stable: runs are sorted stably and ``heapq.merge`` resolves
+ties in favour of the earlier run.
+
+Run format:
+    One JSON array ``[key, record]`` per line, so records and keys must be
+    JSON-serializable (dicts, lists, strings, numbers, booleans, None).
+
+Example:
+    >>> from utils.algorithms.external_sort import external_sort
+    >>> rows = ({'id': i, 'price': (i * 7919) % 1000} for i in range(10**6))
+    >>> for row in external_sort(rows, key=lambda r: r['price'], run_size=50_000):
+    ...     handle(row)
+
+Author: Library Management System
+Date: 2025-12-02
+"""
+
+import heapq
+import json
+import os
+import tempfile
+from operator import itemgetter
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+
+from utils.algorithms.sort_strategies import sort_permutation
+
+# Default number of records sorted in memory per run
+DEFAULT_RUN_SIZE = 100_000
+
+# Default maximum number of runs merged (files open) at the same time
+DEFAULT_FAN_IN = 64
+
+
+def _write_run(pairs: Iterable[List[Any]], path: str) -> None:
+    """Write `[key, record]` pairs to `path`, one JSON line each."""
+    with open(path, 'w', encoding='utf-8') as f:
+        for pair in pairs:
+            f.write(json.dumps(pair, ensure_ascii=False))
+            f.write('\n')
+
+
+def _read_run(path: str) -> Iterator[List[Any]]:
+    """Yield the `[key, record]` pairs stored in run file `path`."""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            yield json.loads(line)
+
+
+def _generate_runs(
+    records: Iterable[Any],
+    key: Callable[[Any], Any],
+    run_size: int,
+    tmp_dir: str,
+    strategy: str,
+) -> List[str]:
+    """Split `records` into sorted run files inside `tmp_dir`."""
+    runs = []
+    keys: List[Any] = []
+    chunk: List[Any] = []
+
+    def spill() -> None:
+        order = sort_permutation(keys, strategy)
+        path = os.path.join(tmp_dir, f'run_{len(runs):06d}.jsonl')
+        _write_run(([keys[i], chunk[i]] for i in order), path)
+        runs.append(path)
+        keys.clear()
+        chunk.clear()
+
+    for record in records:
+        keys.append(key(record))
+        chunk.append(record)
+        if len(chunk) >= run_size:
+            spill()
+    if chunk:
+        spill()
+    return runs
+
+
+def _merge_runs(paths: List[str]) -> Iterator[List[Any]]:
+    """Lazily k-way merge the sorted run files in `paths` (stable)."""
+    return heapq.merge(*(_read_run(path) for path in paths), key=itemgetter(0))
+
+
+def external_sort(
+    records: Iterable[Any],
+    key: Callable[[Any], Any],
+    run_size: int = DEFAULT_RUN_SIZE,
+    fan_in: int = DEFAULT_FAN_IN,
+    tmp_dir: Optional[str] = None,
+    strategy: str = 'auto',
+) -> Iterator[Any]:
+    """Sort a record stream with bounded memory, yielding records in order.
+
+    Parameters:
+    - records: Iterable of JSON-serializable records (consumed once).
+    - key: Function returning the sort key of a record (computed once per
+      record, must be JSON-serializable and keep its order after a JSON
+      round trip, e.g. int/float prices).
+    - run_size: Maximum number of records held in memory per run.
+    - fan_in: Maximum number of runs merged at once (at least 2).
+    - tmp_dir: Parent directory for the temporary run files (system default
+      when None). Run files are removed when the generator finishes or is
+      closed.
+    - strategy: In-memory sort strategy for each run (see sort_strategies).
+
+    Yields:
+    - The records in ascending key order (stable). Records come back from
+      the JSON run files, so tuples are returned as lists.
+
+    Raises:
+    - ValueError: if run_size < 1 or fan_in < 2.
+    """
+    if run_size < 1:
+        raise ValueError("run_size must be at least 1")
+    if fan_in < 2:
+        raise ValueError("fan_in must be at least 2")
+
+    with tempfile.TemporaryDirectory(prefix='external_sort_', dir=tmp_dir) as work_dir:
+        runs = _generate_runs(records, key, run_size, work_dir, strategy)
+
+        # Intermediate passes keep at most fan_in run files open at once
+        merge_pass = 0
+        while len(runs) > fan_in:
+            merged = []
+            for start in range(0, len(runs), fan_in):
+                group = runs[start:start + fan_in]
+                path = os.path.join(work_dir, f'merge_{merge_pass:03d}_{len(merged):06d}.jsonl')
+                _write_run(_merge_runs(group), path)
+                for old in group:
+                    os.remove(old)
+                merged.append(path)
+            runs = merged
+            merge_pass += 1
+
+        for _, record in _merge_runs(runs):
+            yield record
+
+
+__all__ = [
+    'DEFAULT_RUN_SIZE',
+    'DEFAULT_FAN_IN',
+    'external_sort',
+]
@@ -0,0 +1,146 @@
+"""Bounded Knapsack Solver - Shelf Optimization over Copy Groups.
+
+The shelf solvers in backtracking / knapsack_dp treat every Book record as
+a distinct 0/1 item, so an ISBN with many physical copies multiplies the
+search space (2^copies for backtracking, copies * W for the DP). Here each
+ISBN group (weight, price, available copies) is one bounded item that can
+be taken 0..copies times.
+
+Binary splitting:
+    A group with k copies is rewritten as 0/1 items of 1, 2, 4, ..., 2^(p-1)
+    copies plus a remainder r = k - (2^p - 1). Every count 0..k is the sum
+    of exactly one subset of these parts, so the 0/1 DP over the parts
+    (knapsack_dp.knapsack_units) solves the bounded problem exactly with
+    O(log k) items per group instead of k.
+
+Complexity:
+    O(G * W * log K) for G groups, W = capacity / resolution and at most K
+    copies per group.
+
+Discretization is the same as knapsack_dp: weights rounded up, capacity
+rounded down, exact for two-decimal weights at the default 0.01 Kg.
+
+Author: Library Management System Team
+Date: 2025
+"""
+
+import math
+from typing import Any, Dict, List, Optional
+
+from utils.algorithms.knapsack_dp import DEFAULT_RESOLUTION, knapsack_units, reconstruct_units
+
+
+def split_copies(copies: int) -> List[int]:
+    """Binary splitting of a copy count: 1, 2, 4, ... plus the remainder.
+
+    >>> split_copies(10)
+    [1, 2, 4, 3]
+    """
+    parts = []
+    size = 1
+    while copies > 0:
+        take = min(size, copies)
+        parts.append(take)
+        copies -= take
+        size *= 2
+    return parts
+
+
+def solve_bounded_shelf(groups: List[Dict[str, Any]], max_capacity: float = 8.0,
+                        resolution: float = DEFAULT_RESOLUTION) -> Dict[str, Any]:
+    """Choose how many copies of each ISBN group to shelve, maximizing value.
+
+    Parameters:
+    - groups: List of dictionaries with 'weight' (Kg per copy), 'price'
+      (COP per copy) and 'copies' (available copies), plus optional 'isbn',
+      'title' and 'author'. Groups with invalid data are skipped.
+    - max_capacity: Maximum shelf weight in Kg (default 8.0).
+    - resolution: Weight discretization step in Kg (default 0.01).
+
+    Returns:
+    - Dictionary containing:
+        * 'max_value': Total value of the chosen copies (COP)
+        * 'total_weight': Total weight of the chosen copies (Kg)
+        * 'total_copies': Number of copies chosen
+        * 'groups': One entry per group with at least one copy chosen:
+          'isbn', 'title', 'author', 'weight', 'price', 'copies_available'
+          and 'copies_chosen'
+        * 'items': Number of 0/1 items after binary splitting
+
+    Raises:
+    - ValueError: if resolution is not positive or a weight is negative.
+    """
+    if resolution <= 0:
+        raise ValueError("resolution must be positive")
+    capacity = math.floor(max_capacity / resolution + 1e-9) if max_capacity > 0 else 0
+
+    # 0/1 parts after binary splitting: (group index, copies in the part)
+    parts: List[tuple] = []
+    units: List[Optional[int]] = []
+    values: List[float] = []
+    parsed = []
+
+    for g, group in enumerate(groups):
+        try:
+            weight = float(group.get('weight', 0))
+            price = float(group.get('price', 0))
+            copies = int(group.get('copies', 0))
+        except (ValueError, TypeError):
+            parsed.append(None)
+            continue
+        if not math.isfinite(weight) or not math.isfinite(price):
+            parsed.append(None)
+            continue
+        if weight < 0:
+            raise ValueError(f"Book weight cannot be negative: {weight}")
+        parsed.append((weight, price, copies))
+
+        unit = max(math.ceil(weight / resolution - 1e-9), 0)
+        if price <= 0 or unit > capacity:
+            continue
+        # No more copies than fit on the shelf are ever useful
+        usable = copies if unit == 0 else min(copies, capacity // unit)
+        for count in split_copies(usable):
+            parts.append((g, count))
+            units.append(unit * count)
+            values.append(price * count)
+
+    best, taken_bits = knapsack_units(units, values, capacity)
+    chosen = [0] * len(groups)
+    for idx in reconstruct_units(units, taken_bits, capacity):
+        g, count = parts[idx]
+        chosen[g] += count
+
+    result_groups = []
+    max_value = 0
+    total_weight = 0.0
+    for g, count in enumerate(chosen):
+        if count == 0:
+            continue
+        weight, price, copies = parsed[g]
+        group = groups[g]
+        result_groups.append({
+            'isbn': group.get('isbn', 'N/A'),
+            'title': group.get('title', 'Unknown'),
+            'author': group.get('author', 'Unknown'),
+            'weight': weight,
+            'price': price,
+            'copies_available': copies,
+            'copies_chosen': count
+        })
+        max_value += price * count
+        total_weight += weight * count
+
+    return {
+        'max_value': max_value,
+        'total_weight': round(total_weight, 2),
+        'total_copies': sum(chosen),
+        'groups': result_groups,
+        'items': len(parts)
+    }
+
+
+__all__ = [
+    'split_copies',
+    'solve_bounded_shelf',
+]
@@ -0,0 +1,259 @@
+"""Dynamic Programming Knapsack Solver - Shelf Optimization.
+
+Pseudo-polynomial alternative to backtracking.solve_optimal_shelf for the
+same problem: choose the books that maximize the total value (COP) without
+exceeding the shelf capacity (Kg). The backtracking version explores the
+2^n include/exclude tree and becomes unusable beyond ~30 books; this one
+runs in O(n * W) where W is the capacity measured in resolution units
+(800 units for 8 Kg at 0.01 Kg).
+
+Discretization:
+    Weights are rounded UP and the capacity DOWN to multiples of
+    `resolution`, so every selection the DP accepts really fits on the
+    shelf. With the catalog's two-decimal weights and the default 0.01 Kg
+    resolution the discretization is exact; a coarser resolution is faster
+    but conservative (it may miss selections that only fit by a few grams).
+
+Memory:
+    - Rolling array: one row of W + 1 best values, updated per book with
+      slices (no n x W table).
+    - Reconstruction bitset: per book, one integer whose bit c says "the
+      book was taken at capacity c". n * W bits in total (100 KB for 1000
+      books at 8 Kg / 0.01 Kg), enough to rebuild the selection backwards.
+
+Capacity sweep:
+    The final row holds the optimum for every capacity 0..W at once, so
+    ShelfCapacitySweep keeps it (plus the bitsets) and answers "what if the
+    shelf held 6 / 10 / 12 Kg" without solving again.
+
+Ties:
+    A book is only taken when it strictly improves the value, so among
+    selections with the same maximum value the DP may return a different
+    one than the backtracking search. 'max_value' is the same.
+
+Author: Library Management System Team
+Date: 2025
+"""
+
+import math
+from operator import gt
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.algorithms.backtracking import build_shelf_result, parse_shelf_items
+
+# Default weight discretization step in Kg
+DEFAULT_RESOLUTION = 0.01
+
+# Translation table turning a bytes() of 0/1 flags into ASCII '0'/'1'
+_BIT_CHARS = bytes.maketrans(b'\x00\x01', b'01')
+
+
+def knapsack_units(units: List[Optional[int]], values: List[float],
+                   capacity: int) -> Tuple[List[float], List[int]]:
+    """0/1 knapsack DP over integer weights (resolution units).
+
+    Parameters:
+    - units: Integer weight of each item; None marks items to skip.
+    - values: Value of each item (parallel to units).
+    - capacity: Capacity in the same units.
+
+    Returns:
+    - (best, taken_bits): best[c] is the optimal value with at most c units;
+      bit c of taken_bits[i] is set when item i was taken at capacity c.
+    """
+    # best[c] = best value using at most c resolution units
+    best = [0.0] * (capacity + 1)
+    taken_bits: List[int] = []
+
+    for idx, unit in enumerate(units):
+        if unit is None or unit > capacity:
+            taken_bits.append(0)
+            continue
+        value = values[idx]
+        upper = best[unit:]
+        candidates = [v + value for v in best[:capacity + 1 - unit]]
+        taken = bytes(map(gt, candidates, upper))
+        # Bit (unit + t) set <=> item taken at capacity unit + t
+        taken_bits.append(int(taken.translate(_BIT_CHARS)[::-1] or b'0', 2) << unit)
+        best[unit:] = map(max, upper, candidates)
+
+    return best, taken_bits
+
+
+def reconstruct_units(units: List[Optional[int]], taken_bits: List[int], capacity: int) -> List[int]:
+    """Ascending indices of the items chosen at `capacity` (see knapsack_units)."""
+    selection = []
+    c = capacity
+    # Walk the items backwards from the requested capacity
+    for idx in range(len(units) - 1, -1, -1):
+        if taken_bits[idx] >> c & 1:
+            selection.append(idx)
+            c -= units[idx]
+    selection.reverse()
+    return selection
+
+
+class ShelfCapacitySweep:
+    """Optimal shelf selections for EVERY capacity 0..max_capacity from one solve.
+
+    The final DP row best[c] already holds the optimal value for each
+    capacity c (in resolution units), and the per-book reconstruction
+    bitsets record the take decision at every capacity, so any capacity up
+    to max_capacity can be answered without solving again:
+
+    - value_at(c): O(1), read from the final row.
+    - solution_at(c): O(n), backward walk through the bitsets from c.
+
+    Answers are exact optima only when no rounding happened: see exact and
+    is_exact_at(). Otherwise they are feasible but may be below the optimum.
+
+    Example:
+    >>> sweep = ShelfCapacitySweep(books, max_capacity=12.0)
+    >>> sweep.value_at(6.0), sweep.value_at(10.0)
+    >>> sweep.solution_at(8.0)['books']
+    """
+
+    def __init__(self, books_data: List[Dict[str, Any]], max_capacity: float = 8.0,
+                 resolution: float = DEFAULT_RESOLUTION):
+        """Run the DP once for capacities 0..max_capacity.
+
+        Parameters:
+        - books_data: List of dictionaries with 'weight' (Kg) and 'price'
+          (COP) keys, plus optional 'id', 'title' and 'author'.
+        - max_capacity: Largest capacity that will be queried (Kg).
+        - resolution: Weight discretization step in Kg (default 0.01).
+
+        Raises:
+        - ValueError: if resolution is not positive or a weight is negative.
+
+        Complexity:
+        - Time: O(n * W) with W = max_capacity / resolution
+        - Space: O(W) for the final row + O(n * W) bits for reconstruction
+        """
+        if resolution <= 0:
+            raise ValueError("resolution must be positive")
+
+        self.books_data = books_data
+        self.max_capacity = max_capacity
+        self.resolution = resolution
+        self.weights, self.values = parse_shelf_items(books_data)
+        capacity = self._units(max_capacity)
+
+        # Discretized weight of each usable book (heavier than the shelf = unusable)
+        self._item_units: List[Optional[int]] = []
+        # True while every usable weight is a multiple of the resolution
+        self.exact = True
+        for weight in self.weights:
+            unit = None
+            if weight is not None:
+                unit = max(math.ceil(weight / resolution - 1e-9), 0)
+                if unit > capacity:
+                    unit = None
+                elif not self._on_grid(weight):
+                    self.exact = False
+            self._item_units.append(unit)
+
+        self._best, self._taken_bits = knapsack_units(self._item_units, self.values, capacity)
+
+    def _on_grid(self, amount: float) -> bool:
+        """Whether `amount` Kg is a multiple of the resolution (up to float noise)."""
+        steps = amount / self.resolution
+        return abs(steps - round(steps)) <= 1e-9 * max(abs(steps), 1.0)
+
+    def is_exact_at(self, capacity: float) -> bool:
+        """Whether solution_at(capacity) is the exact optimum.
+
+        True when every usable weight and the capacity are multiples of the
+        resolution, so the discretization lost nothing. Otherwise a
+        selection that only fits by less than one resolution step may be
+        missed.
+        """
+        return self.exact and self._on_grid(capacity)
+
+    def _units(self, capacity: float) -> int:
+        """Capacity in resolution units, rounded down."""
+        return math.floor(capacity / self.resolution + 1e-9) if capacity > 0 else 0
+
+    def _checked_units(self, capacity: float) -> int:
+        if capacity > self.max_capacity + self.resolution * 1e-6:
+            raise ValueError(
+                f"capacity {capacity} exceeds the sweep maximum of {self.max_capacity} Kg"
+            )
+        return min(self._units(capacity), len(self._best) - 1)
+
+    def value_at(self, capacity: float) -> float:
+        """Maximum value achievable with `capacity` Kg (O(1)).
+
+        Raises:
+        - ValueError: if capacity exceeds max_capacity.
+        """
+        return self._best[self._checked_units(capacity)]
+
+    def solution_at(self, capacity: float) -> Dict[str, Any]:
+        """Optimal selection for `capacity` Kg, as solve_optimal_shelf returns it.
+
+        Raises:
+        - ValueError: if capacity exceeds max_capacity.
+        """
+        c = self._checked_units(capacity)
+
+        selection = reconstruct_units(self._item_units, self._taken_bits, c)
+
+        max_value = 0
+        for idx in selection:
+            max_value += self.values[idx]
+
+        return build_shelf_result(self.books_data, self.weights, self.values, selection, max_value)
+
+    def curve(self, step: Optional[float] = None) -> List[Tuple[float, float]]:
+        """(capacity, optimal value) pairs from 0 to max_capacity.
+
+        Parameters:
+        - step: Capacity step in Kg (default: the resolution, every point).
+        """
+        stride = max(self._units(step), 1) if step else 1
+        return [(round(c * self.resolution, 6), self._best[c])
+                for c in range(0, len(self._best), stride)]
+
+
+def solve_optimal_shelf_dp(books_data: List[Dict[str, Any]], max_capacity: float = 8.0,
+                           resolution: float = DEFAULT_RESOLUTION) -> Dict[str, Any]:
+    """Solve the shelf knapsack problem with dynamic programming.
+
+    Parameters:
+    - books_data: List of dictionaries with 'weight' (Kg) and 'price' (COP)
+      keys, plus optional 'id', 'title' and 'author'. Books with invalid or
+      non-finite data are skipped.
+    - max_capacity: Maximum shelf weight in Kg (default 8.0).
+    - resolution: Weight discretization step in Kg (default 0.01).
+
+    Returns:
+    - Same dictionary as backtracking.solve_optimal_shelf: 'max_value',
+      'total_weight', 'books' and 'indices' (indices into books_data).
+
+    Raises:
+    - ValueError: if resolution is not positive or a weight is negative.
+
+    Complexity:
+    - Time: O(n * W) with W = max_capacity / resolution
+    - Space: O(W) for the rolling array + O(n * W) bits for reconstruction
+
+    Example:
+    >>> books = [
+    ...     {'id': 'B1', 'weight': 3.0, 'price': 300},
+    ...     {'id': 'B2', 'weight': 4.0, 'price': 350},
+    ...     {'id': 'B3', 'weight': 2.5, 'price': 200}
+    ... ]
+    >>> solve_optimal_shelf_dp(books, max_capacity=7.0)['indices']
+    [0, 1]
+    """
+    return ShelfCapacitySweep(books_data, max_capacity, resolution).solution_at(max_capacity)
+
+
+__all__ = [
+    'DEFAULT_RESOLUTION',
+    'knapsack_units',
+    'reconstruct_units',
+    'ShelfCapacitySweep',
+    'solve_optimal_shelf_dp',
+]
@@ -0,0 +1,204 @@
+"""Meet-in-the-Middle Knapsack Solver - Shelf Optimization.
+
+Exact solver for medium catalogs with real-valued weights, where the plain
+backtracking search (2^n nodes) is too slow and the DP solver's weight
+discretization is not acceptable.
+
+Idea:
+    The candidate books are split into two halves A and B.
+
+    1. Enumerate every subset of each half that fits on the shelf, as
+       parallel (weight, value, mask) lists: 2^(n/2) subsets per half.
+    2. Sort B's subsets by weight and build a running prefix-max of their
+       value (with the position of that maximum).
+    3. For each subset of A, bisect B for the heaviest subsets that still
+       fit in the remaining capacity; the prefix-max gives the best of them.
+
+    Time O(2^(n/2) * n), memory O(2^(n/2)): 40 candidates means two halves
+    of 2^20 (~10^6) subsets instead of 2^40 (~10^12) tree nodes.
+
+    Half sums are added in a different order than the backtracking search,
+    so all weights are first converted to the exact integer units of
+    backtracking.weight_units: a selection weighing exactly the capacity
+    is then found by both solvers.
+
+Candidates:
+    Books heavier than the shelf or without a positive price can never
+    improve a selection and are dropped before splitting, so `n` above
+    counts only candidate books (see count_shelf_candidates).
+
+Method selection:
+    choose_shelf_method() is the auto-chooser used by BookService
+    (method='auto'): plain backtracking for small inputs, meet in the middle
+    while 2^(n/2) subsets fit comfortably in memory, and branch and bound
+    beyond that. The size bounds hold for candidate books only, so the
+    chosen solver must be run on the candidates (solve_on_candidates).
+
+Author: Library Management System Team
+Date: 2025
+"""
+
+from bisect import bisect_right
+from itertools import repeat
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from utils.algorithms.backtracking import build_shelf_result, parse_shelf_items, weight_units
+
+# Up to this many candidates plain backtracking is fast enough
+BACKTRACKING_MAX_ITEMS = 20
+
+# Up to this many candidates meet in the middle is used (2 x 2^20 subsets)
+MITM_MAX_ITEMS = 40
+
+
+def shelf_candidates(weights: List[Optional[float]], values: List[Optional[float]],
+                     max_capacity: float) -> List[int]:
+    """Indices of the books that can improve a shelf selection.
+
+    A book is a candidate when its data is valid, it fits on the shelf on
+    its own and its price is positive.
+    """
+    return [i for i, w in enumerate(weights)
+            if w is not None and w <= max_capacity and values[i] > 0]
+
+
+def count_shelf_candidates(books_data: List[Dict[str, Any]], max_capacity: float = 8.0) -> int:
+    """Number of candidate books (see shelf_candidates) in books_data."""
+    weights, values = parse_shelf_items(books_data)
+    return len(shelf_candidates(weights, values, max_capacity))
+
+
+def choose_shelf_method(num_candidates: int) -> str:
+    """Pick a shelf solver for `num_candidates` candidate books.
+
+    Returns:
+    - 'backtracking' up to BACKTRACKING_MAX_ITEMS,
+    - 'meet_in_the_middle' up to MITM_MAX_ITEMS,
+    - 'branch_and_bound' otherwise.
+    """
+    if num_candidates <= BACKTRACKING_MAX_ITEMS:
+        return 'backtracking'
+    if num_candidates <= MITM_MAX_ITEMS:
+        return 'meet_in_the_middle'
+    return 'branch_and_bound'
+
+
+def solve_on_candidates(books_data: List[Dict[str, Any]], max_capacity: float,
+                        solver: Callable[[List[Dict[str, Any]]], Dict[str, Any]]) -> Dict[str, Any]:
+    """Run a shelf solver on the candidate books only.
+
+    Non-candidates can never improve a selection, and choose_shelf_method's
+    size bounds count candidates only, so the exponential solvers must not
+    see the others. 'indices' of the result are mapped back to books_data.
+
+    Parameters:
+    - books_data: List of dictionaries containing book information.
+    - max_capacity: Maximum weight capacity in Kg.
+    - solver: Callable taking a books_data list and returning a shelf result.
+
+    Returns:
+    - The solver's result, with 'indices' referring to books_data.
+    """
+    weights, values = parse_shelf_items(books_data)
+    candidates = shelf_candidates(weights, values, max_capacity)
+    result = solver([books_data[i] for i in candidates])
+    result['indices'] = [candidates[i] for i in result['indices']]
+    return result
+
+
+def _subset_sums(weights: List[int], values: List[float],
+                 max_capacity: int) -> Tuple[List[int], List[float], List[int]]:
+    """Weight, value and bit mask of every subset of the items that fits."""
+    sub_w = [0]
+    sub_v = [0.0]
+    masks = [0]
+    for bit, (w, v) in enumerate(zip(weights, values)):
+        flag = 1 << bit
+        # Only subsets that still fit are extended with the new item
+        fitting = [k for k, sw in enumerate(sub_w) if sw + w <= max_capacity]
+        sub_w += [sub_w[k] + w for k in fitting]
+        sub_v += [sub_v[k] + v for k in fitting]
+        masks += [masks[k] | flag for k in fitting]
+    return sub_w, sub_v, masks
+
+
+def solve_optimal_shelf_mitm(books_data: List[Dict[str, Any]], max_capacity: float = 8.0) -> Dict[str, Any]:
+    """Solve the shelf knapsack problem exactly with meet in the middle.
+
+    Parameters:
+    - books_data: List of dictionaries containing book information
+                  ('id', 'title', 'author', 'weight', 'price').
+    - max_capacity: Maximum weight capacity in Kg (default 8.0).
+
+    Returns:
+    - Same dictionary as backtracking.solve_optimal_shelf: 'max_value',
+      'total_weight', 'books' and 'indices'.
+
+    Raises:
+    - ValueError: if a book has a negative weight.
+
+    Complexity:
+    - Time: O(2^(n/2) * n) with n candidate books
+    - Space: O(2^(n/2))
+
+    Among selections with the same maximum value, the one returned may
+    differ from solve_optimal_shelf.
+    """
+    weights, values = parse_shelf_items(books_data)
+    candidates = shelf_candidates(weights, values, max_capacity)
+    units, capacity, _ = weight_units(weights, max_capacity)
+
+    half = len(candidates) // 2
+    left, right = candidates[:half], candidates[half:]
+    left_w, left_v, left_masks = _subset_sums([units[i] for i in left],
+                                              [values[i] for i in left], capacity)
+    right_w, right_v, right_masks = _subset_sums([units[i] for i in right],
+                                                 [values[i] for i in right], capacity)
+
+    # Right half sorted by weight with a running maximum of value
+    order = sorted(range(len(right_w)), key=right_w.__getitem__)
+    sorted_w = [right_w[k] for k in order]
+    best_upto: List[float] = []
+    best_pos: List[int] = []
+    running, running_pos = -1.0, 0
+    for k in order:
+        if right_v[k] > running:
+            running, running_pos = right_v[k], k
+        best_upto.append(running)
+        best_pos.append(running_pos)
+
+    # Bisect the heaviest fitting right subsets for every left subset
+    remaining = [capacity - w for w in left_w]
+    positions = map(bisect_right, repeat(sorted_w), remaining)
+
+    best_value = 0.0
+    best_masks = (0, 0)
+    for a, pos in enumerate(positions):
+        if pos == 0:
+            continue
+        total = left_v[a] + best_upto[pos - 1]
+        if total > best_value:
+            best_value = total
+            best_masks = (left_masks[a], right_masks[best_pos[pos - 1]])
+
+    selection = sorted(
+        [idx for bit, idx in enumerate(left) if best_masks[0] >> bit & 1]
+        + [idx for bit, idx in enumerate(right) if best_masks[1] >> bit & 1]
+    )
+
+    max_value = 0
+    for idx in selection:
+        max_value += values[idx]
+
+    return build_shelf_result(books_data, weights, values, selection, max_value)
+
+
+__all__ = [
+    'BACKTRACKING_MAX_ITEMS',
+    'MITM_MAX_ITEMS',
+    'shelf_candidates',
+    'count_shelf_candidates',
+    'choose_shelf_method',
+    'solve_on_candidates',
+    'solve_optimal_shelf_mitm',
+]
@@ -0,0 +1,93 @@
+"""parallel_sort.py
+
+Multi-process Merge Sort over precomputed key arrays.
+
+The key array is split into contiguous chunks. Each chunk is sorted in a
+worker process with the bottom-up Merge Sort
+(AlgoritmosOrdenamiento.merge_sort_bottom_up_indices) and the sorted chunks
+are k-way merged in the calling process with ``heapq.merge``. Only the keys
+travel to the workers (not the Book objects), and only sorted keys plus
+positions come back.
+
+The result is the same stable permutation the sequential sort produces:
+chunks are contiguous, each is sorted stably, and ``heapq.merge`` resolves
+ties in favour of the earlier chunk.
+
+Small inputs are sorted in-process (starting a pool costs more than it
+saves); if a process pool cannot be started on the platform the sort also
+falls back to the sequential path.
+
+Example:
+    >>> from utils.algorithms.parallel_sort import parallel_merge_sort_indices
+    >>> prices = [book.get_price() for book in books]
+    >>> order = parallel_merge_sort_indices(prices, workers=4)
+    >>> books_by_price = [books[i] for i in order]
+
+Author: Library Management System
+Date: 2025-12-02
+"""
+
+import heapq
+import os
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+from typing import Any, List, Optional, Tuple
+
+from utils.algorithms.AlgoritmosOrdenamiento import merge_sort_bottom_up_indices
+from utils.logger import LibraryLogger
+
+logger = LibraryLogger.get_logger(__name__)
+
+# Inputs smaller than this are sorted in the calling process
+PARALLEL_MIN_SIZE = 200_000
+
+
+def _sort_chunk(args: Tuple[List[Any], int]) -> Tuple[List[Any], List[int]]:
+    """Worker: sort one chunk, returning its sorted keys and global positions."""
+    claves, desplazamiento = args
+    orden = merge_sort_bottom_up_indices(claves)
+    return [claves[i] for i in orden], [desplazamiento + i for i in orden]
+
+
+def parallel_merge_sort_indices(
+    claves: List[Any],
+    workers: Optional[int] = None,
+    min_size: int = PARALLEL_MIN_SIZE,
+) -> List[int]:
+    """Return the stable ascending permutation of `claves` using several processes.
+
+    Parameters:
+    - claves: Precomputed, picklable and mutually comparable keys (prices).
+    - workers: Number of worker processes (default: os.cpu_count()).
+    - min_size: Inputs with fewer keys are sorted in-process.
+
+    Returns:
+    - Positions of `claves` in ascending key order (ties keep input order).
+
+    Complexity:
+    - O((n/p) log (n/p)) per worker plus O(n log p) for the final merge.
+    """
+    n = len(claves)
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or n < max(min_size, 2):
+        return merge_sort_bottom_up_indices(claves)
+
+    tamano = -(-n // workers)  # ceil(n / workers)
+    trozos = [(claves[inicio:inicio + tamano], inicio) for inicio in range(0, n, tamano)]
+
+    try:
+        with ProcessPoolExecutor(max_workers=len(trozos)) as pool:
+            ordenados = list(pool.map(_sort_chunk, trozos))
+    except (OSError, NotImplementedError) as e:
+        logger.warning(f"Process pool unavailable ({e}); sorting in-process")
+        return merge_sort_bottom_up_indices(claves)
+
+    # k-way merge of the sorted chunks (stable: earlier chunk wins ties)
+    mezclados = heapq.merge(*(zip(cl, pos) for cl, pos in ordenados), key=itemgetter(0))
+    return [posicion for _, posicion in mezclados]
+
+
+__all__ = [
+    'PARALLEL_MIN_SIZE',
+    'parallel_merge_sort_indices',
+]
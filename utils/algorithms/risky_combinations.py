@@ -0,0 +1,771 @@
+"""Pruned, output-sensitive risky 4-book combination finder.
+
+Fast engine for the same problem solved by brute_force.find_risky_combinations:
+list every combination of four books whose combined weight exceeds a
+threshold (shelf capacity). The brute-force version stays in brute_force.py
+as the reference implementation; this module returns exactly the same
+result (same combinations, same order, same rounded totals).
+
+Idea:
+    The weights are parsed once and sorted in DESCENDING order into a flat
+    array W. Combinations are then enumerated as positions a < b < c < d of
+    W, which makes two bounds available at every prefix:
+
+    - Heaviest completion: the next positions after the prefix hold the
+      largest remaining weights. If even prefix + W[next...] cannot exceed
+      the threshold, no completion of this prefix can, and neither can any
+      later prefix at the same level (weights only decrease), so the loop
+      at that level stops (whole subtree skipped).
+    - Lightest completion: the last positions of W hold the smallest
+      weights. If prefix + W[last...] already exceeds the threshold, EVERY
+      completion is risky and they are emitted in bulk without summing.
+
+    Every prefix that survives the first test has at least one risky
+    completion, so the work is proportional to the number of risky
+    combinations (plus O(n log n) for the sort) instead of C(n, 4).
+
+Floating point:
+    The bounds are sums in sorted order, while the reference adds the four
+    weights in catalog order. The decisions above therefore use a small
+    tolerance band around the threshold; combinations whose approximate sum
+    falls inside the band are checked with the exact reference sum. The
+    result is identical to the brute-force output.
+
+Streaming:
+    iter_risky_quadruples is the lazy form of the engine: it yields compact
+    index tuples in descending-position order (lexicographic over the
+    positions of the books in descending weight order, so sets with the
+    heaviest books come first, but their totals are NOT monotone; see
+    iter_heaviest_quadruples for that), accepts a cancellation token, reports
+    progress over the outer loop and stops at `limit`. risky_index_quadruples
+    and find_risky_combinations_pruned are built on it; build_combination
+    turns one tuple into the reference result dict on demand.
+    find_risky_combinations_anytime runs it under a time budget and returns
+    the partial list, its coverage and a frontier to resume from.
+
+Top-K heaviest:
+    iter_heaviest_quadruples yields the 4-subsets in exactly non-increasing
+    weight order with a best-first search over the sorted positions: the
+    heaviest set is (0, 1, 2, 3), and the successors of (a, b, c, d) move
+    one position to the next lighter book while keeping them increasing.
+    A successor never weighs more than its parent, so a max-heap of the
+    frontier pops the sets heaviest-first; K sets cost O(K log K) after the
+    O(n log n) sort. find_top_risky_combinations stops at the first set
+    that no longer exceeds the threshold.
+
+Counting without enumerating:
+    count_risky_combinations / risky_excess_histogram answer "how many" in
+    O(n^2 log n) without producing a single combination. Every 4-subset
+    splits into two disjoint pairs in exactly 3 ways, so with the sorted
+    array S of the n(n-1)/2 pair sums:
+
+        risky 4-subsets = (risky pairs of DISTINCT pairs
+                           - risky pairs of pairs sharing one book) / 3
+
+    The first term is one bisect in S per pair sum (minus the pair paired
+    with itself, then halved); the second is one bisect per pair sum in
+    the sorted array of doubled weights, minus the cases where the shared
+    book is inside the pair. All bisects run through map() at C speed.
+
+    When the weights, threshold and bin width have at most 6 decimals (the
+    catalog stores weights like 1.25), they are scaled to integers and the
+    bisects are exact. The brute force, however, adds floats, which can
+    round a combination weighing exactly the threshold up
+    (2.1 + 2.2 + 1.9 + 1.8 gives 8.000000000000002 > 8.0) and report it.
+    To stay consistent with the listed combinations, those exact ties are
+    enumerated from the pair sums and re-checked with the float sum in
+    catalog order (skipped above _MAX_TIE_CHECKS ties, where the count is
+    the exact decimal one). With more decimals the bisects use floats and
+    may differ from the brute force only on such boundary cases.
+
+Author: Library Management System Team
+Date: 2025
+"""
+
+import heapq
+import math
+import time
+from bisect import bisect_right
+from collections import defaultdict
+from decimal import Decimal
+from itertools import combinations, islice, repeat
+from operator import sub
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from utils.algorithms.brute_force import find_risky_combinations
+
+
+def parse_weights(books_data: List[Dict[str, Any]]) -> List[Optional[float]]:
+    """Convert every weight once, like the reference (None = invalid weight)."""
+    weights = []
+    for book in books_data:
+        try:
+            weights.append(float(book.get('weight', 0)))
+        except (ValueError, TypeError):
+            weights.append(None)
+    return weights
+
+
+def _tolerance(weights: List[float], threshold: float) -> float:
+    """Width of the band in which bound decisions fall back to exact sums."""
+    scale = max([abs(threshold), 1.0] + [4 * abs(w) for w in weights])
+    return scale * 1e-9
+
+
+def iter_risky_quadruples(
+    weights: List[Optional[float]],
+    threshold: float = 8.0,
+    cancel: Optional[Any] = None,
+    progress: Optional[Callable[[float], None]] = None,
+    limit: Optional[int] = None,
+    start: int = 0,
+    trace: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Iterator[Tuple[int, int, int, int]]:
+    """Lazily yield the index quadruples (i < j < k < m) exceeding `threshold`.
+
+    Streaming form of the pruned engine: nothing is accumulated, every risky
+    combination is yielded as a compact tuple of catalog indices as soon as
+    it is found. Combinations come in descending-position order
+    (lexicographic over positions in descending weight order): sets with
+    the heaviest books come first, but a later set can weigh more than an
+    earlier one. This is neither brute-force order (use
+    risky_index_quadruples()) nor total-weight order (use
+    iter_heaviest_quadruples()).
+
+    Parameters:
+    - weights: One float per book, or None for books with an invalid weight
+      (those never take part in a combination, as in the reference).
+      Weights must be finite.
+    - threshold: Weight threshold in Kg.
+    - cancel: Optional cancellation token, any object with is_set() (e.g.
+      threading.Event). It is polled inside the loops; once set the
+      generator stops without raising.
+    - progress: Optional callable receiving the fraction (0.0-1.0) of the
+      outer loop completed. Called after every outer iteration and with 1.0
+      when the enumeration ends (also when pruning ends it early); not
+      called after a cancellation or when `limit` is reached.
+    - limit: Stop after yielding this many combinations (None = no limit).
+    - start: First outer position (in descending weight order) to enumerate;
+      used to resume an interrupted enumeration (see
+      find_risky_combinations_anytime).
+    - trace: Optional step-trace hook (see tracing.TraceRecorder), called
+      with {'event': 'node', 'prefix'} for every 3-book prefix whose last
+      book is scanned one by one, and with {'event': 'prune', 'level',
+      'prefix', 'skipped'} when a bound cuts a subtree ('skipped' = number
+      of combinations it contained). Prefixes are positions in descending
+      weight order; bulk-emitted subtrees produce no events.
+
+    Yields:
+    - Ascending tuples of 4 catalog indices.
+
+    Complexity:
+    - Time: O(n log n + R) for R yielded combinations. Space: O(n).
+    """
+    order = sorted((i for i, w in enumerate(weights) if w is not None), key=lambda i: -weights[i])
+    W = [weights[i] for i in order]
+    n = len(W)
+    remaining = -1 if limit is None else limit
+    if n < 4 or remaining == 0:
+        if progress is not None and remaining != 0:
+            progress(1.0)
+        return
+
+    eps = _tolerance(W, threshold)
+    upper = threshold + eps   # approximate sum above this: certainly risky
+    lower = threshold - eps   # approximate sum at or below this: certainly not
+    cancelled = cancel.is_set if cancel is not None else (lambda: False)
+    outer_total = n - 3
+
+    def quadruple(a: int, b: int, c: int, d: int) -> Tuple[int, int, int, int]:
+        return tuple(sorted((order[a], order[b], order[c], order[d])))
+
+    def completions(a: int, b: int, c: int) -> Iterator[Tuple[int, int, int, int]]:
+        # Risky d positions form a prefix of (c, n): bulk part first,
+        # then the few inside the tolerance band checked exactly
+        sabc = W[a] + W[b] + W[c]
+        if trace is not None:
+            trace({'event': 'node', 'prefix': (a, b, c)})
+        d = c + 1
+        while d < n and sabc + W[d] > upper:
+            yield quadruple(a, b, c, d)
+            d += 1
+        while d < n and sabc + W[d] > lower:
+            # Reference arithmetic: add the weights in catalog order
+            i, j, k, m = quadruple(a, b, c, d)
+            if weights[i] + weights[j] + weights[k] + weights[m] > threshold:
+                yield (i, j, k, m)
+            d += 1
+        if trace is not None and d < n:
+            trace({'event': 'prune', 'level': 'last', 'prefix': (a, b, c), 'skipped': n - d})
+
+    def prefix(a: int) -> Iterator[Tuple[int, int, int, int]]:
+        wa = W[a]
+        # Lightest completion already exceeds: every (b, c, d) is risky
+        if wa + W[n - 3] + W[n - 2] + W[n - 1] > upper:
+            for b, c, d in combinations(range(a + 1, n), 3):
+                yield quadruple(a, b, c, d)
+            return
+        for b in range(a + 1, n - 2):
+            sab = wa + W[b]
+            if sab + W[b + 1] + W[b + 2] <= lower:
+                if trace is not None:
+                    trace({'event': 'prune', 'level': 'second', 'prefix': (a, b),
+                           'skipped': math.comb(n - b, 3)})
+                break
+            if sab + W[n - 2] + W[n - 1] > upper:
+                for c, d in combinations(range(b + 1, n), 2):
+                    yield quadruple(a, b, c, d)
+                continue
+            for c in range(b + 1, n - 1):
+                if sab + W[c] + W[c + 1] <= lower:
+                    if trace is not None:
+                        trace({'event': 'prune', 'level': 'third', 'prefix': (a, b, c),
+                               'skipped': math.comb(n - c, 2)})
+                    break
+                yield from completions(a, b, c)
+
+    for a in range(start, outer_total):
+        # Heaviest completion of a cannot exceed: nor can any later a
+        if W[a] + W[a + 1] + W[a + 2] + W[a + 3] <= lower:
+            if trace is not None:
+                trace({'event': 'prune', 'level': 'first', 'prefix': (a,), 'skipped': math.comb(n - a, 4)})
+            break
+        for combination in prefix(a):
+            if cancelled():
+                return
+            yield combination
+            remaining -= 1
+            if remaining == 0:
+                return
+        if cancelled():
+            return
+        if progress is not None:
+            progress((a + 1) / outer_total)
+
+    if progress is not None:
+        progress(1.0)
+
+
+def risky_index_quadruples(weights: List[Optional[float]], threshold: float = 8.0) -> List[Tuple[int, int, int, int]]:
+    """Return the index quadruples (i < j < k < m) whose weight sum exceeds `threshold`.
+
+    Parameters:
+    - weights: One float per book, or None for books with an invalid weight
+      (those never take part in a combination, as in the reference).
+      Weights must be finite.
+    - threshold: Weight threshold in Kg.
+
+    Returns:
+    - List of ascending index tuples in lexicographic order, i.e. the order
+      in which the reference nested loops would report them.
+
+    Complexity:
+    - Time: O(n log n + R) bound checks, where R is the number of risky
+      combinations, plus O(R log R) to put them in reference order.
+    - Space: O(n + R).
+    """
+    return sorted(iter_risky_quadruples(weights, threshold))
+
+
+def build_combination(books_data: List[Dict[str, Any]], weights: List[float],
+                       indices: Tuple[int, int, int, int], threshold: float) -> Dict[str, Any]:
+    """Build the reference result dict for one risky index quadruple.
+
+    Parameters:
+    - books_data: The book dictionaries the indices refer to.
+    - weights: Parsed weights, parallel to books_data (see iter_risky_quadruples).
+    - indices: Ascending tuple of 4 indices.
+    - threshold: Weight threshold in Kg (for 'excess').
+
+    Returns:
+    - {'books': [4 x {'id', 'title', 'author', 'weight'}], 'total_weight', 'excess'}
+    """
+    i, j, k, m = indices
+    total_weight = weights[i] + weights[j] + weights[k] + weights[m]
+    return {
+        'books': [
+            {
+                'id': books_data[idx].get('id', 'N/A'),
+                'title': books_data[idx].get('title', 'Unknown'),
+                'author': books_data[idx].get('author', 'Unknown'),
+                'weight': weights[idx]
+            }
+            for idx in indices
+        ],
+        'total_weight': round(total_weight, 2),
+        'excess': round(total_weight - threshold, 2)
+    }
+
+
+def find_risky_combinations_pruned(books_data: List[Dict[str, Any]], threshold: float = 8.0) -> List[Dict[str, Any]]:
+    """Find all 4-book combinations exceeding `threshold` with pruning.
+
+    Drop-in replacement for brute_force.find_risky_combinations: same
+    parameters, same result format and order (see module docstring for how
+    subtrees are skipped and completions emitted in bulk).
+
+    Parameters:
+    - books_data: List of dictionaries with at least 'id', 'title', 'weight'.
+    - threshold: Maximum weight threshold in Kg (default 8.0).
+
+    Returns:
+    - List of dictionaries with 'books', 'total_weight' and 'excess'.
+
+    Complexity:
+    - Time: O(n log n + R log R) where R is the number of risky combinations
+      (the brute force is always Θ(n^4)).
+    - Space: O(n + R).
+
+    Notes:
+    - Non-finite weights (inf/nan) defeat the bounds; in that unusual case
+      the reference brute force is used.
+    """
+    weights = parse_weights(books_data)
+    if any(w is not None and not math.isfinite(w) for w in weights):
+        return find_risky_combinations(books_data, threshold)
+
+    return [
+        build_combination(books_data, weights, indices, threshold)
+        for indices in risky_index_quadruples(weights, threshold)
+    ]
+
+
+class _Deadline:
+    """Cancellation token (is_set()) that fires once a perf_counter deadline passes.
+
+    It only fires once armed (after the first result), so every call that
+    has results left makes progress.
+    """
+
+    def __init__(self, deadline: Optional[float]):
+        self.deadline = deadline
+        self.armed = False
+        self.fired = False
+
+    def is_set(self) -> bool:
+        if self.armed and self.deadline is not None and time.perf_counter() > self.deadline:
+            self.fired = True
+        return self.fired
+
+
+def find_risky_combinations_anytime(books_data: List[Dict[str, Any]], threshold: float = 8.0,
+                                    time_budget: Optional[float] = None,
+                                    frontier: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Enumerate risky combinations within a time budget, resumable.
+
+    Runs the streaming engine (descending-position order) until `time_budget` expires
+    and returns what was found so far. Every call that has combinations
+    left returns at least one, and the frontier resumes exactly after the
+    last one returned: concatenating the 'combinations' of successive calls
+    gives the full iter_risky_quadruples list without duplicates or gaps.
+
+    Parameters:
+    - books_data: List of dictionaries with at least 'id', 'title', 'weight'.
+    - threshold: Maximum weight threshold in Kg (default 8.0).
+    - time_budget: Maximum time in seconds (None = run to completion).
+    - frontier: 'frontier' of a previous interrupted call (same books and
+      threshold) to continue from.
+
+    Returns:
+    - Dictionary containing:
+        * 'combinations': Risky combinations found in this call (same
+          dictionaries as find_risky_combinations)
+        * 'complete': True once the enumeration is finished
+        * 'coverage': Fraction of all C(n, 4) combinations already decided,
+          counting fully enumerated outer positions only (a lower bound;
+          1.0 when complete)
+        * 'frontier': State to resume from, or None when complete
+
+    Raises:
+    - ValueError: for non-finite weights or a frontier from another problem.
+
+    Notes:
+    - Resuming inside an outer position regenerates (without building) the
+      combinations of that position already returned, about 1 us each.
+    """
+    weights = parse_weights(books_data)
+    if any(w is not None and not math.isfinite(w) for w in weights):
+        raise ValueError("anytime enumeration requires finite weights")
+    n = sum(w is not None for w in weights)
+
+    start, skip = 0, 0
+    if frontier is not None:
+        if frontier.get('valid') != n or frontier.get('threshold') != threshold:
+            raise ValueError("frontier does not belong to this problem")
+        start, skip = frontier['next_outer'], frontier['skip']
+
+    outer_total = max(n - 3, 0)
+    found: List[Dict[str, Any]] = []
+    # Last fully enumerated outer position and the results collected up to it
+    boundary = {'outer': start, 'length': 0, 'ticked': False}
+
+    def on_progress(fraction: float) -> None:
+        boundary['outer'] = round(fraction * outer_total) if fraction < 1.0 else outer_total
+        boundary['length'] = len(found)
+        boundary['ticked'] = True
+
+    deadline = _Deadline(time.perf_counter() + time_budget if time_budget is not None else None)
+    stream = iter_risky_quadruples(weights, threshold, cancel=deadline, progress=on_progress, start=start)
+    # Results are built inside the loop so the budget also covers that cost
+    for indices in islice(stream, skip, None):
+        found.append(build_combination(books_data, weights, indices, threshold))
+        deadline.armed = True
+
+    complete = not deadline.fired
+    next_frontier = None
+    if not complete:
+        # Results of the unfinished outer position, counting earlier calls
+        partial = len(found) - boundary['length']
+        if not boundary['ticked']:
+            partial += skip
+        next_frontier = {
+            'next_outer': boundary['outer'],
+            'skip': partial,
+            'valid': n,
+            'threshold': threshold
+        }
+
+    total = math.comb(n, 4)
+    decided = total if complete else total - math.comb(n - boundary['outer'], 4)
+    return {
+        'combinations': found,
+        'complete': complete,
+        'coverage': decided / total if total else 1.0,
+        'frontier': next_frontier
+    }
+
+
+def iter_heaviest_quadruples(weights: List[Optional[float]]) -> Iterator[Tuple[Tuple[int, int, int, int], float]]:
+    """Lazily yield every 4-book combination from heaviest to lightest.
+
+    Best-first search over positions in descending weight order: a heap
+    holds the frontier, each popped set (a, b, c, d) pushes the sets where
+    one position moves one step lighter (keeping a < b < c < d), and a seen
+    set stops a combination from being pushed twice.
+
+    Parameters:
+    - weights: One float per book, or None for books with an invalid weight
+      (those never take part in a combination). Weights must be finite.
+
+    Yields:
+    - (ascending tuple of 4 catalog indices, approximate total weight).
+      Totals are non-increasing; they are summed in sorted order and may
+      differ from the catalog-order sum in the last bit.
+
+    Complexity:
+    - Time: O(n log n) before the first result, then O(log K) per result
+      for K yielded results. Space: O(n + K).
+    """
+    order = sorted((i for i, w in enumerate(weights) if w is not None), key=lambda i: -weights[i])
+    W = [weights[i] for i in order]
+    n = len(W)
+    if n < 4:
+        return
+
+    start = (0, 1, 2, 3)
+    # Sums are always added in position order so that a lighter position
+    # can never round a successor above its parent
+    heap = [(-(W[0] + W[1] + W[2] + W[3]), start)]
+    seen = {start}
+    while heap:
+        total, positions = heapq.heappop(heap)
+        yield tuple(sorted(order[p] for p in positions)), -total
+        for level in range(4):
+            moved = positions[level] + 1
+            if moved == (positions[level + 1] if level < 3 else n):
+                continue
+            successor = positions[:level] + (moved,) + positions[level + 1:]
+            if successor not in seen:
+                seen.add(successor)
+                a, b, c, d = successor
+                heapq.heappush(heap, (-(W[a] + W[b] + W[c] + W[d]), successor))
+
+
+def find_top_risky_combinations(books_data: List[Dict[str, Any]], k: int = 10,
+                                threshold: float = 8.0) -> List[Dict[str, Any]]:
+    """Find the `k` heaviest 4-book combinations exceeding `threshold`.
+
+    Pops combinations from iter_heaviest_quadruples until `k` risky ones are
+    found or the next one no longer exceeds the threshold, so the cost does
+    not depend on the total number of risky combinations.
+
+    Parameters:
+    - books_data: List of dictionaries with at least 'id', 'title', 'weight'.
+    - k: Number of combinations wanted.
+    - threshold: Maximum weight threshold in Kg (default 8.0).
+
+    Returns:
+    - Up to `k` dictionaries with 'books', 'total_weight' and 'excess' (as
+      in find_risky_combinations), heaviest first. Fewer are returned when
+      fewer combinations are risky.
+
+    Raises:
+    - ValueError: if k is negative or a weight is not finite.
+
+    Complexity:
+    - Time: O(n log n + K log K). Space: O(n + K).
+    """
+    if k < 0:
+        raise ValueError("k must not be negative")
+    weights = parse_weights(books_data)
+    if any(w is not None and not math.isfinite(w) for w in weights):
+        raise ValueError("top-k search requires finite weights")
+    if k == 0:
+        return []
+
+    lower = threshold - _tolerance([w for w in weights if w is not None], threshold)
+    top: List[Dict[str, Any]] = []
+    for indices, approximate in iter_heaviest_quadruples(weights):
+        if approximate <= lower:
+            break
+        # Reference arithmetic decides the cases close to the threshold
+        a, b, c, d = indices
+        if weights[a] + weights[b] + weights[c] + weights[d] > threshold:
+            top.append(build_combination(books_data, weights, indices, threshold))
+            if len(top) == k:
+                break
+    return top
+
+
+# Values with more decimals than this are counted with float arithmetic
+_MAX_EXACT_DECIMALS = 6
+
+# Exact ties with the threshold are re-checked with float sums up to this many
+_MAX_TIE_CHECKS = 200_000
+
+
+def _valid_weights(books_data: List[Dict[str, Any]]) -> List[float]:
+    """Parsed, finite weights of the books that can take part in a combination."""
+    weights = [w for w in parse_weights(books_data) if w is not None]
+    if not all(math.isfinite(w) for w in weights):
+        raise ValueError("Weights must be finite numbers to count risky combinations")
+    return weights
+
+
+def _decimal_scale(values: List[float]) -> Optional[int]:
+    """Return 10**k so that every value times it is an integer, or None."""
+    decimals = 0
+    for value in values:
+        exponent = Decimal(repr(float(value))).as_tuple().exponent
+        if -exponent > _MAX_EXACT_DECIMALS:
+            return None
+        decimals = max(decimals, -exponent)
+    return 10 ** decimals
+
+
+def _scale(value: float, scale: Optional[int]):
+    """Scale `value` to an exact integer (or keep the float when scale is None)."""
+    if scale is None:
+        return float(value)
+    return int(Decimal(repr(float(value))) * scale)
+
+
+class _PairSumCounter:
+    """Count 4-subsets above a threshold from the sorted pair sums of a weight list."""
+
+    def __init__(self, values: List[Any]):
+        self.values = sorted(values)
+        n = len(self.values)
+        self.n = n
+        self.pair_sums = sorted(
+            self.values[i] + self.values[j] for i in range(n) for j in range(i + 1, n)
+        )
+        self.doubled = [2 * v for v in self.values]
+
+    def count_above(self, t) -> int:
+        """Number of 4-subsets whose sum is strictly greater than `t`."""
+        n = self.n
+        if n < 4:
+            return 0
+        S = self.pair_sums
+        m = len(S)
+
+        # Ordered pairs (p, q) of pairs, p == q included, with S_p + S_q > t
+        ordered = m * m - sum(map(bisect_right, repeat(S, m), map(sub, repeat(t, m), S)))
+        # Drop p == q (2 * S_p > t), then count each unordered {p, q} once
+        self_pairs = sum(1 for s in S if 2 * s > t)
+        distinct = (ordered - self_pairs) // 2
+
+        # Pairs of pairs sharing exactly one book i: ({i, j}, {i, k}) with
+        # 2 w_i + w_j + w_k > t, i.e. pair {j, k} plus a doubled weight
+        # from a book outside {j, k}
+        with_any_book = n * m - sum(map(bisect_right, repeat(self.doubled, m), map(sub, repeat(t, m), S)))
+        # Remove the cases where the doubled book is j or k: 3 w_j + w_k > t
+        values = self.values
+        inside = sum(
+            n - bisect_right(values, t - 3 * v) - (1 if 4 * v > t else 0)
+            for v in values
+        )
+        shared = with_any_book - inside
+
+        return (distinct - shared) // 3
+
+
+def _counter_and_scale(books_data: List[Dict[str, Any]],
+                       extra: List[float]) -> Tuple[_PairSumCounter, Optional[int], List[float], List[Any]]:
+    """Build the pair-sum counter over scaled weights (see module docstring).
+
+    Returns the counter, the scale (None for float arithmetic), and the
+    float and scaled weights in catalog order.
+    """
+    weights = _valid_weights(books_data)
+    scale = _decimal_scale(weights + list(extra))
+    scaled = [_scale(w, scale) for w in weights]
+    return _PairSumCounter(scaled), scale, weights, scaled
+
+
+def _rounded_up_ties(weights: List[float], scaled: List[int], t: int, threshold: float) -> int:
+    """Count the 4-subsets summing exactly to `t` whose float sum exceeds `threshold`.
+
+    The float sum is taken in catalog order, exactly like the brute force.
+    The ties are enumerated by joining pairs whose scaled sums add up to t.
+    """
+    n = len(scaled)
+    pairs_by_sum = defaultdict(list)
+    for i in range(n):
+        for j in range(i + 1, n):
+            pairs_by_sum[scaled[i] + scaled[j]].append((i, j))
+
+    ties = set()
+    for pair_sum, pairs in pairs_by_sum.items():
+        complement = t - pair_sum
+        if complement < pair_sum:
+            continue
+        for p in pairs:
+            for q in pairs_by_sum.get(complement, ()):
+                if complement == pair_sum and q <= p:
+                    continue
+                if p[0] in q or p[1] in q:
+                    continue
+                ties.add(tuple(sorted(p + q)))
+
+    return sum(
+        1 for i, j, k, m in ties
+        if weights[i] + weights[j] + weights[k] + weights[m] > threshold
+    )
+
+
+def _reference_count_above(counter: _PairSumCounter, scale: Optional[int], weights: List[float],
+                           scaled: List[Any], t, threshold: float) -> int:
+    """count_above(t) plus the exact ties the brute force would report."""
+    above = counter.count_above(t)
+    if scale is None:
+        return above
+    ties = counter.count_above(t - 1) - above
+    if 0 < ties <= _MAX_TIE_CHECKS:
+        above += _rounded_up_ties(weights, scaled, t, threshold)
+    return above
+
+
+def count_risky_combinations(books_data: List[Dict[str, Any]], threshold: float = 8.0) -> int:
+    """Count the 4-book combinations whose weight exceeds `threshold`.
+
+    Same question as len(find_risky_combinations(...)) without enumerating
+    the combinations (see module docstring).
+
+    Parameters:
+    - books_data: List of dictionaries with a 'weight' key. Books with an
+      invalid weight are ignored, like in the brute force.
+    - threshold: Weight threshold in Kg (default 8.0).
+
+    Returns:
+    - Number of risky combinations.
+
+    Raises:
+    - ValueError: if a weight is infinite or NaN.
+
+    Complexity:
+    - Time: O(n^2 log n). Space: O(n^2) for the pair sums.
+    """
+    counter, scale, weights, scaled = _counter_and_scale(books_data, [threshold])
+    return _reference_count_above(counter, scale, weights, scaled, _scale(threshold, scale), threshold)
+
+
+def risky_excess_histogram(books_data: List[Dict[str, Any]], threshold: float = 8.0,
+                           bin_width: float = 0.5, max_bins: int = 10,
+                           time_budget: Optional[float] = None,
+                           cancel: Optional[Any] = None) -> Dict[str, Any]:
+    """Histogram of how much the risky 4-book combinations exceed `threshold`.
+
+    Bin k holds the combinations with an excess in (k * bin_width,
+    (k + 1) * bin_width]; the last bin is open-ended. Each bin edge costs one
+    count_above() call on the same pair sums, so the histogram is
+    O(max_bins * n^2 log n) and never materializes a combination.
+
+    The risky total is always computed. When `time_budget` runs out or
+    `cancel` is set, no further bin edge is counted: the combinations left
+    go to an open-ended last bin and 'complete' is False.
+
+    Parameters:
+    - books_data: List of dictionaries with a 'weight' key.
+    - threshold: Weight threshold in Kg (default 8.0).
+    - bin_width: Width of each excess bin in Kg (default 0.5).
+    - max_bins: Maximum number of bins (default 10).
+    - time_budget: Optional time in seconds after which no more bin edges
+      are counted (checked between count_above() passes).
+    - cancel: Optional cancellation token with is_set(), checked like
+      time_budget.
+
+    Returns:
+    - Dictionary with:
+        * 'total_combinations': C(n, 4) over all books
+        * 'risky_count': Number of risky combinations
+        * 'bins': List of {'from': float, 'to': float or None, 'count': int}
+          (empty bins at the end are omitted)
+        * 'complete': False if the budget or the cancellation cut the bins short
+
+    Raises:
+    - ValueError: if bin_width <= 0, max_bins < 1 or a weight is not finite.
+    """
+    if bin_width <= 0:
+        raise ValueError("bin_width must be positive")
+    if max_bins < 1:
+        raise ValueError("max_bins must be at least 1")
+
+    deadline = time.perf_counter() + time_budget if time_budget is not None else None
+    counter, scale, weights, scaled = _counter_and_scale(books_data, [threshold, bin_width])
+    t = _scale(threshold, scale)
+    width = _scale(bin_width, scale)
+
+    n = len(books_data)
+    risky_count = _reference_count_above(counter, scale, weights, scaled, t, threshold)
+    bins = []
+    above = risky_count
+    complete = True
+    k = 0
+    while above > 0:
+        stopped = ((deadline is not None and time.perf_counter() > deadline)
+                   or (cancel is not None and cancel.is_set()))
+        if stopped or k == max_bins - 1:
+            bins.append({'from': round(k * bin_width, 2), 'to': None, 'count': above})
+            complete = not stopped
+            break
+        next_above = counter.count_above(t + (k + 1) * width)
+        bins.append({
+            'from': round(k * bin_width, 2),
+            'to': round((k + 1) * bin_width, 2),
+            'count': above - next_above
+        })
+        above = next_above
+        k += 1
+
+    return {
+        'total_combinations': n * (n - 1) * (n - 2) * (n - 3) // 24 if n >= 4 else 0,
+        'risky_count': risky_count,
+        'bins': bins,
+        'complete': complete
+    }
+
+
+__all__ = [
+    'parse_weights',
+    'iter_risky_quadruples',
+    'risky_index_quadruples',
+    'build_combination',
+    'find_risky_combinations_pruned',
+    'find_risky_combinations_anytime',
+    'iter_heaviest_quadruples',
+    'find_top_risky_combinations',
+    'count_risky_combinations',
+    'risky_excess_histogram',
+]
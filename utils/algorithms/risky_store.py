@@ -0,0 +1,173 @@
+"""Disk-spilled, memory-mapped store of risky 4-book combinations.
+
+With hundreds of books the risky list has millions of entries: far too
+many dicts to keep in memory or rows to hand to a widget. This module
+writes the output of the streaming engine (iter_risky_quadruples, in
+descending-position order) to a compact binary file and reads it back page by page
+through mmap, so only the requested page is ever decoded.
+
+File format (little-endian):
+    Header, 32 bytes:
+        magic       8 bytes  b'RISKY01\\0'
+        count       uint64   number of records
+        threshold   float64  threshold used (Kg)
+        num_books   uint32   length of the weight list the indices refer to
+        complete    uint32   1 if the enumeration finished, 0 if it was
+                             cancelled or stopped at `limit`
+    Records, 24 bytes each:
+        i, j, k, m  4 x uint32  ascending catalog indices
+        total       float64     exact weight sum (reference catalog order)
+
+A million combinations take 24 MB on disk and O(page) memory to browse.
+The file is written under a temporary name and renamed when done, so a
+reader never sees a half-written store.
+
+Example:
+    >>> count = write_risky_store('risky.bin', weights, threshold=8.0)
+    >>> with RiskyResultStore('risky.bin') as store:
+    ...     first_page = store.page(0, 50)
+
+Author: Library Management System Team
+Date: 2025
+"""
+
+import mmap
+import os
+import struct
+from typing import Any, Callable, List, Optional, Tuple
+
+from utils.algorithms.risky_combinations import iter_risky_quadruples
+
+MAGIC = b'RISKY01\0'
+HEADER = struct.Struct('<8sQdII')
+RECORD = struct.Struct('<IIIId')
+
+# Records packed in memory before each write to the file
+WRITE_BATCH = 65536
+
+
+def write_risky_store(path: str, weights: List[Optional[float]], threshold: float = 8.0,
+                      cancel: Optional[Any] = None, progress: Optional[Callable[[float], None]] = None,
+                      limit: Optional[int] = None, trace: Optional[Callable[[dict], None]] = None) -> int:
+    """Enumerate the risky combinations and write them to a store file.
+
+    Parameters:
+    - path: Destination file (replaced atomically when done).
+    - weights: One float per book, or None for invalid weights (see
+      risky_combinations.parse_weights).
+    - threshold: Weight threshold in Kg.
+    - cancel: Optional token with is_set(); the file then holds the
+      combinations found so far and is marked incomplete.
+    - progress: Optional callable receiving the completed fraction (0.0-1.0).
+    - limit: Maximum number of combinations to store (None = all).
+    - trace: Optional step-trace hook forwarded to iter_risky_quadruples.
+
+    Returns:
+    - Number of records written.
+
+    Complexity:
+    - Time: O(n log n + R) for R risky combinations. Memory: O(n + WRITE_BATCH).
+    """
+    partial = path + '.part'
+    count = 0
+    buffer = bytearray()
+    pack = RECORD.pack
+    finished = [False]
+
+    def on_progress(fraction: float) -> None:
+        # The engine reports 1.0 only when the enumeration really ended
+        if fraction >= 1.0:
+            finished[0] = True
+        if progress is not None:
+            progress(fraction)
+
+    try:
+        with open(partial, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, 0, threshold, len(weights), 0))
+            for i, j, k, m in iter_risky_quadruples(weights, threshold, cancel=cancel, progress=on_progress,
+                                                    limit=limit, trace=trace):
+                buffer += pack(i, j, k, m, weights[i] + weights[j] + weights[k] + weights[m])
+                count += 1
+                if count % WRITE_BATCH == 0:
+                    f.write(buffer)
+                    buffer.clear()
+            f.write(buffer)
+
+            f.seek(0)
+            f.write(HEADER.pack(MAGIC, count, threshold, len(weights), 1 if finished[0] else 0))
+        os.replace(partial, path)
+    except BaseException:
+        if os.path.exists(partial):
+            os.remove(partial)
+        raise
+    return count
+
+
+class RiskyResultStore:
+    """Read-only, memory-mapped view of a store file written by write_risky_store.
+
+    Attributes:
+    - count: Number of stored combinations.
+    - threshold: Threshold used to build the store (Kg).
+    - num_books: Length of the weight list the indices refer to.
+    - complete: False if the enumeration was cancelled or limited.
+    """
+
+    def __init__(self, path: str):
+        """Open and map `path`.
+
+        Raises:
+        - ValueError: if the file is not a store or is truncated.
+        """
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"'{path}' is not a risky combination store")
+
+        if len(self._map) < HEADER.size:
+            self.close()
+            raise ValueError(f"'{path}' is not a risky combination store")
+        magic, self.count, self.threshold, self.num_books, complete = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or len(self._map) < HEADER.size + self.count * RECORD.size:
+            self.close()
+            raise ValueError(f"'{path}' is not a risky combination store")
+        self.complete = bool(complete)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def page(self, offset: int, limit: int) -> List[Tuple[int, int, int, int, float]]:
+        """Records offset .. offset + limit - 1 as (i, j, k, m, total_weight) tuples.
+
+        Only this slice of the file is read; an offset past the end gives [].
+        """
+        offset = max(offset, 0)
+        end = min(offset + max(limit, 0), self.count)
+        if offset >= end:
+            return []
+        start = HEADER.size + offset * RECORD.size
+        return list(RECORD.iter_unpack(self._map[start:HEADER.size + end * RECORD.size]))
+
+    def close(self) -> None:
+        """Unmap and close the file (safe to call twice)."""
+        if getattr(self, '_map', None) is not None:
+            self._map.close()
+            self._map = None
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self) -> 'RiskyResultStore':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+__all__ = [
+    'RECORD',
+    'write_risky_store',
+    'RiskyResultStore',
+]
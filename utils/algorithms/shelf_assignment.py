@@ -0,0 +1,207 @@
+"""Multi-Shelf Assignment Optimizer - Multiple Knapsack / Bin Packing.
+
+The knapsack solvers (backtracking, knapsack_dp, ...) fill ONE abstract
+shelf. The library has many shelves, each with its own capacity and books
+already placed on it. This module assigns a set of unplaced books across
+all shelves:
+
+1. Construction heuristic (books in decreasing weight order):
+   - 'first_fit' (FFD): put each book on the first shelf where it fits.
+   - 'best_fit' (BFD): put it on the shelf where it leaves the least room.
+2. Local search (bounded by `max_rounds` and `time_budget`), for every
+   book still unplaced, most valuable first:
+   - insert: place it directly if some shelf now has room,
+   - relocate: move a book placed by this plan to another shelf so the
+     unplaced book fits in the room it leaves,
+   - swap: take a book placed by this plan back off its shelf and refill
+     the room with the most valuable unplaced books that fit, when they
+     are worth more than the book removed.
+   Every accepted move strictly increases the total placed value, so the
+   search always terminates.
+
+Constraints:
+    Books already on a shelf (`loads`) are never moved; only the books of
+    the plan are. A book fits on a shelf when load + weight <= capacity,
+    the same check ShelfService.add_book applies.
+
+Complexity:
+    O(n log n + n * S) for the heuristic with S shelves; each local-search
+    round is O(u * p * S + p * u log u) for u unplaced and p planned books,
+    and both the number of rounds and the wall-clock time are capped.
+
+Author: Library Management System Team
+Date: 2025
+"""
+
+import time
+from typing import Any, Dict, List, Optional
+
+# Construction heuristics accepted by assign_books_to_shelves
+HEURISTICS = ('first_fit', 'best_fit')
+
+# Default local-search bounds
+DEFAULT_MAX_ROUNDS = 5
+DEFAULT_TIME_BUDGET = 1.0
+
+
+def _fits(load: float, weight: float, capacity: float) -> bool:
+    """Capacity rule shared with ShelfService.add_book."""
+    return load + weight <= capacity
+
+
+def assign_books_to_shelves(weights: List[float], values: List[float], capacities: List[float],
+                            loads: Optional[List[float]] = None, heuristic: str = 'best_fit',
+                            max_rounds: int = DEFAULT_MAX_ROUNDS,
+                            time_budget: float = DEFAULT_TIME_BUDGET) -> Dict[str, Any]:
+    """Assign books to shelves maximizing the total value placed.
+
+    Parameters:
+    - weights: Weight (Kg) of each book to place.
+    - values: Value (COP) of each book (parallel to weights).
+    - capacities: Capacity (Kg) of each shelf.
+    - loads: Weight already on each shelf (default: empty shelves).
+    - heuristic: 'best_fit' (BFD, default) or 'first_fit' (FFD).
+    - max_rounds: Maximum local-search rounds (0 = heuristic only).
+    - time_budget: Maximum local-search time in seconds.
+
+    Returns:
+    - Dictionary with:
+        * 'assignment': Shelf position of each book, or -1 if unplaced
+        * 'loads': Final weight on each shelf
+        * 'value': Total value placed by the plan
+        * 'heuristic_value': Value placed by the construction heuristic
+        * 'improvements': Number of local-search moves accepted
+
+    Raises:
+    - ValueError: for an unknown heuristic or mismatched input lengths.
+    """
+    if heuristic not in HEURISTICS:
+        raise ValueError(f"Unknown heuristic '{heuristic}'. Available: {', '.join(HEURISTICS)}")
+    if len(weights) != len(values):
+        raise ValueError("weights and values must have the same length")
+    loads = list(loads) if loads is not None else [0.0] * len(capacities)
+    if len(loads) != len(capacities):
+        raise ValueError("loads and capacities must have the same length")
+
+    num_shelves = len(capacities)
+    assignment = [-1] * len(weights)
+
+    def best_shelf(weight: float) -> int:
+        """Shelf for `weight` according to the heuristic, or -1."""
+        chosen, chosen_room = -1, None
+        for s in range(num_shelves):
+            if _fits(loads[s], weight, capacities[s]):
+                if heuristic == 'first_fit':
+                    return s
+                room = capacities[s] - loads[s] - weight
+                if chosen_room is None or room < chosen_room:
+                    chosen, chosen_room = s, room
+        return chosen
+
+    def place(book: int, shelf: int) -> None:
+        assignment[book] = shelf
+        loads[shelf] += weights[book]
+
+    def unplace(book: int) -> None:
+        loads[assignment[book]] -= weights[book]
+        assignment[book] = -1
+
+    # --- 1. Construction heuristic: decreasing weight (FFD / BFD) ---
+    for book in sorted(range(len(weights)), key=lambda i: (-weights[i], -values[i], i)):
+        shelf = best_shelf(weights[book])
+        if shelf >= 0:
+            place(book, shelf)
+
+    heuristic_value = sum(values[i] for i, s in enumerate(assignment) if s >= 0)
+
+    # --- 2. Bounded local search ---
+    improvements = 0
+    deadline = time.perf_counter() + time_budget
+
+    def unplaced_by_value() -> List[int]:
+        return sorted((i for i, s in enumerate(assignment) if s < 0 and values[i] > 0),
+                      key=lambda i: (-values[i], weights[i], i))
+
+    for _ in range(max_rounds):
+        improved = False
+
+        for book in unplaced_by_value():
+            if time.perf_counter() > deadline:
+                break
+            w = weights[book]
+
+            # Insert: some shelf may have room after earlier moves
+            shelf = best_shelf(w)
+            if shelf >= 0:
+                place(book, shelf)
+                improvements += 1
+                improved = True
+                continue
+
+            # Relocate: move a planned book elsewhere to open room (pure gain).
+            # Needs room_home + w_other >= w and room_target >= w_other, so
+            # impossible unless some shelf has at least w / 2 free.
+            relocated = False
+            if 2 * max((capacities[s] - loads[s] for s in range(num_shelves)), default=0.0) < w:
+                continue
+            for other in (i for i, s in enumerate(assignment) if s >= 0):
+                home = assignment[other]
+                if not _fits(loads[home] - weights[other], w, capacities[home]):
+                    continue
+                for target in range(num_shelves):
+                    if target != home and _fits(loads[target], weights[other], capacities[target]):
+                        unplace(other)
+                        place(other, target)
+                        place(book, home)
+                        relocated = True
+                        break
+                if relocated:
+                    break
+            if relocated:
+                improvements += 1
+                improved = True
+
+        # Swap: take a planned book off and refill its room with unplaced books
+        pool = unplaced_by_value()
+        lightest = min((weights[i] for i in pool), default=0.0)
+        for other in sorted((i for i, s in enumerate(assignment) if s >= 0),
+                            key=lambda i: (values[i], -weights[i], i)):
+            if time.perf_counter() > deadline:
+                break
+            home = assignment[other]
+            if home < 0:
+                continue
+            load = loads[home] - weights[other]
+            refill, gain = [], -values[other]
+            for book in pool:
+                if not _fits(load, lightest, capacities[home]):
+                    break
+                if assignment[book] < 0 and _fits(load, weights[book], capacities[home]):
+                    load += weights[book]
+                    refill.append(book)
+                    gain += values[book]
+            if refill and gain > 0:
+                unplace(other)
+                for book in refill:
+                    place(book, home)
+                improvements += 1
+                improved = True
+
+        if not improved or time.perf_counter() > deadline:
+            break
+
+    return {
+        'assignment': assignment,
+        'loads': loads,
+        'value': sum(values[i] for i, s in enumerate(assignment) if s >= 0),
+        'heuristic_value': heuristic_value,
+        'improvements': improvements
+    }
+
+
+__all__ = [
+    'HEURISTICS',
+    'DEFAULT_MAX_ROUNDS',
+    'DEFAULT_TIME_BUDGET',
+    'assign_books_to_shelves',
+]
@@ -0,0 +1,193 @@
+"""sort_strategies.py
+
+Pluggable sort-strategy engine for the Library Management System.
+
+The teaching algorithms in ``AlgoritmosOrdenamiento`` (insertion sort for
+ISBN ordering, merge sort for price ordering) are kept, but production code
+paths no longer have to hard-code them. Every strategy registered here has
+the same contract: it receives a list of precomputed keys and returns the
+stable ascending permutation (list of positions). Keys are computed once per
+element, so no strategy calls getters or converts strings while comparing.
+
+Registered strategies:
+- ``insertion``: AlgoritmosOrdenamiento.insertion_sort_indices (teaching)
+- ``merge``: AlgoritmosOrdenamiento.merge_sort_indices (teaching)
+- ``merge_bottom_up``: AlgoritmosOrdenamiento.merge_sort_bottom_up_indices,
+  iterative Merge Sort with one preallocated scratch buffer
+- ``parallel_merge``: parallel_sort.parallel_merge_sort_indices, chunks
+  sorted in a ProcessPoolExecutor and k-way merged
+- ``timsort``: CPython ``list.sort`` over the precomputed keys
+- ``radix``: AlgoritmosOrdenamiento.radix_sort_indices, LSD radix sort for
+  non-negative integer keys (13-digit numeric ISBNs, integer COP prices)
+
+Auto-selection (``strategy='auto'``):
+- already sorted input (checked in O(n)) is returned as-is,
+- very small inputs (``INSERTION_MAX_SIZE``) use insertion sort,
+- everything else uses Timsort, which is adaptive to presorted runs.
+
+Radix sort is never picked automatically: measured on CPython 3.13, a
+pure-Python LSD radix sort over 13-digit ISBNs took 2.7 s for 10^6 keys
+against 1.0 s for Timsort (and 0.23 s vs 0.06 s for 10^5). It stays
+available by name.
+
+Example:
+    >>> from utils.algorithms.sort_strategies import sort_by_keys
+    >>> books_sorted, prices_sorted = sort_by_keys(books, [b.get_price() for b in books])
+
+Author: Library Management System
+Date: 2025-12-02
+"""
+
+from itertools import islice
+from operator import le
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from utils.algorithms.AlgoritmosOrdenamiento import (
+    insertion_sort_indices,
+    merge_sort_bottom_up_indices,
+    merge_sort_indices,
+    radix_sort_indices,
+)
+from utils.algorithms.parallel_sort import parallel_merge_sort_indices
+
+# A strategy maps a list of keys to the stable ascending permutation
+SortStrategy = Callable[[List[Any]], List[int]]
+
+# Inputs up to this size use insertion sort when auto-selecting
+INSERTION_MAX_SIZE = 8
+
+_STRATEGIES: Dict[str, SortStrategy] = {}
+
+
+def register_strategy(name: str, strategy: SortStrategy) -> None:
+    """Register (or replace) a sort strategy under `name`.
+
+    Parameters:
+    - name: Strategy name used by callers (e.g. 'timsort').
+    - strategy: Callable receiving the key list and returning the stable
+      ascending permutation of its positions.
+    """
+    _STRATEGIES[name] = strategy
+
+
+def get_strategy(name: str) -> SortStrategy:
+    """Return the strategy registered under `name`.
+
+    Raises:
+    - ValueError: if no strategy with that name exists.
+    """
+    try:
+        return _STRATEGIES[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown sort strategy '{name}'. Available: {', '.join(available_strategies())}"
+        )
+
+
+def available_strategies() -> List[str]:
+    """Return the names of all registered strategies (plus 'auto')."""
+    return ['auto'] + list(_STRATEGIES)
+
+
+def choose_strategy(keys: List[Any]) -> str:
+    """Pick a strategy name for `keys` based on size and whether they are already sorted.
+
+    Returns:
+    - 'none' when the keys are already sorted (no work needed),
+    - 'insertion' for inputs of at most INSERTION_MAX_SIZE keys,
+    - 'timsort' otherwise.
+    """
+    if all(map(le, keys, islice(keys, 1, None))):
+        return 'none'
+    if len(keys) <= INSERTION_MAX_SIZE:
+        return 'insertion'
+    return 'timsort'
+
+
+def sort_permutation(keys: List[Any], strategy: str = 'auto') -> List[int]:
+    """Return the stable ascending permutation of `keys` using `strategy`.
+
+    Parameters:
+    - keys: Precomputed keys (not modified).
+    - strategy: A registered strategy name or 'auto'.
+
+    Raises:
+    - ValueError: for unknown strategies or keys the strategy cannot handle.
+    """
+    if strategy == 'auto':
+        strategy = choose_strategy(keys)
+        if strategy == 'none':
+            return list(range(len(keys)))
+    return get_strategy(strategy)(keys)
+
+
+def sort_by_keys(items: List[Any], keys: List[Any], strategy: str = 'auto') -> Tuple[List[Any], List[Any]]:
+    """Sort `items` by their parallel precomputed `keys`.
+
+    Parameters:
+    - items: Elements to sort (not modified).
+    - keys: One key per element, same length as `items`.
+    - strategy: A registered strategy name or 'auto'.
+
+    Returns:
+    - (sorted_items, sorted_keys) as new lists. The sort is stable.
+
+    Raises:
+    - ValueError: if the lists differ in length or the strategy is invalid.
+    """
+    if len(items) != len(keys):
+        raise ValueError("items and keys must have the same length")
+    order = sort_permutation(keys, strategy)
+    return [items[i] for i in order], [keys[i] for i in order]
+
+
+def _timsort_indices(keys: List[Any]) -> List[int]:
+    """Timsort via list.sort over positions keyed by the precomputed keys."""
+    order = list(range(len(keys)))
+    order.sort(key=keys.__getitem__)
+    return order
+
+
+def _integer_keys(keys: List[Any]) -> Optional[List[int]]:
+    """Project keys to plain integers for radix sort, or None if impossible.
+
+    Accepts integer keys directly and canonical numeric ISBN keys
+    (``(0, n, str(n))`` from clave_isbn, i.e. without leading zeros or
+    spaces) whose integer order equals their key order.
+    """
+    projected = []
+    for key in keys:
+        if isinstance(key, int) and not isinstance(key, bool):
+            projected.append(key)
+        elif isinstance(key, tuple) and len(key) == 3 and key[0] == 0 and key[2] == str(key[1]):
+            projected.append(key[1])
+        else:
+            return None
+    return projected
+
+
+def _radix_indices(keys: List[Any]) -> List[int]:
+    """LSD radix sort for integer prices or numeric canonical ISBN keys."""
+    integer_keys = _integer_keys(keys)
+    if integer_keys is None:
+        raise ValueError("radix strategy requires integer keys or numeric ISBN keys")
+    return radix_sort_indices(integer_keys)
+
+
+register_strategy('insertion', insertion_sort_indices)
+register_strategy('merge', merge_sort_indices)
+register_strategy('merge_bottom_up', merge_sort_bottom_up_indices)
+register_strategy('parallel_merge', parallel_merge_sort_indices)
+register_strategy('timsort', _timsort_indices)
+register_strategy('radix', _radix_indices)
+
+
+__all__ = [
+    'INSERTION_MAX_SIZE',
+    'register_strategy',
+    'get_strategy',
+    'available_strategies',
+    'choose_strategy',
+    'sort_permutation',
+    'sort_by_keys',
+]
@@ -0,0 +1,130 @@
+"""Bounded-Memory Step Tracing for the Algorithm Engines.
+
+The engines in this package accept an optional `trace` hook: a callable
+that receives one dict per step. Recording every event of a large run
+(millions of explored nodes) would use unbounded memory, so TraceRecorder
+keeps only:
+
+- a ring buffer of the last `last` events (what the search did just now),
+- a uniform reservoir sample of `sample` events over the whole run
+  (Algorithm R: after t events each one is kept with probability
+  sample / t), for a picture of the entire exploration,
+- aggregate counters per event kind.
+
+Memory is O(last + sample) no matter how long the run is.
+
+Event kinds (the 'event' key; events without it count as 'node'):
+    'node'  - a search node / combination was visited
+    'prune' - a subtree was cut without visiting it (optional 'skipped':
+              number of leaves it contained, summed into the 'skipped' counter)
+    'best'  - the incumbent (best solution so far) improved
+
+Zero overhead when disabled:
+    Engines only build event dicts under `if trace is not None`, so a run
+    without a recorder does no tracing work at all.
+
+Example:
+    >>> recorder = TraceRecorder(last=100, sample=100, seed=1)
+    >>> solve_optimal_shelf_branch_and_bound(books, 8.0, trace=recorder)
+    >>> recorder.summary()['nodes'], recorder.recent()[-1]
+
+Author: Library Management System Team
+Date: 2025
+"""
+
+import random
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+# Default sizes of the ring buffer and the reservoir sample
+DEFAULT_LAST_EVENTS = 200
+DEFAULT_SAMPLE_SIZE = 200
+
+
+class TraceRecorder:
+    """Trace hook keeping the last N events, a reservoir sample and counters.
+
+    Pass an instance as the `trace` argument of an engine; it is called once
+    per event. Each recorded event gets a 'seq' key with its position in the
+    run (0-based).
+    """
+
+    def __init__(self, last: int = DEFAULT_LAST_EVENTS, sample: int = DEFAULT_SAMPLE_SIZE,
+                 seed: Optional[int] = None):
+        """Create an empty recorder.
+
+        Parameters:
+        - last: Size of the ring buffer of most recent events (0 = none).
+        - sample: Size of the uniform reservoir sample (0 = none).
+        - seed: Random seed for a reproducible sample.
+
+        Raises:
+        - ValueError: if a size is negative.
+        """
+        if last < 0 or sample < 0:
+            raise ValueError("last and sample must not be negative")
+        self.sample_size = sample
+        self._recent = deque(maxlen=last)
+        self._reservoir: List[Dict[str, Any]] = []
+        self._rng = random.Random(seed)
+        self.counters: Dict[str, int] = {}
+        self.total = 0
+
+    def __call__(self, event: Dict[str, Any]) -> None:
+        """Record one event (the engine's trace hook)."""
+        seq = self.total
+        self.total += 1
+        event['seq'] = seq
+
+        kind = event.get('event', 'node')
+        self.counters[kind] = self.counters.get(kind, 0) + 1
+        skipped = event.get('skipped')
+        if skipped:
+            self.counters['skipped'] = self.counters.get('skipped', 0) + skipped
+
+        self._recent.append(event)
+
+        # Algorithm R: keep event number seq with probability sample / (seq + 1)
+        if seq < self.sample_size:
+            self._reservoir.append(event)
+        elif self.sample_size:
+            slot = self._rng.randrange(seq + 1)
+            if slot < self.sample_size:
+                self._reservoir[slot] = event
+
+    def recent(self) -> List[Dict[str, Any]]:
+        """The last recorded events, oldest first."""
+        return list(self._recent)
+
+    def sample(self) -> List[Dict[str, Any]]:
+        """The reservoir sample, in run order."""
+        return sorted(self._reservoir, key=lambda event: event['seq'])
+
+    def summary(self) -> Dict[str, int]:
+        """Aggregate counters of the run.
+
+        Returns:
+        - dict with 'events' (all events), 'nodes', 'pruned', 'best_updates'
+          and 'skipped' (leaves inside pruned subtrees, when reported)
+        """
+        return {
+            'events': self.total,
+            'nodes': self.counters.get('node', 0),
+            'pruned': self.counters.get('prune', 0),
+            'best_updates': self.counters.get('best', 0),
+            'skipped': self.counters.get('skipped', 0)
+        }
+
+    def reset(self) -> None:
+        """Forget every event and counter (sizes and random state are kept)."""
+        self._recent.clear()
+        self._reservoir = []
+        self.counters = {}
+        self.total = 0
+
+
+__all__ = [
+    'DEFAULT_LAST_EVENTS',
+    'DEFAULT_SAMPLE_SIZE',
+    'TraceRecorder',
+]
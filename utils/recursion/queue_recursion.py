@@ -25,18 +25,22 @@ Usage example:
 >>> avg_weight_by_author(books, "Alice")
 1.0
 
-Note: Python does not perform tail call optimization; this is an educational
-implementation demonstrating the accumulator pattern.
+Note: Python does not perform tail call optimization, so the tail call is
+eliminated by hand (the accumulators are rebound inside a loop). The result
+is the same as the recursive definition and large catalogs are supported.
 """
 
 
-def avg_weight_by_author(books, author, index=0, count=0, total_weight=0.0, debug=False):
+def avg_weight_by_author(books, author, index=0, count=0, total_weight=0.0, debug=False, trace=None):
 	"""Compute the average weight of books by `author` using tail recursion.
 
 	This function uses accumulator parameters (index, count, total_weight) to
-	maintain state across recursive calls. Each call processes one book and
-	passes updated accumulators to the next call, demonstrating the queue-style
-	(tail) recursion pattern.
+	maintain state across recursive calls. Each step processes one book and
+	passes updated accumulators to the next one, demonstrating the queue-style
+	(tail) recursion pattern. Since the recursive call is in tail position it
+	is executed as a loop (manual tail-call elimination): the accumulators are
+	rebound instead of pushing a new frame, so the result is identical but the
+	stack depth is O(1).
 
 	Parameters
 	----------
@@ -47,7 +51,7 @@ def avg_weight_by_author(books, author, index=0, count=0, total_weight=0.0, debu
 	author : str
 		The author name to filter by (case-sensitive exact match).
 	index : int, optional
-		Internal recursion index (default: 0). Not intended for external callers.
+		Position where processing starts (default: 0).
 	count : int, optional
 		Accumulator for the number of books by the author found so far (default: 0).
 	total_weight : float, optional
@@ -55,6 +59,11 @@ def avg_weight_by_author(books, author, index=0, count=0, total_weight=0.0, debu
 	debug : bool, optional
 		If True, prints the recursion index and accumulator state at each
 		recursive call to demonstrate tail recursion flow.
+	trace : callable, optional
+		Step-trace hook called once per simulated tail call with a dict
+		``{'depth', 'index', 'count', 'total_weight', 'included'}`` holding the
+		accumulators passed to the next call (``included`` is None on the base
+		case).
 
 	Returns
 	-------
@@ -64,29 +73,40 @@ def avg_weight_by_author(books, author, index=0, count=0, total_weight=0.0, debu
 
 	Complexity
 	----------
-	O(n) time and O(n) call-stack depth where n is len(books).
-	(Note: Python does not optimize tail calls, so stack depth is still O(n))
+	O(n) time and O(1) extra space where n is len(books).
 	"""
+	start = index
+	n = len(books)
+
+	while index < n:
+		# Get current book
+		book = books[index]
+		book_author = book.get('author', '')
+		book_weight = book.get('weight', 0.0)
+
+		# Tail step: update accumulators if author matches
+		included = book_author == author
+		if included:
+			if debug:
+				print(f"Include index={index}: weight={book_weight} -> count={count + 1}, total={total_weight + book_weight}")
+			count, total_weight = count + 1, total_weight + book_weight
+		else:
+			if debug:
+				print(f"Skip index={index}: author={book_author}")
+
+		if trace is not None:
+			trace({'depth': index - start, 'index': index, 'count': count,
+				   'total_weight': total_weight, 'included': included})
+
+		index += 1
+
 	# Base case: we've processed all books
-	if index >= len(books):
-		if debug:
-			print(f"Base case reached: count={count}, total_weight={total_weight}")
-		return (total_weight / count) if count > 0 else 0.0
-
-	# Get current book
-	book = books[index]
-	book_author = book.get('author', '')
-	book_weight = book.get('weight', 0.0)
-
-	# Recursive step: update accumulators if author matches
-	if book_author == author:
-		if debug:
-			print(f"Include index={index}: weight={book_weight} -> count={count + 1}, total={total_weight + book_weight}")
-		return avg_weight_by_author(books, author, index + 1, count + 1, total_weight + book_weight, debug)
-	else:
-		if debug:
-			print(f"Skip index={index}: author={book_author}")
-		return avg_weight_by_author(books, author, index + 1, count, total_weight, debug)
+	if debug:
+		print(f"Base case reached: count={count}, total_weight={total_weight}")
+	if trace is not None:
+		trace({'depth': max(index - start, 0), 'index': index, 'count': count,
+			   'total_weight': total_weight, 'included': None})
+	return (total_weight / count) if count > 0 else 0.0
 
 
 def _demo():
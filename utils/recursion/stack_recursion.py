@@ -4,7 +4,8 @@ Stack-style recursion examples for the course assignment.
 This module implements a recursive (stack-style) function that computes the
 total monetary value of all books by a given author. The recursion mimics the
 classical factorial example where each call processes one element and pushes
-the rest of the work onto the call stack.
+the rest of the work onto the call stack. The call stack is simulated with a
+loop so that large catalogs never raise RecursionError.
 
 Contract (inputs/outputs):
 - inputs: books (list of dict), author (str), index (int, internal)
@@ -28,42 +29,63 @@ Usage example (demonstrated in the module demo):
 This file contains simple asserts as a minimal test harness.
 """
 
-def total_value_by_author(books, author, index=0):
+def total_value_by_author(books, author, index=0, trace=None):
     """Return the total value of books by `author` using stack recursion.
 
-    This function processes one book per call and delegates the remainder to
-    a recursive call with an incremented index. It uses the call stack to
-    accumulate the sum (like a classic factorial recursion shape).
+    The function follows the stack-recursion definition
+
+        total(i) = contribution(i) + total(i + 1),   total(n) = 0
+
+    but evaluates it with an explicit loop instead of Python calls. The
+    "unwinding" phase walks the list from the end towards `index`, so the
+    additions happen in exactly the same order as in the recursive version
+    (identical results, including float rounding) while the stack depth stays
+    constant. Catalogs of any size are supported.
 
     Parameters
     - books: list of dict-like objects. Each book should have at least the
       keys 'author' (str) and 'price' (int/float). If a book lacks 'price',
       it contributes 0 to the total.
     - author: string with the author name to match (case-sensitive).
-    - index: internal recursion index (start at 0). Not intended for external
-      callers.
+    - index: first position to take into account (default 0).
+    - trace: optional step-trace hook. It receives one dict per simulated
+      call ``{'phase': 'call', 'depth', 'index'}`` and, after the base case,
+      one per simulated return ``{'phase': 'return', 'depth', 'index',
+      'contribution', 'total'}`` so the UI can show the stack growing and
+      unwinding.
 
     Returns
     - total value (int or float)
     
     """
 
+    n = len(books)
+
+    # Descending phase: only needed to report the pushed "calls"
+    if trace is not None:
+        for i in range(index, n + 1):
+            trace({'phase': 'call', 'depth': i - index, 'index': i})
+
     # Base case: we've processed all books
-    if index >= len(books):
-        return 0
+    total = 0
+
+    # Unwinding phase: add each contribution to the total of the rest
+    for i in range(n - 1, index - 1, -1):
+        book = books[i]
+
+        # Determine contribution of current book
+        contribution = 0
+        if book.get('author', '') == author:
+            # Get price value (always numeric in our system)
+            contribution = book.get('price', 0)
 
-    # Get current book
-    book = books[index]
-    book_author = book.get('author', '')
+        total = contribution + total
 
-    # Determine contribution of current book
-    contribution = 0
-    if book_author == author:
-        # Get price value (always numeric in our system)
-        contribution = book.get('price', 0)
+        if trace is not None:
+            trace({'phase': 'return', 'depth': i - index, 'index': i,
+                   'contribution': contribution, 'total': total})
 
-    # Recursive step: add current contribution to total of the rest
-    return contribution + total_value_by_author(books, author, index + 1)
+    return total
 
 
 def _demo():
@@ -9,6 +9,8 @@ book lists:
 - ``verificar_ordenamiento``: validate that a list is sorted by price
 - ``ordenar_y_generar_reporte``: convenience function that sorts and
     generates a report in a single call
+- ``generar_reporte_externo``: external-sort variant that streams the
+    books from disk runs straight into the JSON report file
 
 Pure sorting algorithms (e.g. merge sort) live in
 ``utils.algorithms.AlgoritmosOrdenamiento``.
@@ -17,13 +19,43 @@ Author: Library Management System
 Date: 2025-12-02
 """
 
-from typing import List, Dict, Any
+import json
+import os
+from itertools import chain
+from typing import List, Dict, Any, Iterable, Optional
+from utils.algorithms.external_sort import DEFAULT_FAN_IN, DEFAULT_RUN_SIZE, external_sort
 from utils.logger import LibraryLogger
 
 # Configurar logger
 logger = LibraryLogger.get_logger(__name__)
 
 
+def _libro_a_dict(libro: Any) -> Dict[str, Any]:
+    """Serialize one Book into its report entry (see generar_reporte_global)."""
+    try:
+        # Extract information from each book using its getters.
+        # IMPORTANT: Use English field names to remain consistent with
+        # books.json, inventory_general.json and the Book model.
+        return {
+            'id': libro.get_id(),
+            'ISBNCode': libro.get_ISBNCode(),
+            'title': libro.get_title(),
+            'author': libro.get_author(),
+            'weight': libro.get_weight(),
+            'price': libro.get_price(),
+            'isBorrowed': libro.get_isBorrowed(),
+        }
+    except AttributeError as e:
+        # If a book is missing a getter, log the error and continue.
+        logger.error(f"Error processing book for report: {e}")
+        # Return an entry with partial information so the report remains
+        # usable even when some items could not be fully serialized.
+        return {
+            'error': f'Missing attributes on book: {str(e)}',
+            'book': str(libro)
+        }
+
+
 def generar_reporte_global(lista_ordenada: List[Any]) -> List[Dict[str, Any]]:
     """Create a serializable global report from a list of books sorted by price.
 
@@ -78,31 +110,7 @@ def generar_reporte_global(lista_ordenada: List[Any]) -> List[Dict[str, Any]]:
     logger.info(f"Generating global report for {len(lista_ordenada)} books sorted by price")
     
     for libro in lista_ordenada:
-        try:
-            # Extract information from each book using its getters.
-            # IMPORTANT: Use English field names to remain consistent with
-            # books.json, inventory_general.json and the Book model.
-            libro_dict = {
-                'id': libro.get_id(),
-                'ISBNCode': libro.get_ISBNCode(),
-                'title': libro.get_title(),
-                'author': libro.get_author(),
-                'weight': libro.get_weight(),
-                'price': libro.get_price(),
-                'isBorrowed': libro.get_isBorrowed(),
-            }
-            
-            reporte.append(libro_dict)
-            
-        except AttributeError as e:
-            # If a book is missing a getter, log the error and continue.
-            logger.error(f"Error processing book for report: {e}")
-            # Append an entry with partial information so the report remains
-            # usable even when some items could not be fully serialized.
-            reporte.append({
-                'error': f'Missing attributes on book: {str(e)}',
-                'book': str(libro)
-            })
+        reporte.append(_libro_a_dict(libro))
     
     logger.info(f"Global report successfully generated with {len(reporte)} entries")
     
@@ -144,7 +152,7 @@ def verificar_ordenamiento(lista: List[Any]) -> bool:
     return True
 
 
-def ordenar_y_generar_reporte(inventario_general: List[Any]) -> Dict[str, Any]:
+def ordenar_y_generar_reporte(inventario_general: List[Any], estrategia: Optional[str] = None) -> Dict[str, Any]:
     """Convenience function: sort the inventory and produce a report.
 
     Purpose
@@ -157,6 +165,11 @@ def ordenar_y_generar_reporte(inventario_general: List[Any]) -> Dict[str, Any]:
     ----------
     inventario_general : List[Any]
         Unsorted list of Book objects (the general inventory).
+    estrategia : Optional[str]
+        Name of a strategy from ``utils.algorithms.sort_strategies`` (e.g.
+        ``'auto'``, ``'timsort'``, ``'radix'``). Prices are extracted once and
+        the books are sorted by that key array (stable). When None (default)
+        the teaching ``merge_sort_books_by_price()`` is used.
 
     Returns
     -------
@@ -186,8 +199,13 @@ def ordenar_y_generar_reporte(inventario_general: List[Any]) -> Dict[str, Any]:
     
     logger.info(f"Starting sort of {len(inventario_general)} books by price")
     
-    # Step 1: Sort using Merge Sort
-    libros_ordenados = merge_sort_books_by_price(inventario_general)
+    # Step 1: Sort by price (teaching Merge Sort or a registered strategy)
+    if estrategia is None:
+        libros_ordenados = merge_sort_books_by_price(inventario_general)
+    else:
+        from utils.algorithms.sort_strategies import sort_by_keys
+        precios = [libro.get_price() for libro in inventario_general]
+        libros_ordenados, _ = sort_by_keys(inventario_general, precios, estrategia)
     
     # Step 2: Generate serializable report
     reporte = generar_reporte_global(libros_ordenados)
@@ -219,8 +237,142 @@ def ordenar_y_generar_reporte(inventario_general: List[Any]) -> Dict[str, Any]:
     }
 
 
+def generar_reporte_externo(
+    libros: Iterable[Any],
+    ruta_destino: str,
+    tamano_run: int = DEFAULT_RUN_SIZE,
+    fan_in: int = DEFAULT_FAN_IN,
+    directorio_temporal: Optional[str] = None,
+    estrategia: str = 'auto',
+) -> Dict[str, Any]:
+    """Sort books by price with an external merge sort and stream the report.
+
+    Purpose
+    -------
+    Memory-bounded counterpart of ``ordenar_y_generar_reporte()`` for
+    inventories with millions of copies. Books are consumed from any
+    iterable (e.g. a generator over the inventory groups), so the flat list
+    of copies, the sorted list and the list of report dicts are never built.
+
+    Pipeline
+    --------
+    1. Stream: each book is serialized once (same entry format as
+       ``generar_reporte_global()``) and its price is read once. Count, sum,
+       minimum and maximum price are accumulated in this same pass.
+    2. Runs: at most ``tamano_run`` entries are sorted in memory at a time
+       and spilled to temporary files (see ``external_sort``).
+    3. Merge: runs are k-way merged with ``heapq.merge`` and every entry is
+       written directly into ``ruta_destino``.
+
+    The file has the same layout and formatting as the in-memory report
+    (``json.dump(..., indent=2, ensure_ascii=False)``) with the keys
+    ``total_books``, ``total_price``, ``average_price``, ``min_price``,
+    ``max_price`` and ``books``. It is written to a temporary sibling file
+    first and moved into place at the end, so a failure never leaves a
+    truncated report behind.
+
+    Parameters
+    ----------
+    libros : Iterable[Any]
+        Book objects in any order (consumed once).
+    ruta_destino : str
+        Path of the JSON report file.
+    tamano_run : int
+        Maximum number of books sorted in memory per run.
+    fan_in : int
+        Maximum number of runs merged at once.
+    directorio_temporal : Optional[str]
+        Parent directory for run files (system temp dir when None).
+    estrategia : str
+        In-memory sort strategy for each run (see ``sort_strategies``).
+
+    Returns
+    -------
+    Dict[str, Any]
+        Statistics with the keys of ``ordenar_y_generar_reporte()``
+        (``total_libros``, ``precio_total``, ``precio_promedio``,
+        ``precio_minimo``, ``precio_maximo``) plus ``ruta_reporte``. The
+        sorted books are NOT returned; they are in the file.
+
+    Complexity
+    ----------
+    - Time: O(n log n) comparisons plus two sequential passes over disk
+      (one more per extra merge level when runs exceed ``fan_in``).
+    - Memory: O(tamano_run + fan_in) book entries.
+    """
+    estadisticas = {'total_libros': 0, 'precio_total': 0, 'precio_minimo': 0, 'precio_maximo': 0}
+
+    def entradas():
+        # Single pass over the input: serialize and accumulate statistics
+        for libro in libros:
+            precio = libro.get_price()
+            if estadisticas['total_libros'] == 0:
+                estadisticas['precio_minimo'] = precio
+                estadisticas['precio_maximo'] = precio
+            elif precio < estadisticas['precio_minimo']:
+                estadisticas['precio_minimo'] = precio
+            elif precio > estadisticas['precio_maximo']:
+                estadisticas['precio_maximo'] = precio
+            estadisticas['total_libros'] += 1
+            estadisticas['precio_total'] += precio
+            yield [precio, _libro_a_dict(libro)]
+
+    logger.info(f"Starting external sort by price (run size: {tamano_run})")
+
+    ordenados = external_sort(
+        entradas(), key=lambda entrada: entrada[0], run_size=tamano_run,
+        fan_in=fan_in, tmp_dir=directorio_temporal, strategy=estrategia,
+    )
+    ruta_temporal = ruta_destino + '.tmp'
+    try:
+        # Pulling the first entry finishes run generation, so the statistics
+        # are final before the header is written
+        primero = next(ordenados, None)
+        total_libros = estadisticas['total_libros']
+        precio_promedio = estadisticas['precio_total'] / total_libros if total_libros else 0.0
+
+        encabezado = {
+            'total_books': total_libros,
+            'total_price': estadisticas['precio_total'],
+            'average_price': precio_promedio,
+            'min_price': estadisticas['precio_minimo'],
+            'max_price': estadisticas['precio_maximo'],
+        }
+        with open(ruta_temporal, 'w', encoding='utf-8') as f:
+            f.write('{\n')
+            for campo, valor in encabezado.items():
+                f.write(f'  {json.dumps(campo)}: {json.dumps(valor)},\n')
+            if primero is None:
+                f.write('  "books": []\n}')
+            else:
+                f.write('  "books": [\n')
+                separador = ''
+                for _, entrada in chain([primero], ordenados):
+                    texto = json.dumps(entrada, indent=2, ensure_ascii=False)
+                    f.write(separador + '    ' + texto.replace('\n', '\n    '))
+                    separador = ',\n'
+                f.write('\n  ]\n}')
+        os.replace(ruta_temporal, ruta_destino)
+    finally:
+        ordenados.close()
+        if os.path.exists(ruta_temporal):
+            os.remove(ruta_temporal)
+
+    logger.info(f"External sort completed: {total_libros} books, total price: ${estadisticas['precio_total']:,}")
+
+    return {
+        'total_libros': total_libros,
+        'precio_total': estadisticas['precio_total'],
+        'precio_promedio': precio_promedio,
+        'precio_minimo': estadisticas['precio_minimo'],
+        'precio_maximo': estadisticas['precio_maximo'],
+        'ruta_reporte': ruta_destino,
+    }
+
+
 __all__ = [
     'generar_reporte_global',
     'verificar_ordenamiento',
     'ordenar_y_generar_reporte',
+    'generar_reporte_externo',
 ]
@@ -0,0 +1,46 @@
+from collections import OrderedDict
+
+
+class LRUCache:
+    """Bounded key -> value cache that evicts the least recently used entry.
+
+    Backed by an OrderedDict kept in usage order (most recent last), so
+    get() and put() are O(1).
+    """
+
+    def __init__(self, maxsize=32):
+        """Initializes an empty cache holding at most `maxsize` entries."""
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.items = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, default=None):
+        """Returns the value stored for `key` (marking it as recently used), or default."""
+        if key not in self.items:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self.items.move_to_end(key)
+        return self.items[key]
+
+    def put(self, key, value):
+        """Stores `value` under `key`, evicting the least recently used entry if full."""
+        self.items[key] = value
+        self.items.move_to_end(key)
+        if len(self.items) > self.maxsize:
+            self.items.popitem(last=False)
+
+    def clear(self):
+        """Removes every entry (hit/miss counters are kept)."""
+        self.items.clear()
+
+    def __contains__(self, key):
+        """Checks whether `key` is cached (does not change the usage order)."""
+        return key in self.items
+
+    def size(self):
+        """Returns the number of cached entries."""
+        return len(self.items)